@@ -0,0 +1,546 @@
+import pathlib
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable
+from xml.etree import ElementTree
+
+import numpy as np
+import xarray as xr
+
+from xarray_sentinel import esa_safe, indexes, sentinel1
+
+DATA_FOLDER = pathlib.Path(__file__).parent / "data"
+
+SLC_IW_ANNOTATIONS = sorted(
+    (DATA_FOLDER).glob("S1*_IW_SLC__*.SAFE/annotation/s1*.xml"),
+)
+SLC_IW = (
+    DATA_FOLDER
+    / "S1B_IW_SLC__1SDV_20210401T052622_20210401T052650_026269_032297_EFA4.SAFE"
+)
+GRD_IW = (
+    DATA_FOLDER
+    / "S1B_IW_GRDH_1SDV_20210401T052623_20210401T052648_026269_032297_ECC8.SAFE"
+)
+SLC_IW_VH_NOISE = next(
+    (SLC_IW / "annotation" / "calibration").glob("noise-s1b-iw1-slc-vh-*.xml")
+)
+SLC_IW_CALIBRATIONS = sorted(
+    (DATA_FOLDER).glob("S1*_IW_SLC__*.SAFE/annotation/calibration/calibration-*.xml"),
+)
+
+
+def best_of(function: Callable[[], Any], repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        esa_safe.clear_xml_cache()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_benchmark_parse_tags() -> None:
+    queries = [
+        "//productInformation",
+        "//imageInformation",
+        "//swathTiming",
+        "//geolocationGridPoint",
+        "//qualityInformation",
+        "//generalAnnotation",
+        "//imageAnnotation",
+        "//swathMerging",
+    ]
+    schema = esa_safe.cached_sentinel1_schemas("annotation")
+
+    def decode_per_query() -> None:
+        for annotation in SLC_IW_ANNOTATIONS:
+            for query in queries:
+                xml_tree = ElementTree.parse(annotation)
+                schema.decode(xml_tree, query, validation="skip")
+
+    def decode_single_pass() -> None:
+        for annotation in SLC_IW_ANNOTATIONS:
+            esa_safe.parse_tags(annotation, queries)
+
+    per_query = best_of(decode_per_query)
+    single_pass = best_of(decode_single_pass)
+
+    print(
+        f"\n{len(SLC_IW_ANNOTATIONS)} IW SLC annotations x {len(queries)} queries:"
+        f" per query {per_query:.3f}s, single pass {single_pass:.3f}s,"
+        f" speedup {per_query / single_pass:.1f}x"
+    )
+    assert single_pass < per_query
+
+
+def test_benchmark_import_time() -> None:
+    modules = [
+        "xarray_sentinel",
+        "xarray_sentinel.esa_safe",
+        "xarray_sentinel.xarray_backends",
+        "xarray_sentinel.sentinel1",
+    ]
+    for module in modules:
+        timings = []
+        for _ in range(3):
+            code = (
+                "import time; start = time.perf_counter(); "
+                f"import {module}; print(time.perf_counter() - start)"
+            )
+            res = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, check=True, text=True
+            )
+            timings.append(float(res.stdout))
+
+        print(f"import {module}: {min(timings):.3f}s")
+
+
+def make_synthetic_gcp_annotation(
+    annotation_path: pathlib.Path, output_path: pathlib.Path, size: int = 100
+) -> None:
+    xml_tree = ElementTree.parse(annotation_path)
+    grid = xml_tree.getroot().find(".//geolocationGridPointList")
+    assert grid is not None
+    grid.clear()
+    grid.attrib["count"] = str(size * size)
+    start = np.datetime64("2021-04-01T05:26:24.209736", "us")
+    for j in range(size):
+        for i in range(size):
+            point = ElementTree.SubElement(grid, "geolocationGridPoint")
+            values = {
+                "azimuthTime": str(start + np.timedelta64(j * 100_000, "us")),
+                "slantRangeTime": str(5.3e-3 + i * 1e-6),
+                "line": str(j * 150),
+                "pixel": str(i * 200),
+                "latitude": str(47.0 + j * 0.01),
+                "longitude": str(12.4 + i * 0.01),
+                "height": "0.0",
+                "incidenceAngle": str(30.0 + i * 0.1),
+                "elevationAngle": str(27.0 + i * 0.1),
+            }
+            for name, text in values.items():
+                ElementTree.SubElement(point, name).text = text
+    xml_tree.write(output_path)
+
+
+def test_benchmark_open_gcp_dataset(tmp_path: pathlib.Path) -> None:
+    annotation = tmp_path / "annotation.xml"
+    make_synthetic_gcp_annotation(SLC_IW_ANNOTATIONS[0], annotation)
+    ggp = esa_safe.parse_vector_tag(annotation, "//geolocationGridPoint")
+    variables = ["latitude", "longitude", "height", "incidenceAngle", "elevationAngle"]
+
+    def open_with_list_index() -> None:
+        # the previous grid assembly, quadratic in the grid size
+        ggp = esa_safe.parse_vector_tag(annotation, "//geolocationGridPoint")
+        line = sorted(set(ggp["line"].tolist()))
+        pixel = sorted(set(ggp["pixel"].tolist()))
+        grids = {var: np.full((len(line), len(pixel)), np.nan) for var in variables}
+        for k, (ggp_line, ggp_pixel) in enumerate(
+            zip(ggp["line"].tolist(), ggp["pixel"].tolist())
+        ):
+            for var in variables:
+                grids[var][line.index(ggp_line), pixel.index(ggp_pixel)] = ggp[var][k]
+
+    def open_gcp_dataset() -> None:
+        sentinel1.open_gcp_dataset(annotation)
+
+    # the decoded tags stay cached, only the grid assembly is timed
+    list_index = min(timeit.repeat(open_with_list_index, number=1, repeat=3))
+    unique_inverse = min(timeit.repeat(open_gcp_dataset, number=1, repeat=3))
+
+    print(
+        f"\n{ggp['line'].size} points GCP grid: list index {list_index:.3f}s,"
+        f" unique inverse {unique_inverse:.3f}s,"
+        f" speedup {list_index / unique_inverse:.1f}x"
+    )
+    assert unique_inverse < list_index
+
+
+def peak_memory(function: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_benchmark_parse_vectors() -> None:
+    texts = {}
+    for calibration in SLC_IW_CALIBRATIONS:
+        root = ElementTree.parse(calibration).getroot()
+        for field in ["pixel", "sigmaNought", "betaNought", "gamma", "dn"]:
+            texts[(calibration, field)] = [e.text or "" for e in root.iter(field)]
+
+    def parse_per_vector() -> None:
+        for (_, field), field_texts in texts.items():
+            rows = [
+                np.fromstring(text, dtype="float32", sep=" ") for text in field_texts
+            ]
+            # xarray copies the list of rows into a new array
+            np.array(rows)
+
+    def parse_preallocated() -> None:
+        for field_texts in texts.values():
+            esa_safe.parse_vectors(field_texts, "float32")
+
+    per_vector = best_of(parse_per_vector)
+    preallocated = best_of(parse_preallocated)
+    per_vector_peak = peak_memory(parse_per_vector)
+    preallocated_peak = peak_memory(parse_preallocated)
+
+    print(
+        f"\n{len(SLC_IW_CALIBRATIONS)} calibration files: per vector {per_vector:.4f}s"
+        f" peak {per_vector_peak / 1e3:.0f}kB, preallocated {preallocated:.4f}s"
+        f" peak {preallocated_peak / 1e3:.0f}kB"
+    )
+    assert preallocated_peak < per_vector_peak
+
+
+def test_benchmark_interpolate_lut() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+    cal_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH/calibration")
+    lut = cal_ds.betaNought.load()
+    measurement = swath_ds.measurement.isel(line=slice(0, 4000)).chunk(
+        {"line": 1000, "pixel": 8192}
+    )
+
+    def full_resolution_interp() -> None:
+        calibration = lut.interp(line=measurement.line, pixel=measurement.pixel)
+        calibration.astype(np.float32).chunk(measurement.chunksizes).sum().compute()
+
+    def blockwise_interp() -> None:
+        sentinel1.interpolate_lut(lut, measurement).sum().compute()
+
+    full_resolution = min(timeit.repeat(full_resolution_interp, number=1, repeat=3))
+    blockwise = min(timeit.repeat(blockwise_interp, number=1, repeat=3))
+    full_resolution_peak = peak_memory(full_resolution_interp)
+    blockwise_peak = peak_memory(blockwise_interp)
+
+    print(
+        f"\nLUT on {measurement.size / 1e6:.0f}M pixels: full resolution"
+        f" {full_resolution:.2f}s peak {full_resolution_peak / 1e6:.0f}MB,"
+        f" blockwise {blockwise:.2f}s peak {blockwise_peak / 1e6:.0f}MB"
+    )
+    assert blockwise_peak < full_resolution_peak
+
+
+def test_benchmark_interpolate_gcp() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+    gcp_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH/gcp")
+    gcp = gcp_ds.swap_dims(azimuth_time="line", slant_range_time="pixel")
+    gcp = gcp.drop_vars(["azimuth_time", "slant_range_time"])
+    measurement = swath_ds.measurement.isel(line=slice(0, 3000)).chunk(
+        {"line": 1000, "pixel": 8192}
+    )
+
+    def full_resolution_interp() -> None:
+        geolocation = gcp.interp(line=measurement.line, pixel=measurement.pixel)
+        geolocation.chunk(measurement.chunksizes).sum().compute()
+
+    def blockwise_interp() -> None:
+        sentinel1.interpolate_gcp(gcp_ds, measurement).sum().compute()
+
+    full_resolution = min(timeit.repeat(full_resolution_interp, number=1, repeat=3))
+    blockwise = min(timeit.repeat(blockwise_interp, number=1, repeat=3))
+    full_resolution_peak = peak_memory(full_resolution_interp)
+    blockwise_peak = peak_memory(blockwise_interp)
+
+    print(
+        f"\ngeolocation grid on {measurement.size / 1e6:.0f}M pixels: full resolution"
+        f" {full_resolution:.2f}s peak {full_resolution_peak / 1e6:.0f}MB,"
+        f" blockwise {blockwise:.2f}s peak {blockwise_peak / 1e6:.0f}MB"
+    )
+    assert blockwise_peak < full_resolution_peak
+
+
+def test_benchmark_calibrate_intensity_db() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+    cal_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH/calibration")
+    lut = cal_ds.sigmaNought.load()
+    measurement = swath_ds.measurement.isel(line=slice(0, 4000))
+    measurement = measurement.chunk({"line": 1000, "pixel": 8192}).persist()
+
+    def separate_operations() -> None:
+        # the previous implementation, one temporary per operation
+        amplitude = sentinel1.calibrate_amplitude(measurement, lut)
+        intensity = 10.0 * np.log10(abs(amplitude) ** 2)
+        np.maximum(intensity, -40.0).sum().compute()
+
+    def fused_kernel() -> None:
+        intensity = sentinel1.calibrate_intensity(measurement, lut, as_db=True)
+        intensity.sum().compute()
+
+    separate = min(timeit.repeat(separate_operations, number=1, repeat=3))
+    fused = min(timeit.repeat(fused_kernel, number=1, repeat=3))
+    separate_peak = peak_memory(separate_operations)
+    fused_peak = peak_memory(fused_kernel)
+
+    print(
+        f"\nsigma0 dB on {measurement.size / 1e6:.0f}M pixels: separate operations"
+        f" {separate:.2f}s peak {separate_peak / 1e6:.0f}MB,"
+        f" fused {fused:.2f}s peak {fused_peak / 1e6:.0f}MB"
+    )
+    assert fused < separate
+
+
+def test_benchmark_calibrate_intensity_denoised() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+    cal_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH/calibration")
+    noise_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH/noise_range")
+    blocks = sentinel1.open_noise_azimuth_blocks_dataset(SLC_IW_VH_NOISE)
+    lut = cal_ds.sigmaNought.load()
+    noise_range_lut = noise_ds.noiseRangeLut.load()
+    measurement = swath_ds.measurement.isel(line=slice(0, 4000))
+    measurement = measurement.chunk({"line": 1000, "pixel": 8192}).persist()
+
+    def calibrated() -> None:
+        intensity = sentinel1.calibrate_intensity(measurement, lut, as_db=True)
+        intensity.sum().compute()
+
+    def denoised() -> None:
+        intensity = sentinel1.calibrate_intensity(
+            measurement,
+            lut,
+            as_db=True,
+            noise_range_lut=noise_range_lut,
+            noise_azimuth=blocks,
+        )
+        intensity.sum().compute()
+
+    calibrated_time = min(timeit.repeat(calibrated, number=1, repeat=3))
+    denoised_time = min(timeit.repeat(denoised, number=1, repeat=3))
+    calibrated_peak = peak_memory(calibrated)
+    denoised_peak = peak_memory(denoised)
+
+    print(
+        f"\nsigma0 dB on {measurement.size / 1e6:.0f}M pixels: calibrated"
+        f" {calibrated_time:.2f}s peak {calibrated_peak / 1e6:.0f}MB,"
+        f" denoised {denoised_time:.2f}s peak {denoised_peak / 1e6:.0f}MB"
+    )
+    assert denoised_peak < 1.1 * calibrated_peak
+
+
+def test_benchmark_open_sentinel1_bursts() -> None:
+    def per_group() -> None:
+        for burst_index in range(9):
+            sentinel1.open_sentinel1_dataset(SLC_IW, group=f"IW1/VH/{burst_index}")
+
+    def at_once() -> None:
+        sentinel1.open_sentinel1_bursts(SLC_IW, group="IW1/VH")
+
+    per_group_time = best_of(per_group)
+    at_once_time = best_of(at_once)
+
+    print(
+        f"\n9 bursts of IW1/VH: per group {per_group_time:.2f}s,"
+        f" at once {at_once_time:.2f}s"
+    )
+    assert at_once_time < per_group_time
+
+
+def test_benchmark_auto_rasterio_chunks() -> None:
+    def mosaic(rasterio_chunks: Any) -> Callable[[], None]:
+        def function() -> None:
+            swath_ds = sentinel1.open_sentinel1_dataset(
+                SLC_IW, group="IW1/VH", rasterio_chunks=rasterio_chunks
+            )
+            sentinel1.mosaic_slc_iw(swath_ds.measurement).real.sum().compute()
+
+        return function
+
+    strip_time = best_of(mosaic(None), repeat=1)
+    auto_time = best_of(mosaic("auto"), repeat=1)
+
+    print(f"\nIW1/VH mosaic: strip chunks {strip_time:.2f}s, auto {auto_time:.2f}s")
+    assert auto_time < strip_time
+
+
+def test_benchmark_swath_index_sel() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+    lazy_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH", lazy_coords=True)
+    azimuth_time = swath_ds.azimuth_time.values
+    lines_per_burst = swath_ds.attrs["lines_per_burst"]
+    grid = np.linspace(
+        azimuth_time.min().astype(np.int64),
+        azimuth_time.max().astype(np.int64),
+        1_000_000,
+    ).astype("datetime64[ns]")
+
+    def deburst() -> None:
+        sentinel1.deburst_line_index(azimuth_time, lines_per_burst, grid)
+
+    index = lazy_ds.xindexes["azimuth_time"]
+    assert isinstance(index, indexes.SwathIndex)
+
+    def sel() -> None:
+        index.sel({"azimuth_time": grid}, method="nearest")
+
+    deburst_time = min(timeit.repeat(deburst, number=1, repeat=3))
+    sel_time = min(timeit.repeat(sel, number=1, repeat=3))
+
+    print(
+        f"\nnearest line of 1M azimuth times: deburst_line_index {deburst_time:.3f}s,"
+        f" SwathIndex sel {sel_time:.3f}s"
+    )
+    res = index.sel({"azimuth_time": grid}, method="nearest").dim_indexers["line"]
+    expected = sentinel1.deburst_line_index(azimuth_time, lines_per_burst, grid)
+    assert np.array_equal(res, expected)
+
+
+def test_benchmark_find_bursts_indexes() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+    anx_times = sentinel1.burst_anx_times(swath_ds) / np.timedelta64(1, "s")
+    azimuth_anx_seconds = np.linspace(anx_times[0] - 1, anx_times[-1] + 1, 500)
+
+    def find_one_by_one() -> None:
+        for seconds in azimuth_anx_seconds:
+            sentinel1.find_bursts_index(swath_ds, seconds)
+
+    def find_batched() -> None:
+        sentinel1.find_bursts_indexes(swath_ds, azimuth_anx_seconds)
+
+    one_by_one_time = min(timeit.repeat(find_one_by_one, number=1, repeat=3))
+    batched_time = min(timeit.repeat(find_batched, number=1, repeat=3))
+
+    print(
+        f"\nburst lookup of 500 azimuth anx times: one by one {one_by_one_time:.3f}s,"
+        f" batched {batched_time:.4f}s"
+    )
+    expected = [sentinel1.find_bursts_index(swath_ds, s) for s in azimuth_anx_seconds]
+    res = sentinel1.find_bursts_indexes(swath_ds, azimuth_anx_seconds)
+    assert np.array_equal(res, expected)
+
+
+def test_benchmark_ground_range_to_slant_range_time() -> None:
+    grd_ds = sentinel1.open_sentinel1_dataset(GRD_IW, group="IW/VV")
+    cc_ds = sentinel1.open_sentinel1_dataset(
+        GRD_IW, group="IW/VV/coordinate_conversion"
+    )
+    azimuth_time = grd_ds.azimuth_time[:1000]
+    ground_range = grd_ds.ground_range[:5000]
+
+    def sum_of_powers() -> None:
+        coefficients = cc_ds.grsrCoefficients.interp(azimuth_time=azimuth_time)
+        (coefficients * ground_range**coefficients.degree).sum("degree")
+
+    lut = sentinel1.interp_coordinate_conversion(cc_ds, azimuth_time)
+
+    def horner() -> None:
+        sentinel1.ground_range_to_slant_range_time(azimuth_time, ground_range, lut)
+
+    sum_time = min(timeit.repeat(sum_of_powers, number=1, repeat=3))
+    horner_time = min(timeit.repeat(horner, number=1, repeat=3))
+
+    print(
+        f"\nground range to slant range time of {azimuth_time.size}x{ground_range.size}"
+        f" pixels: sum of powers {sum_time:.3f}s, Horner {horner_time:.3f}s"
+    )
+
+
+def test_benchmark_interpolate_orbit() -> None:
+    orbit_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/orbit")
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    azimuth_time = swath_ds.azimuth_time.values
+    grid = np.linspace(
+        azimuth_time.min().astype(np.int64),
+        azimuth_time.max().astype(np.int64),
+        1_000_000,
+    ).astype("datetime64[ns]")
+    lines = azimuth_time[:1000]
+
+    def interp_per_line() -> None:
+        for line_time in lines:
+            orbit_ds.interp(azimuth_time=line_time, method="cubic")
+
+    def interpolate_orbit() -> None:
+        sentinel1.interpolate_orbit(orbit_ds, xr.DataArray(grid, dims="time"))
+
+    per_line_time = min(timeit.repeat(interp_per_line, number=1, repeat=3))
+    batched_time = min(timeit.repeat(interpolate_orbit, number=1, repeat=3))
+
+    print(
+        f"\norbit interpolation: xr.interp of {lines.size} lines {per_line_time:.3f}s,"
+        f" interpolate_orbit of {grid.size} times {batched_time:.3f}s"
+    )
+
+
+def test_benchmark_backward_geocode() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    orbit_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/orbit")
+    latitude = xr.DataArray(np.linspace(45.7, 47.1, 1000), dims="y")
+    longitude = xr.DataArray(np.linspace(11.0, 12.3, 1000), dims="x")
+    height = xr.DataArray(np.full((1000, 1000), 500.0), dims=("y", "x"))
+
+    def backward_geocode() -> None:
+        sentinel1.backward_geocode(orbit_ds, latitude, longitude, height, swath_ds)
+
+    def backward_geocode_dask() -> None:
+        sentinel1.backward_geocode(
+            orbit_ds,
+            latitude.chunk(250),
+            longitude.chunk(250),
+            height.chunk(250),
+            swath_ds,
+        ).compute()
+
+    eager_time = min(timeit.repeat(backward_geocode, number=1, repeat=3))
+    dask_time = min(timeit.repeat(backward_geocode_dask, number=1, repeat=3))
+
+    print(
+        f"\nbackward geocoding of {height.size} points: numpy {eager_time:.3f}s,"
+        f" dask {dask_time:.3f}s"
+    )
+
+
+def test_benchmark_deramp_bursts() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    orbit_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/orbit")
+    dc_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/dc_estimate")
+    fm_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/azimuth_fm_rate")
+    measurement = swath_ds.measurement.isel(line=slice(0, 3002), pixel=slice(0, 8192))
+    measurement = measurement.compute().chunk({"line": 1501, "pixel": 4096})
+
+    def phase_screen() -> None:
+        # the whole-array implementation, the phase of every pixel is stored
+        burst, burst_time, slant_range_time, kwargs = (
+            sentinel1.tops_ramp_kernel_arguments(measurement, orbit_ds, dc_ds, fm_ds)
+        )
+        index = burst.values[:, None]
+        azimuth_fm_rate = sentinel1.polynomial_kernel(
+            kwargs["azimuth_fm_rate_coefficients"][index],
+            slant_range_time.values,
+            kwargs["azimuth_fm_rate_t0"][index],
+        )
+        doppler_centroid = sentinel1.polynomial_kernel(
+            kwargs["doppler_centroid_coefficients"][index],
+            slant_range_time.values,
+            kwargs["doppler_centroid_t0"][index],
+        )
+        ks = kwargs["steering_doppler_rate"][index]
+        kt = azimuth_fm_rate * ks / (azimuth_fm_rate - ks)
+        reference = (
+            -doppler_centroid / azimuth_fm_rate - kwargs["reference_time"][index]
+        )
+        eta = burst_time.values[:, None] - reference
+        phase = np.pi * kt * eta**2 + 2 * np.pi * doppler_centroid * eta
+        (measurement * np.exp(-1j * phase)).sum().compute()
+
+    def fused_kernel() -> None:
+        sentinel1.deramp_bursts(measurement, orbit_ds, dc_ds, fm_ds).sum().compute()
+
+    screen = min(timeit.repeat(phase_screen, number=1, repeat=3))
+    fused = min(timeit.repeat(fused_kernel, number=1, repeat=3))
+    screen_peak = peak_memory(phase_screen)
+    fused_peak = peak_memory(fused_kernel)
+
+    print(
+        f"\nderamping of {measurement.size / 1e6:.0f}M pixels: phase screen"
+        f" {screen:.2f}s peak {screen_peak / 1e6:.0f}MB,"
+        f" fused {fused:.2f}s peak {fused_peak / 1e6:.0f}MB"
+    )
+    assert fused_peak < screen_peak
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+import xarray_sentinel
+
+
+def imported_modules(statement: str) -> set[str]:
+    code = f"{statement}; import sys; print(' '.join(sys.modules))"
+    res = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return set(res.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "statement,not_expected",
+    [
+        ("import xarray_sentinel", {"rasterio", "pandas", "xarray", "xmlschema"}),
+        ("import xarray_sentinel.esa_safe", {"rasterio", "pandas", "xarray"}),
+        ("import xarray_sentinel.xarray_backends", {"rasterio", "xmlschema"}),
+        ("import xarray_sentinel.sentinel1", {"rasterio"}),
+        ("import xarray_sentinel.__main__", {"pandas", "xarray", "xmlschema"}),
+        ("import xarray_sentinel.verify", {"rasterio", "pandas", "xarray"}),
+    ],
+)
+def test_lazy_imports(statement: str, not_expected: set[str]) -> None:
+    res = imported_modules(statement)
+
+    assert res & not_expected == set()
+
+
+def test_lazy_attributes() -> None:
+    assert "open_sentinel1_dataset" in dir(xarray_sentinel)
+    assert callable(xarray_sentinel.open_sentinel1_dataset)
+
+    with pytest.raises(AttributeError):
+        xarray_sentinel.non_existent
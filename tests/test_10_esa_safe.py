@@ -1,7 +1,12 @@
+import copy
+import os
 import pathlib
+import pickle
+import shutil
 from typing import Any, Dict
 from xml.etree import ElementTree
 
+import numpy as np
 import pytest
 import xmlschema
 
@@ -110,11 +115,168 @@ ANNOTATION_PATH = str(
 )
 
 
-def test_cached_sentinel1_schemas() -> None:
+def test_lru_cache() -> None:
+    cache = esa_safe.LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.get("b", "default") == "default"
+    assert cache.get("a") == 1
+
+    cache.resize(1)
+
+    assert len(cache) == 1
+    assert "a" in cache
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+    cache.resize(0)
+    cache.put("a", 1)
+
+    assert len(cache) == 0
+
+
+def test_get_cache_maxsize(monkeypatch: pytest.MonkeyPatch) -> None:
+    env = esa_safe.XML_TREE_CACHE_MAXSIZE_ENV
+    monkeypatch.delenv(env, raising=False)
+
+    assert esa_safe.get_cache_maxsize(env, 8) == 8
+
+    monkeypatch.setenv(env, "2")
+
+    assert esa_safe.get_cache_maxsize(env, 8) == 2
+
+    for value in ["-1", "many"]:
+        monkeypatch.setenv(env, value)
+        with pytest.raises(ValueError):
+            esa_safe.get_cache_maxsize(env, 8)
+
+
+def test_get_file_identity(tmp_path: pathlib.Path) -> None:
+    xml_path = tmp_path / "annotation.xml"
+    shutil.copy(ANNOTATION_PATH, xml_path)
+
+    res = esa_safe.get_file_identity(xml_path)
+
+    assert res is not None
+    assert res[:3] == ("file", str(xml_path), xml_path.stat().st_size)
+
+    with open(xml_path) as file:
+        assert esa_safe.get_file_identity(file) is None
+
+    xml_path.write_text("<root/>")
+
+    assert esa_safe.get_file_identity(xml_path) != res
+    assert esa_safe.get_file_identity(tmp_path / "non-existent.xml") is None
+
+
+def test_parse_xml(tmp_path: pathlib.Path) -> None:
+    xml_path = tmp_path / "annotation.xml"
+    shutil.copy(ANNOTATION_PATH, xml_path)
+
+    res = esa_safe.parse_xml(xml_path)
+
+    assert esa_safe.parse_xml(str(xml_path)) is res
+
+    xml_path.write_text("<root/>")
+
+    assert esa_safe.parse_xml(xml_path).getroot().tag == "root"
+
+
+def test_get_fs_path() -> None:
+    slc_iw = (
+        DATA_FOLDER
+        / "S1B_IW_SLC__1SDV_20210401T052622_20210401T052650_026269_032297_EFA4.SAFE"
+    )
+    fs, path = esa_safe.get_fs_path(str(slc_iw))
+
+    assert path == str((slc_iw / "manifest.safe").absolute())
+
+    fs, path = esa_safe.get_fs_path(slc_iw, fs)
+
+    assert path == str((slc_iw / "manifest.safe"))
+
+    with pytest.raises(TypeError):
+        esa_safe.get_fs_path("*", fs=fs, storage_options={})
+
+    with pytest.raises(ValueError):
+        esa_safe.get_fs_path("non-existent-path/*")
+
+    with pytest.raises(ValueError):
+        esa_safe.get_fs_path(DATA_FOLDER / "*")
+
+
+def test_cached_sentinel1_schemas(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # the on-disk cache is opt-in
+    monkeypatch.delenv(esa_safe.SCHEMA_CACHE_DIR_ENV, raising=False)
+    esa_safe.cached_sentinel1_schemas.cache_clear()
+
+    assert esa_safe.get_schema_cache_dir() is None
+
     res = esa_safe.cached_sentinel1_schemas("annotation")
 
     assert isinstance(res, xmlschema.XMLSchema)
 
+    monkeypatch.setenv(esa_safe.SCHEMA_CACHE_DIR_ENV, str(tmp_path))
+    esa_safe.cached_sentinel1_schemas.cache_clear()
+    try:
+        res = esa_safe.cached_sentinel1_schemas("noise")
+
+        schema_path = esa_safe.get_schema_cache_path("noise", str(tmp_path))
+        assert isinstance(res, xmlschema.XMLSchema)
+        assert esa_safe.load_compiled_schema(schema_path, "noise") is not None
+        # the cache file of a schema is not valid for another one
+        assert esa_safe.load_compiled_schema(schema_path, "calibration") is None
+
+        esa_safe.cached_sentinel1_schemas.cache_clear()
+        res = esa_safe.cached_sentinel1_schemas("noise")
+
+        assert isinstance(res, xmlschema.XMLSchema)
+
+        # tampered cache files are not unpickled
+        content = bytearray(pathlib.Path(schema_path).read_bytes())
+        content[100] ^= 1
+        with open(schema_path, "wb") as file:
+            file.write(content)
+
+        assert esa_safe.load_compiled_schema(schema_path, "noise") is None
+
+        # corrupted cache files are rebuilt
+        with open(schema_path, "wb") as file:
+            file.write(b"corrupted")
+        esa_safe.cached_sentinel1_schemas.cache_clear()
+        res = esa_safe.cached_sentinel1_schemas("noise")
+
+        assert isinstance(res, xmlschema.XMLSchema)
+        assert esa_safe.load_compiled_schema(schema_path, "noise") is not None
+
+        # cache files writable by other users are not unpickled
+        os.chmod(schema_path, 0o666)
+
+        assert esa_safe.load_compiled_schema(schema_path, "noise") is None
+
+        monkeypatch.setenv(esa_safe.SCHEMA_CACHE_DIR_ENV, "")
+
+        assert esa_safe.get_schema_cache_dir() is None
+    finally:
+        esa_safe.cached_sentinel1_schemas.cache_clear()
+
+
+def test_warm_sentinel1_schemas() -> None:
+    esa_safe.warm_sentinel1_schemas(["calibration"])
+
+    assert esa_safe.cached_sentinel1_schemas.cache_info().currsize >= 1
+
 
 def test_parse_tag() -> None:
     expected = {
@@ -132,6 +294,14 @@ def test_parse_tag() -> None:
     assert isinstance(res, dict)
     assert set(res) == expected
 
+    # cached results are shared and read-only
+    with pytest.raises(TypeError):
+        res.clear()
+
+    assert esa_safe.parse_tag(ANNOTATION_PATH, "//productInformation") == res
+    assert type(copy.deepcopy(res)) is dict
+    assert type(pickle.loads(pickle.dumps(res))) is dict
+
 
 def test_parse_tag_as_list() -> None:
     expected = {
@@ -148,6 +318,9 @@ def test_parse_tag_as_list() -> None:
     assert isinstance(res, list)
     assert set(res[0]) == expected
 
+    with pytest.raises(TypeError):
+        res.append({})
+
     # XPath to a single element
     res = esa_safe.parse_tag_as_list(ANNOTATION_PATH, "//burst[1]")
 
@@ -161,6 +334,124 @@ def test_parse_tag_as_list() -> None:
     assert res == []
 
 
+def test_parse_tags() -> None:
+    queries = [
+        "//productInformation",
+        "//burst",
+        "//burst[1]",
+        "//swathTiming/burstList",
+        "//dummy",
+    ]
+    schema = esa_safe.cached_sentinel1_schemas("annotation")
+    xml_tree = ElementTree.parse(ANNOTATION_PATH)
+
+    res = esa_safe.parse_tags(ANNOTATION_PATH, queries)
+
+    assert list(res) == queries
+    for query in queries:
+        assert res[query] == schema.decode(xml_tree, query, validation="skip")
+
+    with open(ANNOTATION_PATH) as file:
+        res = esa_safe.parse_tags(file, queries)
+
+    assert res["//dummy"] is None
+    assert len(res["//burst"]) == 9
+
+
+def test_parse_vector_tag_caches_xml_tree(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    xml_path = tmp_path / "annotation.xml"
+    shutil.copy(ANNOTATION_PATH, xml_path)
+    parse_calls = []
+    parse = ElementTree.parse
+    iterparse = ElementTree.iterparse
+
+    def counting_parse(*args: Any, **kwargs: Any) -> Any:
+        parse_calls.append("parse")
+        return parse(*args, **kwargs)
+
+    def counting_iterparse(*args: Any, **kwargs: Any) -> Any:
+        parse_calls.append("iterparse")
+        return iterparse(*args, **kwargs)
+
+    monkeypatch.setattr(ElementTree, "parse", counting_parse)
+    monkeypatch.setattr(ElementTree, "iterparse", counting_iterparse)
+
+    vectors = esa_safe.parse_vector_tag(xml_path, "//geolocationGridPoint")
+    res = esa_safe.parse_tag(xml_path, "//productInformation")
+
+    # the tree streamed by the vector query is reused by the plain query
+    assert parse_calls == ["iterparse"]
+    assert vectors["latitude"].shape == (210,)
+    assert res["pass"] == "Descending"
+
+
+def test_parse_vector_tag() -> None:
+    res = esa_safe.parse_vector_tag(ANNOTATION_PATH, "//geolocationGridPoint")
+
+    assert set(res) == set(esa_safe.VECTOR_TAG_FIELDS["//geolocationGridPoint"])
+    assert res["azimuthTime"].dtype == np.dtype("datetime64[ns]")
+    assert res["line"].dtype == np.int64
+    assert res["latitude"].shape == (210,)
+
+    # cached arrays are shared and read-only
+    with pytest.raises(ValueError):
+        res["latitude"][0] = 0.0
+
+    cached = esa_safe.parse_vector_tag(ANNOTATION_PATH, "//geolocationGridPoint")
+
+    assert cached["latitude"] is res["latitude"]
+
+    res = esa_safe.parse_vector_tag(
+        ANNOTATION_PATH, "//antennaPattern/antennaPatternList/antennaPattern"
+    )
+
+    assert res["slantRangeTime"].shape[0] == 10
+    assert res["slantRangeTime"].dtype == np.float32
+
+    # the schema decoder is used for validated and unknown queries
+    expected = esa_safe.parse_vector_tag(ANNOTATION_PATH, "//orbit")
+
+    res = esa_safe.parse_vector_tag(ANNOTATION_PATH, "//orbit", validation="strict")
+
+    assert set(res) == set(expected)
+    for field in expected:
+        np.testing.assert_array_equal(res[field], expected[field])
+
+    res = esa_safe.parse_vector_tag(ANNOTATION_PATH, "//azimuthFmRate")
+
+    assert res["t0"].dtype == np.float64
+    assert len(res["azimuthFmRatePolynomial"][0]) == 3
+
+
+def test_parse_vectors() -> None:
+    res = esa_safe.parse_vectors(["1 2 3", "4 5 6"], "float32")
+
+    assert res.dtype == np.float32
+    np.testing.assert_array_equal(res, [[1, 2, 3], [4, 5, 6]])
+
+    res = esa_safe.parse_vectors([], "int64")
+
+    assert res.shape == (0, 0)
+
+    with pytest.raises(ValueError):
+        esa_safe.parse_vectors(["1 2 3", "4 5"], "float32")
+
+
+def test_parse_ragged_vectors() -> None:
+    values, offsets = esa_safe.parse_ragged_vectors(["1 2 3", "4 5"], "float32")
+
+    assert values.dtype == np.float32
+    np.testing.assert_array_equal(values, [1, 2, 3, 4, 5])
+    np.testing.assert_array_equal(offsets, [0, 3, 5])
+
+    values, offsets = esa_safe.parse_ragged_vectors([], "int64")
+
+    assert values.shape == (0,)
+    np.testing.assert_array_equal(offsets, [0])
+
+
 def test_parse_annotation_filename() -> None:
     res = esa_safe.parse_annotation_filename(
         "s1b-iw1-slc-vv-20210401t052624-20210401t052649-026269-032297-004.xml"
@@ -203,6 +494,53 @@ def test_parse_manifest_sentinel1(product_id: str, expected: Dict[str, Any]) ->
     assert res_attrs == expected
 
 
+def test_parse_manifest_sentinel1_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    product_id = "S1B_IW_GRDH_1SDV_20210401T052623_20210401T052648_026269_032297_ECC8"
+    manifest_path = DATA_FOLDER / (product_id + ".SAFE") / "manifest.safe"
+    esa_safe.clear_manifest_cache()
+    parse_calls = []
+
+    def parse_xml(xml_path: Any) -> Any:
+        parse_calls.append(xml_path)
+        return ElementTree.parse(xml_path)
+
+    monkeypatch.setattr(esa_safe, "parse_xml", parse_xml)
+
+    res_attrs, res_files = esa_safe.parse_manifest_sentinel1(manifest_path)
+
+    # the cached manifest is shared and read-only
+    with pytest.raises(TypeError):
+        res_attrs["mode"] = "modified"
+
+    with open(manifest_path) as file:
+        res = esa_safe.parse_manifest_sentinel1(file)  # file objects are not cached
+
+    assert res[0]["mode"] == "IW"
+    assert len(parse_calls) == 2
+
+    for _ in range(5):
+        res = esa_safe.parse_manifest_sentinel1(str(manifest_path))
+
+    assert res == (SENTINEL1_ATTRIBUTES[product_id], res_files)
+    assert len(parse_calls) == 2
+
+    esa_safe.clear_manifest_cache(manifest_path)
+    esa_safe.parse_manifest_sentinel1(manifest_path)
+
+    assert len(parse_calls) == 3
+
+
+def test_parse_manifest_checksums() -> None:
+    product_id = "S1A_S3_SLC__1SDV_20210401T152855_20210401T152914_037258_04638E_6001"
+    manifest_path = DATA_FOLDER / (product_id + ".SAFE") / "manifest.safe"
+    annotation_href = "./annotation/s1a-s3-slc-vh-20210401t152855-20210401t152914-037258-04638e-001.xml"
+
+    res = esa_safe.parse_manifest_checksums(manifest_path)
+
+    assert len(res) == 11
+    assert res[annotation_href] == (1220578, "d1e65831664e63321ae998ee0bc68c61")
+
+
 def test_make_stac_item() -> None:
     attrs = SENTINEL1_ATTRIBUTES[
         "S1B_IW_GRDH_1SDV_20210401T052623_20210401T052648_026269_032297_ECC8"
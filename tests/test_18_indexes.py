@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from xarray_sentinel import indexes
+
+# three bursts of 4 lines with an overlap of 1.5 lines
+BURST_START = np.array(
+    ["2021-04-01T00:00:00", "2021-04-01T00:00:02.5", "2021-04-01T00:00:05"],
+    dtype="datetime64[ns]",
+)
+STEP = 10**9
+
+
+def make_azimuth_time() -> np.ndarray:
+    offsets = np.arange(4) * np.timedelta64(STEP, "ns")
+    azimuth_time: np.ndarray = (BURST_START[:, None] + offsets).ravel()
+    return azimuth_time
+
+
+def make_dataset() -> xr.Dataset:
+    azimuth_time = indexes.AzimuthTimeTransform.from_bursts(BURST_START, 4, STEP, 12)
+    slant_range_time = indexes.LinspaceTransform(0.005, 0.006, 11, "srt", "pixel")
+    coords = xr.Coordinates.from_xindex(indexes.SwathIndex(azimuth_time))
+    coords.update(xr.Coordinates.from_xindex(indexes.SwathIndex(slant_range_time)))
+    coords.update({"line": np.arange(12), "pixel": np.arange(11)})
+    return xr.Dataset({"data": (("line", "pixel"), np.zeros((12, 11)))}, coords)
+
+
+def test_azimuth_time_transform() -> None:
+    expected = make_azimuth_time()
+    transform = indexes.AzimuthTimeTransform.from_bursts(BURST_START, 4, STEP, 12)
+
+    res = transform.generate_coords()["azimuth_time"]
+
+    np.testing.assert_array_equal(res, expected)
+
+    res = transform.reverse({"azimuth_time": expected})["line"]
+
+    # the times after the middle of an overlap are assigned to the next burst
+    np.testing.assert_allclose(res, [0, 1, 2, 4.5, 2.5, 5, 6, 8.5, 6.5, 9, 10, 11])
+
+    res = transform.lookup(expected)
+
+    np.testing.assert_array_equal(res, np.arange(12))
+
+    res = transform.slice(slice(3, 9))
+
+    assert res.size == 6
+    np.testing.assert_array_equal(res.generate_coords()["azimuth_time"], expected[3:9])
+    np.testing.assert_array_equal(res.lookup(expected[3:9]), np.arange(6))
+    assert res.equals(transform.slice(slice(3, 9)))
+    assert not res.equals(transform)
+
+
+def test_linspace_transform() -> None:
+    expected = np.linspace(0.005, 0.006, 11)
+    transform = indexes.LinspaceTransform(0.005, 0.006, 11, "srt", "pixel")
+
+    res = transform.generate_coords()["srt"]
+
+    np.testing.assert_array_equal(res, expected)
+    np.testing.assert_array_equal(transform.lookup(expected), np.arange(11))
+    assert transform.lookup(np.array([0.00505]))[0] == -1
+
+    res = transform.slice(slice(4, None))
+
+    np.testing.assert_array_equal(res.generate_coords()["srt"], expected[4:])
+
+
+def test_swath_index_sel() -> None:
+    azimuth_time = make_azimuth_time()
+    ds = make_dataset()
+
+    res = ds.sel(azimuth_time=azimuth_time[3])
+
+    assert res.line == 3
+
+    res = ds.sel(azimuth_time="2021-04-01T00:00:01.4", method="nearest")
+
+    assert res.line == 1
+
+    # the time is in the overlap after its middle, that is in the second burst
+    res = ds.sel(azimuth_time="2021-04-01T00:00:03.4", method="nearest")
+
+    assert res.line == 5
+
+    res = ds.sel(azimuth_time=xr.DataArray(azimuth_time[[1, 7]], dims="point"))
+
+    assert res.line.dims == ("point",)
+    np.testing.assert_array_equal(res.line, [1, 7])
+
+    res = ds.sel(azimuth_time=slice("2021-04-01T00:00:01", "2021-04-01T00:00:06"))
+
+    np.testing.assert_array_equal(res.line, np.arange(1, 10))
+    assert isinstance(res.xindexes["azimuth_time"], indexes.SwathIndex)
+    np.testing.assert_array_equal(res.azimuth_time, azimuth_time[1:10])
+
+    res = ds.sel(srt=0.0053, method="nearest")
+
+    assert res.pixel == 3
+
+    with pytest.raises(KeyError):
+        ds.sel(azimuth_time="2021-04-01T00:00:03.4")
+
+    index = ds.xindexes["azimuth_time"]
+    assert isinstance(index, indexes.SwathIndex)
+    labels = {"azimuth_time": "2021-04-01T00:00:03.4"}
+
+    assert index.sel(labels, method="nearest", tolerance="0.1s").dim_indexers == {
+        "line": 5
+    }
+
+    with pytest.raises(KeyError):
+        index.sel(labels, method="nearest", tolerance="50ms")
+
+    with pytest.raises(ValueError):
+        ds.sel(azimuth_time="2021-04-01T00:00:03.4", method="pad")
+
+
+def test_drop_swath_indexes() -> None:
+    ds = make_dataset()
+
+    res = indexes.drop_swath_indexes(ds)
+
+    assert set(res.xindexes) == {"line", "pixel"}
+    np.testing.assert_array_equal(res.azimuth_time, make_azimuth_time())
+
+    res = res.isel(line=slice(0, 4)).swap_dims({"line": "azimuth_time"})
+
+    np.testing.assert_array_equal(res.azimuth_time, make_azimuth_time()[:4])
@@ -1,13 +1,21 @@
+import functools
+import os
 import pathlib
+import pickle
+import shutil
+import warnings
+from typing import Any
 
+import fsspec
 import numpy as np
 import pytest
 import shapely.geometry
 import shapely.wkt
 import xarray as xr
 from stac_validator import stac_validator
+from xarray.core import indexing
 
-from xarray_sentinel import esa_safe, sentinel1
+from xarray_sentinel import esa_safe, indexes, sentinel1
 
 DATA_FOLDER = pathlib.Path(__file__).parent / "data"
 
@@ -102,12 +110,32 @@ def test_open_calibration_dataset() -> None:
     assert set(res.coords) == {"line", "pixel"}
 
 
+def test_open_calibration_dataset_lazy() -> None:
+    fs = fsspec.filesystem("file")
+    expected = sentinel1.open_calibration_dataset(SLC_IW1_VV_calibration)
+
+    res = sentinel1.open_calibration_dataset(
+        str(SLC_IW1_VV_calibration), fs=fs, lazy=True
+    )
+
+    assert isinstance(res.sigmaNought.variable._data, indexing.LazilyIndexedArray)
+    xr.testing.assert_identical(res, expected)
+
+
 def test_open_noise_range_dataset() -> None:
     res = sentinel1.open_noise_range_dataset(SLC_IW1_VV_noise)
 
     assert isinstance(res, xr.Dataset)
     assert set(res.coords) == {"line", "pixel"}
 
+    esa_safe.clear_xml_cache()
+    res = sentinel1.open_noise_range_dataset(SLC_IW1_VV_noise, lazy=True)
+    # the loader is pickled without the decoded arrays
+    res = pickle.loads(pickle.dumps(res))
+
+    assert res.noiseRangeLut.dtype == np.float32
+    assert res.noiseRangeLut[0, :3].values.shape == (3,)
+
 
 def test_open_noise_azimuth_dataset() -> None:
     res = sentinel1.open_noise_azimuth_dataset(SLC_IW1_VV_noise)
@@ -116,6 +144,35 @@ def test_open_noise_azimuth_dataset() -> None:
     assert set(res.coords) == {"line"}
 
 
+def test_open_noise_azimuth_blocks_dataset(tmp_path: pathlib.Path) -> None:
+    res = sentinel1.open_noise_azimuth_blocks_dataset(SLC_IW1_VV_noise)
+
+    assert res.sizes == {"block": 1, "point": 1359}
+    assert res.swath.values.tolist() == ["IW1"]
+    assert res.noiseAzimuthLut.dtype == np.float32
+
+    block = (
+        "<noiseAzimuthVector><swath>{}</swath><firstAzimuthLine>{}</firstAzimuthLine>"
+        "<firstRangeSample>{}</firstRangeSample><lastAzimuthLine>{}</lastAzimuthLine>"
+        "<lastRangeSample>{}</lastRangeSample><line>{}</line>"
+        "<noiseAzimuthLut>{}</noiseAzimuthLut></noiseAzimuthVector>"
+    )
+    noise_path = tmp_path / "noise.xml"
+    noise_path.write_text(
+        "<noise><noiseAzimuthVectorList>"
+        + block.format("IW1", 0, 0, 99, 49, "0 50 99", "1 2 3")
+        + block.format("IW2", 0, 50, 99, 99, "0 99", "4 5")
+        + "</noiseAzimuthVectorList></noise>"
+    )
+
+    res = sentinel1.open_noise_azimuth_blocks_dataset(noise_path)
+
+    assert res.sizes == {"block": 2, "point": 5}
+    assert res.offset.values.tolist() == [0, 3]
+    assert res.firstRangeSample.values.tolist() == [0, 50]
+    assert res.line.values.tolist() == [0, 50, 99, 0, 99]
+
+
 def test_open_coordinate_conversion_dataset() -> None:
     res = sentinel1.open_coordinate_conversion_dataset(GRD_IW_VV_annotation)
 
@@ -184,6 +241,24 @@ def test_get_footprint_linestring() -> None:
     assert shapely.geometry.polygon.orient(polygon, 1) == polygon
 
 
+def test_get_footprint_linestrings() -> None:
+    gcp_ds = sentinel1.open_gcp_dataset(SLC_IW1_VV_annotation)
+    azimuth_time = gcp_ds.azimuth_time.values
+    slant_range_time = gcp_ds.slant_range_time.values
+    azimuth_time_bounds = [azimuth_time[[0, 2]], azimuth_time[[3, -1]]]
+
+    res = sentinel1.get_footprint_linestrings(
+        azimuth_time_bounds, slant_range_time[[0, -1]], gcp_ds
+    )
+
+    assert len(res) == 2
+    for footprint, bounds in zip(res, azimuth_time_bounds):
+        expected = sentinel1.get_footprint_linestring(
+            xr.DataArray(bounds), xr.DataArray(slant_range_time), gcp_ds
+        )
+        assert footprint == expected
+
+
 def test_open_attitude_dataset() -> None:
     res = sentinel1.open_attitude_dataset(SLC_IW1_VV_annotation)
 
@@ -212,6 +287,26 @@ def test_open_azimuth_fm_rate_dataset() -> None:
     assert set(res.coords) == {"degree", "azimuth_time"}
 
 
+def test_auto_rasterio_chunks() -> None:
+    res = sentinel1.auto_rasterio_chunks(
+        (13509, 21632), (1, 21632), 8, lines_per_burst=1501, target_bytes=2**27
+    )
+
+    assert res == {"y": 1501, "x": 21632}
+
+    res = sentinel1.auto_rasterio_chunks(
+        (13509, 21632), (512, 512), 8, lines_per_burst=1501, target_bytes=2**27
+    )
+
+    assert res == {"y": 1501, "x": 10752}
+
+    res = sentinel1.auto_rasterio_chunks(
+        (16685, 25788), (1, 25788), 4, target_bytes=2**27
+    )
+
+    assert res == {"y": 1301, "x": 25788}
+
+
 def test_open_pol_dataset_iw() -> None:
     res = sentinel1.open_pol_dataset(SLC_IW1_VV_measurement, SLC_IW1_VV_annotation)
 
@@ -250,6 +345,32 @@ def test_open_pol_dataset_sm() -> None:
     assert res.azimuth_time[-1] == last_line
 
 
+def test_open_pol_dataset_lazy_coords() -> None:
+    expected = sentinel1.open_pol_dataset(SLC_IW1_VV_measurement, SLC_IW1_VV_annotation)
+
+    res = sentinel1.open_pol_dataset(
+        SLC_IW1_VV_measurement, SLC_IW1_VV_annotation, lazy_coords=True
+    )
+
+    assert isinstance(res.xindexes["azimuth_time"], indexes.SwathIndex)
+    assert isinstance(res.xindexes["slant_range_time"], indexes.SwathIndex)
+    xr.testing.assert_identical(indexes.drop_swath_indexes(res), expected)
+    xr.testing.assert_identical(
+        sentinel1.crop_burst_dataset(res, 3), sentinel1.crop_burst_dataset(expected, 3)
+    )
+
+    expected = sentinel1.open_pol_dataset(SLC_S3_VH_measurement, SLC_S3_VH_annotation)
+
+    res = sentinel1.open_pol_dataset(
+        SLC_S3_VH_measurement, SLC_S3_VH_annotation, lazy_coords=True
+    )
+
+    assert set(res.sizes) == {"slant_range_time", "azimuth_time"}
+    for name in expected.coords:
+        assert res[name].dims == expected[name].dims
+        np.testing.assert_array_equal(res[name], expected[name])
+
+
 def test_find_avalable_groups() -> None:
     _, product_files = esa_safe.parse_manifest_sentinel1(SLC_S3 / "manifest.safe")
     expected_groups = {
@@ -284,6 +405,110 @@ def test_find_avalable_groups() -> None:
     assert res == {}
 
 
+def test_find_avalable_groups_check_files_exist(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _, product_files = esa_safe.parse_manifest_sentinel1(SLC_S3 / "manifest.safe")
+    fs = fsspec.filesystem("file")
+    find_calls = []
+    find = fs.find
+
+    def counting_find(path: str, **kwargs: Any) -> Any:
+        find_calls.append(path)
+        return find(path, **kwargs)
+
+    def exists(path: str, **kwargs: Any) -> bool:
+        raise AssertionError("files must not be checked one by one")
+
+    monkeypatch.setattr(fs, "find", counting_find)
+    monkeypatch.setattr(fs, "exists", exists)
+    existing_product_files = {
+        path: description
+        for path, description in product_files.items()
+        if (SLC_S3 / path).exists()
+    }
+    expected = sentinel1.find_available_groups(
+        existing_product_files, str(SLC_S3), "SLC"
+    )
+
+    for _ in range(3):
+        res = sentinel1.find_available_groups(
+            product_files, str(SLC_S3), "SLC", check_files_exist=True, fs=fs
+        )
+
+    assert res == expected
+    # the product is listed once per call
+    assert len(find_calls) == 3
+
+    missing_files = {
+        "./missing/" + path: description for path, description in product_files.items()
+    }
+    res = sentinel1.find_available_groups(
+        {**missing_files, **product_files},
+        str(SLC_S3),
+        "SLC",
+        check_files_exist=True,
+        fs=fs,
+    )
+
+    assert res == expected
+
+    # the files outside the product directory are checked one by one
+    annotation = next(path for path in product_files if "annotation/s1a" in path)
+    outside_path = os.path.relpath(DATA_FOLDER / "outside.xml", SLC_S3)
+    exists_calls = []
+
+    def counting_exists(path: str, **kwargs: Any) -> bool:
+        exists_calls.append(path)
+        return True
+
+    monkeypatch.setattr(fs, "exists", counting_exists)
+    res = sentinel1.find_available_groups(
+        {
+            outside_path: product_files[annotation],
+            annotation: product_files[annotation],
+        },
+        str(SLC_S3),
+        "SLC",
+        check_files_exist=True,
+        fs=fs,
+    )
+
+    assert len(exists_calls) == 1
+    assert len(res["S3/VH"]) == 2
+
+
+def test_list_product_files(tmp_path: pathlib.Path) -> None:
+    fs = fsspec.filesystem("file")
+    (tmp_path / "manifest.safe").write_text("")
+
+    res = sentinel1.list_product_files(str(tmp_path), fs)
+
+    assert res == frozenset([str(tmp_path / "manifest.safe")])
+
+
+def test_open_product_groups_check_files_exist(tmp_path: pathlib.Path) -> None:
+    product_path = tmp_path / SLC_S3.name
+    shutil.copytree(SLC_S3, product_path)
+    measurement = next((product_path / "measurement").glob("*.tiff"))
+
+    _, _, _, groups = sentinel1.open_product_groups(
+        product_path, check_files_exist=True
+    )
+
+    assert str(measurement) in groups["S3/VH"]
+
+    # a deleted measurement is detected by the next open of the product
+    measurement.unlink()
+
+    _, _, _, groups = sentinel1.open_product_groups(
+        product_path, check_files_exist=True
+    )
+
+    assert str(measurement) not in groups["S3/VH"]
+    assert len(groups["S3/VH"]) == 1
+
+
 def test_open_sentinel1_dataset() -> None:
     expected_groups = {
         "IW1",
@@ -316,6 +541,27 @@ def test_open_sentinel1_dataset() -> None:
         sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/non-existent")
 
 
+def test_open_sentinel1_dataset_manifest_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    esa_safe.clear_manifest_cache()
+    manifest_parse_calls = []
+    parse_xml = esa_safe.parse_xml
+
+    def counting_parse_xml(xml_path: Any) -> Any:
+        if os.path.basename(getattr(xml_path, "path", "")) == "manifest.safe":
+            manifest_parse_calls.append(xml_path)
+        return parse_xml(xml_path)
+
+    monkeypatch.setattr(esa_safe, "parse_xml", counting_parse_xml)
+
+    groups = sentinel1.open_sentinel1_dataset(SLC_IW).attrs["subgroups"]
+    for group in groups[:20]:
+        sentinel1.open_sentinel1_dataset(SLC_IW, group=group)
+
+    assert len(manifest_parse_calls) == 1
+
+
 def test_open_dataset_virtual_groups() -> None:
     res = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/0")
 
@@ -324,6 +570,67 @@ def test_open_dataset_virtual_groups() -> None:
     assert res.attrs["burst_index"] == 0
 
 
+def test_open_sentinel1_bursts() -> None:
+    res = sentinel1.open_sentinel1_bursts(SLC_IW, group="IW1/VH")
+
+    assert list(res) == list(range(9))
+    expected = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH/3")
+    xr.testing.assert_identical(res[3], expected)
+    assert res[3].attrs == expected.attrs
+
+    with pytest.raises(ValueError):
+        sentinel1.open_sentinel1_bursts(SLC_IW, group="IW1/VH/3")
+
+    with pytest.raises(ValueError):
+        sentinel1.open_sentinel1_bursts(SLC_IW, group="IW1/VH/orbit")
+
+
+def test_burst_anx_times() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW_V340, group="IW1/HH")
+    lines_per_burst = swath_ds.attrs["lines_per_burst"]
+    anx_datetime = np.datetime64(swath_ds.attrs["ascending_node_time"], "ns")
+
+    res = sentinel1.burst_anx_times(swath_ds)
+
+    assert res.shape == (swath_ds.attrs["number_of_bursts"],)
+    assert res[0] == swath_ds.azimuth_time.values[0] - anx_datetime
+
+    res = sentinel1.burst_anx_times(swath_ds, use_center=True)
+
+    expected = swath_ds.azimuth_time.values[lines_per_burst // 2] - anx_datetime
+    assert res[0] == expected
+
+
+def test_find_bursts_indexes() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW_V340, group="IW1/HH")
+
+    res = sentinel1.find_bursts_indexes(swath_ds, [0, 2120.3, 2123, 2210])
+
+    np.testing.assert_array_equal(res, [0, 2, 3, 8])
+
+    res = sentinel1.find_bursts_indexes(swath_ds, [[2121.7], [2133.0]], use_center=True)
+
+    np.testing.assert_array_equal(res, [[2], [6]])
+
+    assert sentinel1.find_bursts_index(swath_ds, 2210) == 8
+
+
+def test_find_burst_ids_indexes() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW_V340, group="IW1/HH")
+
+    res = sentinel1.find_burst_ids_indexes(swath_ds, [365923, 365915, 365918])
+
+    np.testing.assert_array_equal(res, [8, 0, 3])
+
+    with pytest.raises(KeyError):
+        sentinel1.find_burst_ids_indexes(swath_ds, [365923, 1])
+
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+
+    with pytest.raises(TypeError):
+        sentinel1.find_burst_ids_indexes(swath_ds, [1])
+
+
 def test_crop_burst_dataset() -> None:
     swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW_V340, group="IW1/HH")
 
@@ -403,18 +710,168 @@ def test_crop_burst_dataset_gcp() -> None:
     assert np.allclose(geospatial_bbox, expected_geospatial_bbox)
 
 
+def test_iter_bursts() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    gcp_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/gcp")
+
+    res = list(sentinel1.iter_bursts(swath_ds))
+
+    assert len(res) == swath_ds.attrs["number_of_bursts"]
+    assert [burst.attrs["burst_index"] for burst in res] == list(range(len(res)))
+    assert res[0].attrs["geospatial_bounds"] == swath_ds.attrs["geospatial_bounds"]
+
+    res = list(sentinel1.iter_bursts(swath_ds, gcp=gcp_ds))
+
+    assert res[0].attrs["geospatial_bounds"] != swath_ds.attrs["geospatial_bounds"]
+    expected = sentinel1.crop_burst_dataset(swath_ds, burst_index=5, gcp=gcp_ds)
+    xr.testing.assert_identical(res[5], expected)
+    assert res[5].attrs == expected.attrs
+
+
 def test_mosaic_slc_iw() -> None:
     ds = sentinel1.open_sentinel1_dataset(SLC_IW_V340, group="IW1/HH")
 
     res = sentinel1.mosaic_slc_iw(ds)
 
     assert isinstance(res, xr.Dataset)
+    assert res.sizes["azimuth_time"] == 9 * (1500 - 2 * 90)
+    assert res.line.values[[0, 1319, 1320]].tolist() == [90, 1409, 1590]
+    assert res.attrs["burst_index"] == 0
 
     res = sentinel1.mosaic_slc_iw(ds.measurement)
 
     assert isinstance(res, xr.DataArray)
 
 
+def test_deburst_line_index() -> None:
+    azimuth_time = np.datetime64("2021-04-01", "ns") + np.array(
+        [0, 1, 2, 3, 2, 3, 4, 5], dtype="timedelta64[s]"
+    )
+    grid_time = np.datetime64("2021-04-01", "ns") + np.arange(-1, 7).astype(
+        "timedelta64[s]"
+    )
+
+    res = sentinel1.deburst_line_index(azimuth_time, 4, grid_time)
+
+    assert res.tolist() == [-1, 0, 1, 2, 5, 6, 7, -1]
+
+
+def test_isel_runs() -> None:
+    da = xr.DataArray(np.arange(10), dims="x").chunk(3)
+
+    res = sentinel1.isel_runs(da, "x", np.array([-1, 2, 3, 4, 7, 8, -1, -1]))
+
+    np.testing.assert_array_equal(res, [np.nan, 2, 3, 4, 7, 8, np.nan, np.nan])
+
+
+def test_merge_slc_iw() -> None:
+    epoch = np.datetime64("2021-04-01T05:26:00", "ns")
+    images = []
+    for group, pixel in [("IW2/VH", slice(None, 2000)), ("IW1/VH", slice(19800, None))]:
+        ds = sentinel1.open_sentinel1_dataset(SLC_IW, group=group)
+        ds = ds.drop_vars("measurement").isel(pixel=pixel)
+        seconds = (ds.azimuth_time - epoch) / np.timedelta64(1, "s")
+        ds["seconds"] = seconds + 0 * ds.slant_range_time
+        ds["range"] = 0 * seconds + ds.slant_range_time
+        images.append(ds.chunk({"line": 1000}))
+    azimuth_time_interval = images[0].attrs["azimuth_time_interval"]
+    range_interval = 1 / images[0].attrs["range_sampling_rate"]
+
+    res = sentinel1.merge_slc_iw(images)
+
+    assert res.sizes == {"azimuth_time": 13588, "slant_range_time": 2101}
+    assert res.chunks is not None
+    assert "lines_per_burst" not in res.attrs
+    seconds = (res.azimuth_time - epoch) / np.timedelta64(1, "s")
+    assert abs(res.seconds - seconds).max() <= azimuth_time_interval / 2 + 1e-6
+    assert abs(res.range - res.slant_range_time).max() <= range_interval / 2
+    # IW2 starts before IW1, so the first lines of the IW1 samples are missing
+    assert res.seconds[0, 0].isnull()
+    assert res.seconds[0, -1].notnull()
+
+    res = sentinel1.merge_slc_iw(
+        [image.range.assign_attrs(image.attrs) for image in images]
+    )
+
+    assert isinstance(res, xr.DataArray)
+    assert res.dims == ("azimuth_time", "slant_range_time")
+
+
+def test_bilinear_interpolate() -> None:
+    lut = np.array([[0.0, 1.0], [2.0, 3.0]], dtype=np.float32)
+    lut_line = np.array([0, 10])
+    lut_pixel = np.array([0, 100])
+
+    res = sentinel1.bilinear_interpolate(
+        np.array([0, 5, 10, 11]), np.array([-1, 0, 50]), lut, lut_line, lut_pixel
+    )
+
+    expected = [
+        [np.nan, 0.0, 0.5],
+        [np.nan, 1.0, 1.5],
+        [np.nan, 2.0, 2.5],
+        [np.nan, np.nan, np.nan],
+    ]
+    assert res.dtype == np.float32
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_interpolate_lut() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+    burst_ds = sentinel1.crop_burst_dataset(swath_ds, burst_index=8)
+    cal_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH/calibration")
+    measurement = burst_ds.measurement.chunk(
+        {"azimuth_time": 500, "slant_range_time": 8000}
+    )
+    expected = cal_ds.betaNought.interp(
+        line=measurement.line, pixel=measurement.pixel
+    ).astype(np.float32)
+
+    res = sentinel1.interpolate_lut(cal_ds.betaNought, measurement)
+
+    assert res.chunks == measurement.chunks
+    assert res.dims == measurement.dims
+    xr.testing.assert_allclose(res, expected)
+
+    res = sentinel1.interpolate_lut(cal_ds.betaNought, measurement.compute())
+
+    assert res.chunks is None
+    xr.testing.assert_allclose(res, expected)
+
+
+def test_interpolate_gcp() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
+    gcp_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH/gcp")
+    measurement = swath_ds.measurement[:3000:10, :8000:10].chunk(
+        {"line": 100, "pixel": 400}
+    )
+    expected = (
+        gcp_ds.swap_dims(azimuth_time="line", slant_range_time="pixel")
+        .drop_vars(["azimuth_time", "slant_range_time"])
+        .interp(line=measurement.line, pixel=measurement.pixel)
+    )
+
+    res = sentinel1.interpolate_gcp(gcp_ds, measurement)
+
+    assert set(res.data_vars) == set(sentinel1.GCP_VARIABLES)
+    assert res.latitude.dtype == np.float64
+    assert res.latitude.chunks == measurement.chunks
+    # float64 resolves the latitude and longitude well below a millimetre
+    xr.testing.assert_allclose(res.latitude, expected.latitude, rtol=0, atol=1e-10)
+    xr.testing.assert_allclose(res.longitude, expected.longitude, rtol=0, atol=1e-10)
+    xr.testing.assert_allclose(res.height, expected.height, rtol=0, atol=1e-6)
+
+    res = sentinel1.interpolate_gcp(
+        gcp_ds, measurement, variables=["incidenceAngle"], dtype=np.float32
+    )
+
+    assert list(res.data_vars) == ["incidenceAngle"]
+    assert res.incidenceAngle.dtype == np.float32
+    xr.testing.assert_allclose(
+        res.incidenceAngle, expected.incidenceAngle.astype(np.float32)
+    )
+
+
 def test_calibrate_amplitude() -> None:
     swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
     burst_ds = sentinel1.crop_burst_dataset(swath_ds, burst_index=8)
@@ -431,6 +888,100 @@ def test_calibrate_amplitude() -> None:
     assert np.issubdtype(res.dtype, np.complex64)
 
 
+def test_intensity_kernel() -> None:
+    digital_number = np.array([[3 + 4j, 0]], dtype=np.complex64)
+
+    res = sentinel1.intensity_kernel(digital_number, 5.0)
+
+    assert res.dtype == np.float32
+    np.testing.assert_array_equal(res, [[1.0, 0.0]])
+
+    calibration = np.array([[0.5, 1.0]], dtype=np.float32)
+    res = sentinel1.intensity_kernel(
+        digital_number, calibration, as_db=True, min_db=-40.0
+    )
+
+    np.testing.assert_allclose(res, [[10 * np.log10(100.0), -40.0]])
+
+    res = sentinel1.intensity_kernel(np.array([[10]], dtype=np.uint16), 1.0, as_db=True)
+
+    np.testing.assert_allclose(res, [[20.0]], rtol=1e-6)
+
+
+def test_apply_noise_azimuth() -> None:
+    noise = np.ones((3, 4), dtype=np.float32)
+    blocks = {
+        "first_azimuth_line": np.array([0, 0]),
+        "first_range_sample": np.array([0, 20]),
+        "last_azimuth_line": np.array([20, 10]),
+        "last_range_sample": np.array([19, 29]),
+        "offset": np.array([0, 2]),
+        "lut_line": np.array([0, 20, 0]),
+        "lut": np.array([1.0, 3.0, 5.0]),
+    }
+
+    sentinel1.apply_noise_azimuth(
+        noise, np.array([0, 10, 20]), np.array([0, 10, 20, 30]), **blocks
+    )
+
+    expected = [[1.0, 1.0, 5.0, 1.0], [2.0, 2.0, 5.0, 1.0], [3.0, 3.0, 1.0, 1.0]]
+    np.testing.assert_array_equal(noise, expected)
+
+
+def test_interpolate_noise() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    noise_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/noise_range")
+    blocks = sentinel1.open_noise_azimuth_blocks_dataset(SLC_IW1_VV_noise)
+    measurement = swath_ds.measurement[3000:3600, 100:2100].chunk(
+        {"line": 256, "pixel": 512}
+    )
+    noise_azimuth = np.interp(
+        measurement.line, blocks.line, blocks.noiseAzimuthLut
+    ).astype(np.float32)
+    expected = (
+        noise_ds.noiseRangeLut.interp(line=measurement.line, pixel=measurement.pixel)
+        * noise_azimuth[:, None]
+    )
+
+    res = sentinel1.interpolate_noise(noise_ds.noiseRangeLut, measurement, blocks)
+
+    assert res.chunks == measurement.chunks
+    assert res.dtype == np.float32
+    xr.testing.assert_allclose(res, expected.astype(np.float32))
+
+
+def test_calibrate_intensity_denoised() -> None:
+    line = np.arange(0, 100, 10)
+    pixel = np.arange(0, 50, 10)
+    rng = np.random.default_rng(0)
+    digital_number = xr.DataArray(
+        rng.normal(0, 10, (line.size, pixel.size)).astype(np.float32),
+        coords={"line": line, "pixel": pixel},
+    ).chunk({"line": 4})
+    lut_coords = {"line": [0, 100], "pixel": [0, 50]}
+    calibration_lut = xr.DataArray([[1.0, 2.0], [3.0, 4.0]], coords=lut_coords)
+    noise_range_lut = xr.DataArray([[10.0, 20.0], [30.0, 40.0]], coords=lut_coords)
+    noise = noise_range_lut.interp(line=line, pixel=pixel)
+    calibration = calibration_lut.interp(line=line, pixel=pixel)
+    expected = np.maximum(digital_number**2 - noise, 0) / calibration**2
+
+    res = sentinel1.calibrate_intensity(
+        digital_number, calibration_lut, noise_range_lut=noise_range_lut
+    )
+
+    assert res.dtype == np.float32
+    assert res.chunks == digital_number.chunks
+    np.testing.assert_allclose(res, expected, rtol=1e-5)
+
+    res = sentinel1.calibrate_intensity(
+        digital_number, calibration_lut * 0 + 2, noise_range_lut=noise_range_lut
+    )
+
+    np.testing.assert_allclose(
+        res, np.maximum(digital_number**2 - noise, 0) / 4, rtol=1e-5
+    )
+
+
 def test_calibrate_intensity() -> None:
     swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VH")
     burst_ds = sentinel1.crop_burst_dataset(swath_ds, burst_index=8)
@@ -460,6 +1011,67 @@ def test_calibrate_intensity() -> None:
     assert np.issubdtype(res.dtype, np.float32)
 
 
+def test_calibrate_intensity_complex_dask() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    measurement = swath_ds.measurement.isel(line=slice(0, 4))
+    cal_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/calibration")
+    noise_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/noise_range")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", np.exceptions.ComplexWarning)
+        for res in [
+            sentinel1.calibrate_intensity(measurement, cal_ds.betaNought),
+            sentinel1.calibrate_intensity(measurement, cal_ds.betaNought * 0 + 2),
+            sentinel1.calibrate_intensity(
+                measurement, cal_ds.betaNought, noise_range_lut=noise_ds.noiseRangeLut
+            ),
+        ]:
+            assert res.dtype == np.float32
+            assert res.isel(pixel=slice(0, 5)).compute().dtype == np.float32
+
+
+def test_polynomial_kernel() -> None:
+    coefficients = np.array([[1.0, 2.0, 3.0], [0.0, -1.0, 0.5]])
+    x = np.linspace(-2, 2, 5)
+
+    res = sentinel1.polynomial_kernel(coefficients[:, None, :], x, origin=1.0, scale=2)
+
+    expected = [2 * np.polynomial.polynomial.polyval(x - 1, c) for c in coefficients]
+    np.testing.assert_allclose(res, expected)
+
+    res = sentinel1.polynomial_kernel(np.array([3.0]), x)
+
+    np.testing.assert_array_equal(res, [3.0] * 5)
+
+    res = sentinel1.polynomial_kernel(np.array([3.0, 2.0]), x, origin=1.0)
+
+    np.testing.assert_allclose(res, 3.0 + 2.0 * (x - 1))
+
+
+def test_interp_coordinate_conversion() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(GRD_IW, group="IW/VV")
+    swath = swath_ds.measurement[:1000, :1000]
+    cc_ds = sentinel1.open_sentinel1_dataset(
+        GRD_IW, group="IW/VV/coordinate_conversion"
+    )
+
+    res = sentinel1.interp_coordinate_conversion(cc_ds, swath.azimuth_time)
+
+    assert res.grsrCoefficients.dims == ("azimuth_time", "degree")
+    assert res.sizes["azimuth_time"] == 1000
+
+    expected = sentinel1.ground_range_to_slant_range_time(
+        swath.azimuth_time, swath.ground_range, cc_ds
+    )
+
+    xr.testing.assert_identical(
+        sentinel1.ground_range_to_slant_range_time(
+            swath.azimuth_time, swath.ground_range, res
+        ),
+        expected,
+    )
+
+
 def test_slant_range_time_to_ground_range() -> None:
     swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
     swath = swath_ds.measurement[:1000, :1000]
@@ -472,6 +1084,13 @@ def test_slant_range_time_to_ground_range() -> None:
     )
 
     assert isinstance(res, xr.DataArray)
+    assert res.dims == ("line", "pixel")
+
+    res = sentinel1.slant_range_time_to_ground_range(
+        swath.azimuth_time, swath.slant_range_time.chunk(500), cc_ds
+    )
+
+    assert res.chunks == ((1000,), (500, 500))
 
 
 def test_ground_range_to_slant_range_time() -> None:
@@ -488,6 +1107,235 @@ def test_ground_range_to_slant_range_time() -> None:
     assert isinstance(res, xr.DataArray)
 
 
+def test_orbit_kernel_arguments() -> None:
+    orbit_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/orbit")
+
+    res = sentinel1.orbit_kernel_arguments(orbit_ds, order=8)
+
+    assert res["coefficients"].shape == (orbit_ds.sizes["azimuth_time"] - 7, 8, 6)
+    np.testing.assert_allclose(res["scale"], 10.0)
+
+    with pytest.raises(ValueError):
+        sentinel1.orbit_kernel_arguments(orbit_ds, order=20)
+
+
+def test_interpolate_orbit() -> None:
+    orbit_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/orbit")
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+
+    res = sentinel1.interpolate_orbit(orbit_ds, orbit_ds.azimuth_time)
+
+    xr.testing.assert_allclose(res.position, orbit_ds.position, rtol=1e-15)
+    xr.testing.assert_allclose(res.velocity, orbit_ds.velocity, rtol=1e-15)
+
+    azimuth_time = swath_ds.azimuth_time.chunk(2000)
+
+    res = sentinel1.interpolate_orbit(orbit_ds, azimuth_time)
+
+    assert res.position.dims == ("axis", "line")
+    assert res.velocity.chunks == ((3,), azimuth_time.chunks[0])
+    # the velocity is the derivative of the position
+    position = res.position.compute()
+    dt = np.diff(swath_ds.azimuth_time[:2].values)[0] / np.timedelta64(1, "s")
+    velocity = position.diff("line", label="lower") / dt
+    xr.testing.assert_allclose(velocity[:, :1000], res.velocity[:, :1000], atol=0.1)
+
+    azimuth_time = orbit_ds.azimuth_time[[0, -1]] + np.timedelta64(-1, "s")
+
+    res = sentinel1.interpolate_orbit(orbit_ds, azimuth_time)
+
+    assert np.isnan(res.position[:, 0]).all()
+    assert not np.isnan(res.position[:, 1]).any()
+
+
+def test_geodetic_to_ecef() -> None:
+    latitude = np.array([0.0, 0.0, 90.0])
+    longitude = np.array([0.0, 90.0, 0.0])
+
+    res = sentinel1.geodetic_to_ecef(latitude, longitude, np.array(100.0))
+
+    semi_minor_axis = sentinel1.WGS84_SEMI_MAJOR_AXIS * (1 - sentinel1.WGS84_FLATTENING)
+    expected = [
+        [sentinel1.WGS84_SEMI_MAJOR_AXIS + 100, 0, 0],
+        [0, sentinel1.WGS84_SEMI_MAJOR_AXIS + 100, 0],
+        [0, 0, semi_minor_axis + 100],
+    ]
+    np.testing.assert_allclose(res, expected, atol=1e-6)
+
+
+def test_radar_time_to_line_pixel() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    measurement = swath_ds.isel(line=slice(1700, 1900), pixel=slice(100, 200))
+
+    res = sentinel1.radar_time_to_line_pixel(
+        swath_ds, measurement.azimuth_time, measurement.slant_range_time
+    )
+
+    np.testing.assert_allclose(res.line, np.arange(1700, 1900))
+    np.testing.assert_allclose(res.pixel, np.arange(100, 200))
+
+    grd_ds = sentinel1.open_sentinel1_dataset(GRD_IW, group="IW/VV")
+    cc_ds = sentinel1.open_sentinel1_dataset(
+        GRD_IW, group="IW/VV/coordinate_conversion"
+    )
+    azimuth_time = grd_ds.azimuth_time[:1000:100]
+    slant_range_time = sentinel1.ground_range_to_slant_range_time(
+        azimuth_time, grd_ds.ground_range[:1000:100], cc_ds
+    )
+
+    res = sentinel1.radar_time_to_line_pixel(
+        grd_ds, azimuth_time, slant_range_time, cc_ds
+    )
+
+    np.testing.assert_allclose(res.line, np.arange(0, 1000, 100), atol=1e-3)
+    np.testing.assert_allclose(res.pixel - np.arange(0, 1000, 100), 0, atol=1e-2)
+
+    with pytest.raises(TypeError):
+        sentinel1.radar_time_to_line_pixel(grd_ds, azimuth_time, slant_range_time)
+
+
+def test_backward_geocode() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    orbit_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/orbit")
+    gcp_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/gcp")
+    gcp_ds = gcp_ds.rename_dims(azimuth_time="y", slant_range_time="x")
+
+    res = sentinel1.backward_geocode(
+        orbit_ds, gcp_ds.latitude, gcp_ds.longitude, gcp_ds.height, swath_ds
+    )
+
+    assert set(res.data_vars) == {"azimuth_time", "slant_range_time", "line", "pixel"}
+    # the annotation times have a microsecond resolution
+    azimuth_time_error = (res.azimuth_time - gcp_ds.azimuth_time) / np.timedelta64(
+        1, "us"
+    )
+    assert abs(azimuth_time_error).max() < 2.5
+    assert abs(res.slant_range_time - gcp_ds.slant_range_time).max() < 1e-12
+    assert abs(res.pixel - gcp_ds.pixel).max() < 1e-3
+
+    res = sentinel1.backward_geocode(
+        orbit_ds,
+        gcp_ds.latitude.chunk(4),
+        gcp_ds.longitude.chunk(4),
+        gcp_ds.height.chunk(4),
+    )
+
+    assert set(res.data_vars) == {"azimuth_time", "slant_range_time"}
+    assert res.azimuth_time.chunks == gcp_ds.latitude.chunk(4).chunks
+    # without the bistatic correction the azimuth times are the zero-Doppler ones
+    assert (res.azimuth_time >= gcp_ds.azimuth_time).all()
+
+    point = xr.DataArray(0.0)
+
+    res = sentinel1.backward_geocode(orbit_ds, point, point, point)
+
+    assert np.isnat(res.azimuth_time)
+    assert np.isnan(res.slant_range_time)
+
+
+def test_backward_geocode_max_iterations(monkeypatch: pytest.MonkeyPatch) -> None:
+    orbit_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/orbit")
+    gcp_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/gcp")
+    gcp_ds = gcp_ds.rename_dims(azimuth_time="y", slant_range_time="x")
+    expected = sentinel1.backward_geocode(
+        orbit_ds, gcp_ds.latitude, gcp_ds.longitude, gcp_ds.height
+    )
+    # without Newton iterations the times are the bracketing estimates
+    monkeypatch.setattr(
+        sentinel1,
+        "zero_doppler_kernel",
+        functools.partial(sentinel1.zero_doppler_kernel, max_iterations=0),
+    )
+
+    res = sentinel1.backward_geocode(
+        orbit_ds, gcp_ds.latitude, gcp_ds.longitude, gcp_ds.height
+    )
+
+    azimuth_time_error = (res.azimuth_time - expected.azimuth_time) / np.timedelta64(
+        1, "ms"
+    )
+    assert abs(azimuth_time_error).max() < 1
+    assert abs(res.slant_range_time - expected.slant_range_time).max() < 1e-12
+
+
+def test_tops_ramp_kernel() -> None:
+    data = np.full((4, 3), 2 + 0j, dtype=np.complex64)
+    burst = np.array([0, 0, 1, 1])
+    burst_time = np.array([-0.5, 0.5, -1.0, 1.0])
+    slant_range_time = np.array([0.005, 0.0051, 0.0052])
+    kwargs: dict[str, Any] = {
+        "steering_doppler_rate": np.array([8000.0, 6000.0]),
+        "azimuth_fm_rate_t0": np.array([0.005, 0.005]),
+        "azimuth_fm_rate_coefficients": np.array([[-2000.0, 0, 0], [-2000, 0, 0]]),
+        "doppler_centroid_t0": np.array([0.005, 0.005]),
+        "doppler_centroid_coefficients": np.array([[10.0, 0, 0], [-10, 1e5, 0]]),
+        "reference_time": np.array([0.005, -0.005]),
+    }
+
+    res = sentinel1.tops_ramp_kernel(
+        data, burst[:, None], burst_time[:, None], slant_range_time, **kwargs
+    )
+
+    assert res.dtype == np.complex64
+    doppler_centroid_rate = np.array([1600.0, 1500.0])[burst, None]
+    doppler_centroid = np.array([[10.0, 10, 10], [-10, 0, 10]])[burst]
+    reference = doppler_centroid / 2000.0 - np.array([0.005, -0.005])[burst, None]
+    eta = burst_time[:, None] - reference
+    phase = np.pi * doppler_centroid_rate * eta**2 + 2 * np.pi * doppler_centroid * eta
+    np.testing.assert_allclose(res, 2 * np.exp(-1j * phase), rtol=1e-6)
+
+    res = sentinel1.tops_ramp_kernel(
+        res, burst, burst_time, slant_range_time, reramp=True, **kwargs
+    )
+
+    np.testing.assert_allclose(res, data, rtol=1e-6)
+
+
+def test_deramp_bursts() -> None:
+    swath_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV")
+    orbit_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/orbit")
+    dc_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/dc_estimate")
+    fm_ds = sentinel1.open_sentinel1_dataset(SLC_IW, group="IW1/VV/azimuth_fm_rate")
+    window = swath_ds.measurement.isel(line=slice(4490, 6020), pixel=slice(0, 20))
+    window = window.compute()
+    measurement = window.chunk({"line": 500, "pixel": 10})
+
+    res = sentinel1.deramp_bursts(measurement, orbit_ds, dc_ds, fm_ds)
+
+    assert res.dtype == np.complex64
+    assert res.chunks == measurement.chunks
+    assert res.dims == measurement.dims
+    # the test data are constant, so the deramped data are the conjugate ramp and
+    #   the azimuth frequency at the first pixel of a burst is -fdc - kt * eta
+    deramped = res.isel(pixel=0).values
+    azimuth_time_interval = swath_ds.attrs["azimuth_time_interval"]
+    frequency = np.angle(deramped[1:] * deramped[:-1].conj())
+    frequency /= 2 * np.pi * azimuth_time_interval
+    dc = dc_ds.sel(azimuth_time=res.azimuth_time[13 + 750], method="nearest")
+    doppler_centroid = sentinel1.polynomial_kernel(
+        dc.data_dc_polynomial.values,
+        swath_ds.attrs["image_slant_range_time"],
+        dc.t0.values,
+    )
+    # the middle of the burst, eta = 0, is between its lines 750 and 751
+    assert abs(frequency[13 + 750] + doppler_centroid) < 0.01
+    # the Doppler centroid rate of Sentinel-1 IW1 is about 1.8 kHz/s
+    doppler_centroid_rate = np.diff(frequency[13 + 740 : 13 + 760]).mean()
+    doppler_centroid_rate /= -azimuth_time_interval
+    assert 1700 < doppler_centroid_rate < 1900
+
+    reramped = sentinel1.deramp_bursts(res, orbit_ds, dc_ds, fm_ds, reramp=True)
+
+    np.testing.assert_allclose(reramped, measurement, rtol=1e-6)
+
+    burst = sentinel1.crop_burst_dataset(window, burst_index=3)
+
+    res_burst = sentinel1.deramp_bursts(burst, orbit_ds, dc_ds, fm_ds)
+
+    assert res_burst.dims == ("azimuth_time", "slant_range_time")
+    np.testing.assert_array_equal(res_burst, res[13 : 13 + 1501])
+
+
 def test_do_override_product_files() -> None:
     template = "{dirname}/{prefix}{swath}-{polarization}{ext}"
     _, product_files = esa_safe.parse_manifest_sentinel1(SLC_S3 / "manifest.safe")
@@ -1,5 +1,6 @@
 import pathlib
 
+import numpy as np
 import pytest
 import xarray as xr
 
@@ -219,9 +220,21 @@ def test_open_calibration_dataset() -> None:
         DATA_FOLDER
         / "S1B_IW_SLC__1SDV_20210401T052622_20210401T052650_026269_032297_EFA4.SAFE"
     )
+    esa_safe.clear_xml_cache()
     res = xr.open_dataset(
         annotation_path, engine="sentinel-1", group="IW1/VV/calibration"
     )
 
     assert isinstance(res, xr.Dataset)
     assert set(res.sizes) == {"line", "pixel"}
+    # the LUTs are decoded on first access
+    assert not isinstance(res.sigmaNought.variable._data, np.ndarray)
+
+    expected = xr.open_dataset(
+        annotation_path,
+        engine="sentinel-1",
+        group="IW1/VV/calibration",
+        lazy_metadata=False,
+    )
+
+    xr.testing.assert_identical(res, expected)
@@ -0,0 +1,24 @@
+import pathlib
+
+import pytest
+
+from xarray_sentinel import esa_safe
+
+pytest.importorskip("distributed")
+
+from xarray_sentinel import worker  # noqa: E402
+
+
+def test_warm_schemas_plugin(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(esa_safe.SCHEMA_CACHE_DIR_ENV, str(tmp_path))
+    plugin = worker.WarmSchemasPlugin(["manifest"])
+    esa_safe.cached_sentinel1_schemas.cache_clear()
+    try:
+        plugin.setup(worker=None)
+
+        assert esa_safe.cached_sentinel1_schemas.cache_info().currsize == 1
+        assert len(list(tmp_path.glob("manifest-*.pickle"))) == 1
+    finally:
+        esa_safe.cached_sentinel1_schemas.cache_clear()
@@ -34,6 +34,30 @@ def test_open_pol_dataset_iw_preferred_chunks() -> None:
     assert res.measurement.chunks[line_index][0] == 64
 
 
+def test_open_pol_dataset_iw_auto_chunks() -> None:
+    product_path = (
+        DATA_FOLDER
+        / "S1B_IW_SLC__1SDV_20210401T052622_20210401T052650_026269_032297_EFA4.SAFE"
+    )
+    res = xr.open_dataset(
+        product_path,
+        engine="sentinel-1",
+        group="IW1/VV",
+        chunks={},
+        rasterio_chunks="auto",
+    )
+
+    lines_per_burst = res.attrs["lines_per_burst"]
+    line_index = res.measurement.dims.index("line")
+    assert set(res.measurement.chunks[line_index]) == {lines_per_burst}
+    assert res.measurement.encoding["preferred_chunks"]["line"] == lines_per_burst
+
+    with pytest.raises(ValueError):
+        xr.open_dataset(
+            product_path, engine="sentinel-1", group="IW1/VV", rasterio_chunks="x"
+        )
+
+
 def test_open_pol_dataset_sm_preferred_chunks() -> None:
     product_path = (
         DATA_FOLDER
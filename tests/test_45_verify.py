@@ -0,0 +1,55 @@
+import pathlib
+
+import fsspec
+from typer.testing import CliRunner
+
+from xarray_sentinel import __main__, esa_safe, verify
+
+DATA_FOLDER = pathlib.Path(__file__).parent / "data"
+
+SLC_S3 = (
+    DATA_FOLDER
+    / "S1A_S3_SLC__1SDV_20210401T152855_20210401T152914_037258_04638E_6001.SAFE"
+)
+SLC_S3_VH_annotation = (
+    "./annotation/s1a-s3-slc-vh-20210401t152855-20210401t152914-037258-04638e-001.xml"
+)
+SLC_S3_VH_measurement = (
+    "./measurement/s1a-s3-slc-vh-20210401t152855-20210401t152914-037258-04638e-001.tiff"
+)
+
+
+def test_md5_checksum(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"0123456789" * 100)
+
+    res = verify.md5_checksum(str(path), fsspec.filesystem("file"), block_size=64)
+
+    assert res == ("427008b3fe192f663d665f56cd75716c", 1000)
+
+
+def test_verify_sentinel1_product() -> None:
+    checksums = esa_safe.parse_manifest_checksums(SLC_S3 / "manifest.safe")
+
+    res = verify.verify_sentinel1_product(SLC_S3, max_workers=2, block_size=65536)
+
+    assert res["files"].keys() == checksums.keys()
+    assert res["files"][SLC_S3_VH_annotation] == "ok"
+    # the test measurement has been recompressed to reduce its size
+    assert res["files"][SLC_S3_VH_measurement] == "size"
+    assert "missing" in res["files"].values()
+    assert res["failed"] == {
+        href: status for href, status in res["files"].items() if status != "ok"
+    }
+    assert res["throughput"] > 0
+    assert res["nbytes"] > checksums[SLC_S3_VH_annotation][0]
+
+
+def test_verify_command() -> None:
+    runner = CliRunner()
+
+    res = runner.invoke(__main__.app, ["verify", str(SLC_S3)])
+
+    assert res.exit_code == 1
+    assert "checked 11 files, 9 failed" in res.output
+    assert f"size     {SLC_S3_VH_measurement}" in res.output
@@ -20,27 +20,79 @@ except ImportError:  # pragma: no cover
     # Local copy or not installed with setuptools
     __version__ = "999"
 
-from .esa_safe import make_stac_item
-from .sentinel1 import (
-    calibrate_amplitude,
-    calibrate_intensity,
-    crop_burst_dataset,
-    get_footprint_linestring,
-    ground_range_to_slant_range_time,
-    mosaic_slc_iw,
-    open_sentinel1_dataset,
-    slant_range_time_to_ground_range,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .esa_safe import make_stac_item
+    from .sentinel1 import (
+        backward_geocode,
+        calibrate_amplitude,
+        calibrate_intensity,
+        crop_burst_dataset,
+        deramp_bursts,
+        get_footprint_linestring,
+        ground_range_to_slant_range_time,
+        interp_coordinate_conversion,
+        interpolate_gcp,
+        interpolate_orbit,
+        merge_slc_iw,
+        mosaic_slc_iw,
+        open_sentinel1_bursts,
+        open_sentinel1_dataset,
+        slant_range_time_to_ground_range,
+    )
+
+# the public API is imported on first access (PEP 562), so that importing the
+#   package or the xarray backend does not load GDAL, xarray and xmlschema
+LAZY_ATTRIBUTES = {
+    "backward_geocode": "sentinel1",
+    "calibrate_amplitude": "sentinel1",
+    "calibrate_intensity": "sentinel1",
+    "crop_burst_dataset": "sentinel1",
+    "deramp_bursts": "sentinel1",
+    "get_footprint_linestring": "sentinel1",
+    "ground_range_to_slant_range_time": "sentinel1",
+    "interp_coordinate_conversion": "sentinel1",
+    "interpolate_gcp": "sentinel1",
+    "interpolate_orbit": "sentinel1",
+    "make_stac_item": "esa_safe",
+    "merge_slc_iw": "sentinel1",
+    "mosaic_slc_iw": "sentinel1",
+    "open_sentinel1_bursts": "sentinel1",
+    "open_sentinel1_dataset": "sentinel1",
+    "slant_range_time_to_ground_range": "sentinel1",
+}
 
 __all__ = [
     "__version__",
+    "backward_geocode",
     "calibrate_amplitude",
     "calibrate_intensity",
     "crop_burst_dataset",
+    "deramp_bursts",
     "get_footprint_linestring",
     "ground_range_to_slant_range_time",
+    "interp_coordinate_conversion",
+    "interpolate_gcp",
+    "interpolate_orbit",
     "make_stac_item",
+    "merge_slc_iw",
     "mosaic_slc_iw",
+    "open_sentinel1_bursts",
     "open_sentinel1_dataset",
     "slant_range_time_to_ground_range",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
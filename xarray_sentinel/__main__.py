@@ -1,22 +1,51 @@
-import distributed
-import typer
+from typing import Any
 
-import xarray_sentinel.reformat
+import typer
 
 app = typer.Typer()
 
 
 @app.command()
 def convert(source: str, target: str) -> None:
+    # dask.distributed is slow to import and only needed by this command
+    import distributed
+
+    import xarray_sentinel.reformat
+    import xarray_sentinel.worker
+
     groups = {
         "IW/VV": "IW/VV",
         "IW/VH": "IW/VH",
     }
     client = distributed.Client(processes=True)  # type: ignore
+    client.register_plugin(xarray_sentinel.worker.WarmSchemasPlugin())
     print(client)
     xarray_sentinel.reformat.to_group_zarr(source, target, groups=groups)
 
 
+@app.command()
+def verify(
+    product: str,
+    max_workers: int | None = None,
+    block_size: int | None = None,
+) -> None:
+    import xarray_sentinel.verify
+
+    kwargs: dict[str, Any] = {} if block_size is None else {"block_size": block_size}
+    report = xarray_sentinel.verify.verify_sentinel1_product(
+        product, max_workers=max_workers, **kwargs
+    )
+    for href, status in report["failed"].items():
+        print(f"{status:<8} {href}")
+    print(
+        f"checked {len(report['files'])} files, {len(report['failed'])} failed, "
+        f"{report['nbytes'] / 1e6:.1f} MB in {report['elapsed']:.2f} s "
+        f"({report['throughput'] / 1e6:.1f} MB/s)"
+    )
+    if report["failed"]:
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def info() -> None:
     pass
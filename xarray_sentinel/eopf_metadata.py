@@ -101,16 +101,21 @@ def build_general_annotation(general_annotation: dict[str, Any]) -> dict[str, An
 def build_other_metadata(annotation_urlpath: esa_safe.PathType) -> dict[str, Any]:
     warnings.warn("This is an unofficial, alpha converter", UserWarning)
     with fsspec.open(annotation_urlpath) as fp:
-        quality_information = esa_safe.parse_tag(fp, "//qualityInformation")
-        quality_information = filter_metadata_dict(quality_information)
-        general_annotation = esa_safe.parse_tag(fp, "//generalAnnotation")
-        general_annotation = build_general_annotation(general_annotation)
-        image_information = esa_safe.parse_tag(fp, "//imageAnnotation")
-        image_information = filter_metadata_dict(image_information)
-        swath_merginig = esa_safe.parse_tag(fp, "//swathMerging")
-        swath_merginig = filter_metadata_dict(swath_merginig)
-        swath_timing = esa_safe.parse_tag(fp, "//swathTiming")
-        swath_timing = filter_metadata_dict(swath_timing)
+        tags = esa_safe.parse_tags(
+            fp,
+            [
+                "//qualityInformation",
+                "//generalAnnotation",
+                "//imageAnnotation",
+                "//swathMerging",
+                "//swathTiming",
+            ],
+        )
+    quality_information = filter_metadata_dict(tags["//qualityInformation"])
+    general_annotation = build_general_annotation(tags["//generalAnnotation"])
+    image_information = filter_metadata_dict(tags["//imageAnnotation"])
+    swath_merginig = filter_metadata_dict(tags["//swathMerging"])
+    swath_timing = filter_metadata_dict(tags["//swathTiming"])
 
     other_metadata = {
         "quality_information": quality_information,
@@ -1,17 +1,39 @@
+import collections
 import functools
+import hashlib
 import importlib.resources
 import os
+import pickle
+import posixpath
 import re
-from typing import Any, Mapping, TextIO, Union
+import sys
+import tempfile
+import threading
+from typing import (
+    Any,
+    BinaryIO,
+    Hashable,
+    Iterator,
+    Mapping,
+    NoReturn,
+    Sequence,
+    TextIO,
+    Union,
+)
 from xml.etree import ElementTree
 
+import fsspec
+import numpy as np
+import numpy.typing as npt
 import xmlschema
 
+from . import __version__
+
 PathType = Union[str, "os.PathLike[str]"]
 PathOrFileType = Union[PathType, TextIO]
 
 
-SENTINEL1_NAMESPACES = {
+SENTINEL1_NAMESPACES: dict[str, str] = {
     "safe": "http://www.esa.int/safe/sentinel-1.0",
     "s1": "http://www.esa.int/safe/sentinel-1.0/sentinel-1",
     "s1sarl1": "http://www.esa.int/safe/sentinel-1.0/sentinel-1/sar/level-1",
@@ -27,27 +49,644 @@ SENTINEL1_SCHEMAS = {
     "aux_orbit": SENTINEL1_FOLDER / "my-schema_orb.xsd",
 }
 
+# the compiled schemas are cached on disk only if this is set to a directory that
+#   is private to the user, as the cache files are unpickled
+SCHEMA_CACHE_DIR_ENV = "XARRAY_SENTINEL_SCHEMA_CACHE_DIR"
+
 SENTINEL2_NAMESPACES = {
     "safe": "http://www.esa.int/safe/sentinel/1.1",
 }
 
 
+# the in-memory caches are bounded by number of entries, not by bytes: a parsed XML
+#   tree of an annotation file takes tens of MB, a manifest or a decoded tag much less.
+#   The sizes can be set with the environment variables below before import, or at
+#   runtime with `XML_TREE_CACHE.resize(maxsize)`, 0 disables a cache
+# the decoded tags and manifests are shared by all the callers, so the functions
+#   returning them return read-only containers, see `freeze`
+XML_TREE_CACHE_MAXSIZE_ENV = "XARRAY_SENTINEL_XML_TREE_CACHE_MAXSIZE"
+DECODED_TAG_CACHE_MAXSIZE_ENV = "XARRAY_SENTINEL_DECODED_TAG_CACHE_MAXSIZE"
+MANIFEST_CACHE_MAXSIZE_ENV = "XARRAY_SENTINEL_MANIFEST_CACHE_MAXSIZE"
+
+
+def get_cache_maxsize(env: str, default: int) -> int:
+    value = os.environ.get(env)
+    if not value:
+        return default
+    try:
+        maxsize = int(value)
+    except ValueError:
+        raise ValueError(f"{env} must be a non-negative integer, got {value!r}")
+    if maxsize < 0:
+        raise ValueError(f"{env} must be a non-negative integer, got {value!r}")
+    return maxsize
+
+
+XML_TREE_CACHE_MAXSIZE = get_cache_maxsize(XML_TREE_CACHE_MAXSIZE_ENV, 8)
+DECODED_TAG_CACHE_MAXSIZE = get_cache_maxsize(DECODED_TAG_CACHE_MAXSIZE_ENV, 256)
+MANIFEST_CACHE_MAXSIZE = get_cache_maxsize(MANIFEST_CACHE_MAXSIZE_ENV, 16)
+
+
+class LRUCache:
+    """Thread-safe mapping that keeps at most `maxsize` items.
+
+    When full, the least recently used item is evicted to make room for a new one.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: collections.OrderedDict[Hashable, Any] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class FrozenDict(dict):  # type: ignore[type-arg]
+    """Read-only dict of decoded tags, shared by all the cache hits.
+
+    Copies and pickles are plain, mutable, dicts.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple[type[dict], tuple[dict]]:  # type: ignore[type-arg]
+        return dict, (dict(self),)
+
+
+class FrozenList(list):  # type: ignore[type-arg]
+    """Read-only list of decoded tags, shared by all the cache hits.
+
+    Copies and pickles are plain, mutable, lists.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self) -> tuple[type[list], tuple[list]]:  # type: ignore[type-arg]
+        return list, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Return the decoded value with all its dicts and lists made read-only."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+MISSING = object()
+
+XML_TREE_CACHE = LRUCache(XML_TREE_CACHE_MAXSIZE)
+DECODED_TAG_CACHE = LRUCache(DECODED_TAG_CACHE_MAXSIZE)
+MANIFEST_CACHE = LRUCache(MANIFEST_CACHE_MAXSIZE)
+
+
+def clear_xml_cache() -> None:
+    XML_TREE_CACHE.clear()
+    DECODED_TAG_CACHE.clear()
+    MANIFEST_CACHE.clear()
+
+
+def get_fs_path(
+    urlpath_or_path: PathType,
+    fs: fsspec.AbstractFileSystem | None = None,
+    storage_options: dict[str, Any] | None = None,
+) -> tuple[fsspec.AbstractFileSystem, str]:
+    if fs is not None and storage_options is not None:
+        raise TypeError("only one of 'fs' and 'storage_options' can be not None")
+
+    if fs is None:
+        fs, _, paths = fsspec.get_fs_token_paths(
+            urlpath_or_path, storage_options=storage_options
+        )
+        if len(paths) == 0:
+            raise ValueError(f"file or object not found {urlpath_or_path!r}")
+        elif len(paths) > 1:
+            raise ValueError(f"multiple files or objects found {urlpath_or_path!r}")
+        path = paths[0]
+    else:
+        path = str(urlpath_or_path)
+
+    if fs.isdir(path):
+        path = posixpath.join(path, "manifest.safe")
+
+    return fs, path
+
+
+def get_info_version(info: Mapping[str, Any]) -> Any:
+    """Return the most specific content version available in a fsspec `info` dict."""
+    for key in ["ETag", "etag", "md5Hash", "mtime", "LastModified", "last_modified"]:
+        if info.get(key) is not None:
+            return str(info[key])
+    return info.get("created")
+
+
+def get_file_identity(xml_path: PathOrFileType) -> tuple[str, str, Any, Any] | None:
+    """Return a hashable key identifying the content of a file, or None if unknown.
+
+    The key is made of the filesystem protocol, the path and the size and version
+    (ETag or modification time) of the file, so that a file modified in place
+    gets a new identity.
+    File objects are identified only if they expose the fsspec `fs` and `path`.
+    """
+    if isinstance(xml_path, (str, os.PathLike)):
+        path = os.path.abspath(xml_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return ("file", path, stat.st_size, stat.st_mtime_ns)
+
+    fs = getattr(xml_path, "fs", None)
+    fs_path = getattr(xml_path, "path", None)
+    if fs is None or not isinstance(fs_path, str):
+        return None
+    protocol = fs.protocol if isinstance(fs.protocol, str) else fs.protocol[0]
+    if protocol in {"file", "local"}:
+        return get_file_identity(fs_path)
+    # fsspec buffered files already hold the `info` fetched at open time
+    info = getattr(xml_path, "details", None)
+    if not isinstance(info, Mapping):
+        try:
+            info = fs.info(fs_path)
+        except (OSError, NotImplementedError):
+            return None
+    return (protocol, fs_path, info.get("size"), get_info_version(info))
+
+
+def parse_xml(
+    xml_path: PathOrFileType,
+) -> "ElementTree.ElementTree[ElementTree.Element]":
+    """Parse an XML document, reusing the cached element tree if the file is unchanged."""
+    identity = get_file_identity(xml_path)
+    xml_tree: ElementTree.ElementTree[ElementTree.Element] | None = None
+    if identity is not None:
+        xml_tree = XML_TREE_CACHE.get(identity)
+    if xml_tree is None:
+        if hasattr(xml_path, "seek"):
+            xml_path.seek(0)
+        xml_tree = ElementTree.parse(xml_path)
+        if identity is not None:
+            XML_TREE_CACHE.put(identity, xml_tree)
+    return xml_tree
+
+
+def get_schema_cache_dir() -> str | None:
+    return os.environ.get(SCHEMA_CACHE_DIR_ENV) or None
+
+
+@functools.lru_cache
+def get_schema_cache_key(schema_type: str) -> bytes:
+    """Return the digest of everything a compiled schema depends on.
+
+    That is the package, xmlschema and Python versions and the content of the XSDs.
+    """
+    python_version = "{}{}".format(*sys.version_info[:2])
+    key = hashlib.sha256(
+        f"{schema_type}-{__version__}-{xmlschema.__version__}-{python_version}".encode()
+    )
+    for xsd in sorted(SENTINEL1_FOLDER.iterdir(), key=lambda xsd: xsd.name):
+        if xsd.name.endswith(".xsd"):
+            key.update(xsd.name.encode())
+            key.update(xsd.read_bytes())
+    return key.digest()
+
+
+def get_schema_cache_path(schema_type: str, cache_dir: str) -> str:
+    key = get_schema_cache_key(schema_type).hex()[:16]
+    return os.path.join(cache_dir, f"{schema_type}-{key}.pickle")
+
+
+def is_private_file(file: BinaryIO) -> bool:
+    """Return True if the open file is owned by the user and only writable by them."""
+    stat = os.fstat(file.fileno())
+    if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+        return False
+    return not stat.st_mode & 0o022
+
+
+def load_compiled_schema(
+    schema_path: str, schema_type: str
+) -> xmlschema.XMLSchema | None:
+    """Return the compiled schema in the cache file, or None if it is not valid.
+
+    The file is unpickled only if it is private to the user, its header matches
+    `get_schema_cache_key` and the digest of its content.
+    """
+    try:
+        with open(schema_path, "rb") as file:
+            if not is_private_file(file):
+                return None
+            header = file.read(64)
+            payload = file.read()
+    except OSError:
+        return None
+    key, digest = header[:32], header[32:]
+    if key != get_schema_cache_key(schema_type):
+        return None
+    if digest != hashlib.sha256(payload).digest():
+        return None
+    try:
+        schema = pickle.loads(payload)
+    except Exception:
+        # an incompatible cache file is simply rebuilt
+        return None
+    return schema if isinstance(schema, xmlschema.XMLSchema) else None
+
+
+def dump_compiled_schema(
+    schema: xmlschema.XMLSchema, schema_path: str, schema_type: str
+) -> None:
+    cache_dir = os.path.dirname(schema_path)
+    payload = pickle.dumps(schema, protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        # write to a temporary file first so that concurrent workers never read
+        #   a partially written cache file, temporary files are private to the user
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as file:
+            file.write(get_schema_cache_key(schema_type))
+            file.write(hashlib.sha256(payload).digest())
+            file.write(payload)
+        os.replace(file.name, schema_path)
+    except OSError:
+        pass
+
+
 @functools.lru_cache
 def cached_sentinel1_schemas(schema_type: str) -> xmlschema.XMLSchema:
-    return xmlschema.XMLSchema(str(SENTINEL1_SCHEMAS[schema_type]))
+    """Return the compiled XSD schema.
 
+    The schema is loaded from the on-disk cache if `SCHEMA_CACHE_DIR_ENV` is set.
+    """
+    cache_dir = get_schema_cache_dir()
+    if cache_dir is None:
+        return xmlschema.XMLSchema(str(SENTINEL1_SCHEMAS[schema_type]))
 
-def parse_tag(
+    schema_path = get_schema_cache_path(schema_type, cache_dir)
+    schema = load_compiled_schema(schema_path, schema_type)
+    if schema is None:
+        schema = xmlschema.XMLSchema(str(SENTINEL1_SCHEMAS[schema_type]))
+        dump_compiled_schema(schema, schema_path, schema_type)
+    return schema
+
+
+def warm_sentinel1_schemas(schema_types: Sequence[str] | None = None) -> None:
+    """Compile, or load from the opt-in on-disk cache, the schemas used to decode products.
+
+    Useful to move the cost of the schema compilation out of the first product
+    opened in a process, e.g. in a dask worker plugin.
+    """
+    if schema_types is None:
+        schema_types = list(SENTINEL1_SCHEMAS)
+    for schema_type in schema_types:
+        cached_sentinel1_schemas(schema_type)
+
+
+# XPath queries that can be resolved walking the element tree, e.g. `//burst`
+SIMPLE_QUERY_PATTERN = re.compile(r"//([A-Za-z_][\w.-]*(?:/[A-Za-z_][\w.-]*)*)")
+
+
+@functools.lru_cache
+def cached_xsd_element(schema_type: str, element_path: str) -> Any:
+    return cached_sentinel1_schemas(schema_type).find(element_path)
+
+
+def iter_element_paths(
+    element: ElementTree.Element, path: tuple[str, ...] = ()
+) -> Iterator[tuple[tuple[str, ...], ElementTree.Element]]:
+    path = path + (element.tag,)
+    yield path, element
+    for child in element:
+        yield from iter_element_paths(child, path)
+
+
+def parse_tags(
     xml_path: PathOrFileType,
-    query: str,
+    queries: Sequence[str],
     schema_type: str = "annotation",
     validation: str = "skip",
 ) -> dict[str, Any]:
-    schema = cached_sentinel1_schemas(schema_type)
+    """Decode several XPath queries walking the XML element tree only once.
+
+    Queries in the form `//name` or `//parent/name` are matched in a single
+    traversal and each matching element is decoded with its own XSD element,
+    any other query is decoded by the schema.
+    The value of each query is what `xmlschema.XMLSchema.decode` returns: None if
+    there are no matches, the decoded element for one match or a list of them.
+    The decoded dicts and lists are read-only, a `copy.deepcopy` is mutable.
+    """
+    identity = get_file_identity(xml_path)
+    results: dict[str, Any] = {}
+    walk_queries: dict[str, tuple[str, ...]] = {}
+    for query in queries:
+        key = (identity, query, schema_type, validation)
+        decoded = MISSING if identity is None else DECODED_TAG_CACHE.get(key, MISSING)
+        if decoded is not MISSING:
+            results[query] = decoded
+        elif validation == "skip" and (match := SIMPLE_QUERY_PATTERN.fullmatch(query)):
+            walk_queries[query] = tuple(match.group(1).split("/"))
+        else:
+            schema = cached_sentinel1_schemas(schema_type)
+            results[query] = schema.decode(
+                parse_xml(xml_path), query, validation=validation
+            )
+
+    if walk_queries:
+        matches: dict[str, list[Any]] = {query: [] for query in walk_queries}
+        root = parse_xml(xml_path).getroot()
+        for path, element in iter_element_paths(root):
+            for query, steps in walk_queries.items():
+                if path[-len(steps) :] != steps:
+                    continue
+                xsd_element = cached_xsd_element(schema_type, "/" + "/".join(path))
+                if xsd_element is None:
+                    raise ValueError(f"{path=} not found in {schema_type!r} schema")
+                matches[query].append(xsd_element.decode(element, validation="skip"))
+        for query, decoded_list in matches.items():
+            if len(decoded_list) == 0:
+                results[query] = None
+            elif len(decoded_list) == 1:
+                results[query] = decoded_list[0]
+            else:
+                results[query] = decoded_list
+
+    # the decoded values are shared by all the cache hits, so they are read-only
+    results = {query: freeze(decoded) for query, decoded in results.items()}
+    if identity is not None:
+        for query in queries:
+            DECODED_TAG_CACHE.put(
+                (identity, query, schema_type, validation), results[query]
+            )
+    return {query: results[query] for query in queries}
+
+
+def decode_tag(
+    xml_path: PathOrFileType,
+    query: str,
+    schema_type: str = "annotation",
+    validation: str = "skip",
+) -> Any:
+    return parse_tags(xml_path, [query], schema_type, validation)[query]
+
+
+# dtype and vector flag of the fields of the fixed-shape tags that are decoded
+#   without the schema, nested fields are referenced by their relative path
+VECTOR_TAG_FIELDS: dict[str, dict[str, tuple[str, bool]]] = {
+    "//calibrationVector": {
+        "azimuthTime": ("datetime64[ns]", False),
+        "line": ("int64", False),
+        "pixel": ("int64", True),
+        "sigmaNought": ("float32", True),
+        "betaNought": ("float32", True),
+        "gamma": ("float32", True),
+        "dn": ("float32", True),
+    },
+    "//noiseRangeVector": {
+        "azimuthTime": ("datetime64[ns]", False),
+        "line": ("int64", False),
+        "pixel": ("int64", True),
+        "noiseRangeLut": ("float32", True),
+    },
+    "//geolocationGridPoint": {
+        "azimuthTime": ("datetime64[ns]", False),
+        "slantRangeTime": ("float64", False),
+        "line": ("int64", False),
+        "pixel": ("int64", False),
+        "latitude": ("float64", False),
+        "longitude": ("float64", False),
+        "height": ("float64", False),
+        "incidenceAngle": ("float64", False),
+        "elevationAngle": ("float64", False),
+    },
+    "//orbit": {
+        "time": ("datetime64[ns]", False),
+        "frame": ("str", False),
+        "position/x": ("float64", False),
+        "position/y": ("float64", False),
+        "position/z": ("float64", False),
+        "velocity/x": ("float64", False),
+        "velocity/y": ("float64", False),
+        "velocity/z": ("float64", False),
+    },
+    "//antennaPattern/antennaPatternList/antennaPattern": {
+        "azimuthTime": ("datetime64[ns]", False),
+        "slantRangeTime": ("float32", True),
+        "elevationAngle": ("float32", True),
+        "elevationPattern": ("float32", True),
+        "incidenceAngle": ("float32", True),
+        "terrainHeight": ("float64", False),
+        "roll": ("float64", False),
+    },
+}
+
+
+def iter_matching_elements(
+    xml_path: PathOrFileType, steps: tuple[str, ...]
+) -> Iterator[ElementTree.Element]:
+    """Yield the elements whose path ends with `steps` in document order.
+
+    The cached element tree is walked if available, otherwise the document is
+    streamed with `ElementTree.iterparse`. When the file can be identified the
+    parsed tree is kept and cached once fully read, so that the other queries on
+    the same file do not parse it again, otherwise matched elements are cleared
+    after use.
+    """
+    identity = get_file_identity(xml_path)
+    xml_tree = None if identity is None else XML_TREE_CACHE.get(identity)
+    if xml_tree is not None:
+        for path, element in iter_element_paths(xml_tree.getroot()):
+            if path[-len(steps) :] == steps:
+                yield element
+        return
+
     if hasattr(xml_path, "seek"):
         xml_path.seek(0)
-    xml_tree = ElementTree.parse(xml_path)
-    tag_dict: Any = schema.decode(xml_tree, query, validation=validation)
+    root = None
+    stack: list[str] = []
+    for event, element in ElementTree.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            stack.append(element.tag)
+            continue
+        if tuple(stack[-len(steps) :]) == steps:
+            yield element
+            if identity is None:
+                element.clear()
+        stack.pop()
+    if identity is not None and root is not None:
+        XML_TREE_CACHE.put(identity, ElementTree.ElementTree(root))
+
+
+def get_field_value(decoded: Any, field: str) -> Any:
+    for name in field.split("/"):
+        decoded = decoded[name]
+    if isinstance(decoded, dict):
+        decoded = decoded["$"]
+    return decoded
+
+
+def parse_vectors(texts: Sequence[str], dtype: str) -> npt.NDArray[Any]:
+    """Parse the texts of a list of vectors of the same length into a 2D array.
+
+    The rows are parsed one at a time into the preallocated array, so the peak
+    memory is the size of the result plus one row.
+    """
+    if len(texts) == 0:
+        return np.empty((0, 0), dtype=dtype)
+    first = np.fromstring(texts[0], dtype=dtype, sep=" ")
+    array = np.empty((len(texts), first.size), dtype=dtype)
+    array[0] = first
+    for k, text in enumerate(texts[1:], 1):
+        row = np.fromstring(text, dtype=dtype, sep=" ")
+        if row.size != first.size:
+            raise ValueError(f"vector {k} has size {row.size} instead of {first.size}")
+        array[k] = row
+    return array
+
+
+def parse_ragged_vectors(
+    texts: Sequence[str], dtype: str
+) -> tuple[npt.NDArray[Any], npt.NDArray[np.intp]]:
+    """Parse the texts of a list of vectors of any length into a flat 1D array.
+
+    Vector `k` is `values[offsets[k] : offsets[k + 1]]`.
+    """
+    rows = [np.fromstring(text, dtype=dtype, sep=" ") for text in texts]
+    offsets = np.zeros(len(rows) + 1, dtype=np.intp)
+    np.cumsum([row.size for row in rows], out=offsets[1:])
+    values = np.concatenate(rows) if rows else np.empty(0, dtype=dtype)
+    return values, offsets
+
+
+def make_columns(
+    values: Mapping[str, list[Any]], fields: Mapping[str, tuple[str, bool]]
+) -> dict[str, Any]:
+    columns: dict[str, Any] = {}
+    for field, (dtype, is_vector) in fields.items():
+        if is_vector:
+            columns[field] = parse_vectors(values[field], dtype)
+        else:
+            columns[field] = np.array(values[field], dtype=dtype)
+    return columns
+
+
+def parse_vector_tag(
+    xml_path: PathOrFileType,
+    query: str,
+    schema_type: str = "annotation",
+    validation: str = "skip",
+    fields: Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """Decode a list of fixed-shape tags into columns of NumPy arrays.
+
+    The result maps the relative path of each field to a 1D array of the scalar
+    values, or to a 2D array with one row per tag for the vector fields.
+    The tags in `VECTOR_TAG_FIELDS` are converted straight from the XML text,
+    unknown queries and validated decoding fall back to the XSD schema.
+    If `fields` is not None only the listed fields are decoded.
+    The arrays are read-only, copy them to modify the values.
+    """
+    identity = get_file_identity(xml_path)
+    selected = None if fields is None else tuple(fields)
+    key = (identity, query, schema_type, validation, "columns", selected)
+    columns = MISSING if identity is None else DECODED_TAG_CACHE.get(key, MISSING)
+    if columns is MISSING:
+        tag_fields = VECTOR_TAG_FIELDS.get(query)
+        values: dict[str, list[Any]]
+        if (
+            tag_fields is not None
+            and validation == "skip"
+            and (match := SIMPLE_QUERY_PATTERN.fullmatch(query))
+        ):
+            if selected is not None:
+                tag_fields = {field: tag_fields[field] for field in selected}
+            values = {field: [] for field in tag_fields}
+            for element in iter_matching_elements(
+                xml_path, tuple(match.group(1).split("/"))
+            ):
+                for field in tag_fields:
+                    text = element.findtext(field)
+                    if text is None:
+                        raise ValueError(f"{field=} not found in {query=}")
+                    values[field].append(text)
+        else:
+            decoded_list = parse_tag_as_list(xml_path, query, schema_type, validation)
+            if tag_fields is None:
+                tag_fields = {}
+                for name, value in decoded_list[0].items() if decoded_list else []:
+                    if isinstance(value, dict) and "$" in value:
+                        tag_fields[name] = ("float64", True)
+                    elif not isinstance(value, (dict, list)):
+                        tag_fields[name] = (np.asarray(value).dtype.str, False)
+            if selected is not None:
+                tag_fields = {field: tag_fields[field] for field in selected}
+            values = {
+                field: [get_field_value(decoded, field) for decoded in decoded_list]
+                for field in tag_fields
+            }
+        columns = make_columns(values, tag_fields)
+        # the arrays are shared by all the cache hits, so they are read-only
+        for column in columns.values():
+            column.flags.writeable = False
+        if identity is not None:
+            DECODED_TAG_CACHE.put(key, columns)
+    return dict(columns)  # type: ignore
+
+
+def parse_tag(
+    xml_path: PathOrFileType,
+    query: str,
+    schema_type: str = "annotation",
+    validation: str = "skip",
+) -> dict[str, Any]:
+    """Decode the tag matched by an XPath query as a read-only dict."""
+    tag_dict: Any = decode_tag(xml_path, query, schema_type, validation)
     assert isinstance(tag_dict, dict), f"{type(tag_dict)} is not dict"
     return tag_dict
 
@@ -58,13 +697,12 @@ def parse_tag_as_list(
     schema_type: str = "annotation",
     validation: str = "skip",
 ) -> list[dict[str, Any]]:
-    schema = cached_sentinel1_schemas(schema_type)
-    xml_tree = ElementTree.parse(xml_path)
-    tag: Any = schema.decode(xml_tree, query, validation=validation)
+    """Decode the tags matched by an XPath query as a read-only list of dicts."""
+    tag: Any = decode_tag(xml_path, query, schema_type, validation)
     if tag is None:
-        tag = []
+        tag = FrozenList()
     elif isinstance(tag, dict):
-        tag = [tag]
+        tag = FrozenList([tag])
     tag_list: list[dict[str, Any]] = tag
     assert isinstance(tag_list, list), f"{type(tag_list)} is not list"
     return tag_list
@@ -104,12 +742,34 @@ def parse_annotation_filename(name: str) -> tuple[str, str, str, str]:
     return tuple(match.groups())  # type: ignore
 
 
-@functools.lru_cache
+def clear_manifest_cache(manifest_path: PathOrFileType | None = None) -> None:
+    """Drop the cached manifest of one product, or of all products if None."""
+    if manifest_path is None:
+        MANIFEST_CACHE.clear()
+        return
+    identity = get_file_identity(manifest_path)
+    if identity is not None:
+        MANIFEST_CACHE.pop(identity)
+        XML_TREE_CACHE.pop(identity)
+
+
 def parse_manifest_sentinel1(
     manifest_path: PathOrFileType,
 ) -> tuple[dict[str, Any], dict[str, tuple[str, str, str, str, str]]]:
+    """Parse the product attributes and the list of product files of a manifest.
+
+    Results are cached by file identity (protocol, path, size and ETag or
+    modification time), so the same manifest is parsed once even if it is passed
+    as a new file object every time. The returned dicts are read-only.
+    """
+    identity = get_file_identity(manifest_path)
+    if identity is not None:
+        cached = MANIFEST_CACHE.get(identity)
+        if cached is not None:
+            return cached  # type: ignore
+
     # We use ElementTree because we didn't find a XSD definition for the manifest
-    manifest = ElementTree.parse(manifest_path).getroot()
+    manifest = parse_xml(manifest_path).getroot()
 
     family_name = findtext(manifest, ".//safe:platform/safe:familyName")
     if family_name != "SENTINEL-1":
@@ -174,7 +834,36 @@ def parse_manifest_sentinel1(
             file_type = file_tag.attrib["repID"]
             files[file_href] = (file_type,) + description
 
-    return attributes, files
+    # the manifest is shared by all the cache hits, so it is read-only
+    manifest_info = (freeze(attributes), freeze(files))
+    if identity is not None:
+        MANIFEST_CACHE.put(identity, manifest_info)
+    return manifest_info
+
+
+def parse_manifest_checksums(
+    manifest_path: PathOrFileType,
+) -> dict[str, tuple[int, str]]:
+    """Return the size and the MD5 checksum of every data object of a manifest.
+
+    The result maps the file location, as written in the manifest, to its size in
+    bytes and the lowercase hexadecimal MD5 checksum.
+    """
+    manifest = parse_xml(manifest_path).getroot()
+
+    checksums = {}
+    for byte_stream in manifest.findall(".//dataObjectSection/dataObject/byteStream"):
+        location_tag = byte_stream.find("fileLocation")
+        checksum_tag = byte_stream.find("checksum")
+        if location_tag is None or checksum_tag is None or checksum_tag.text is None:
+            continue
+        checksum_name = checksum_tag.attrib.get("checksumName", "MD5")
+        if checksum_name != "MD5":
+            raise ValueError(f"{checksum_name=} not supported")
+        file_href = location_tag.attrib["href"]
+        size = int(byte_stream.attrib["size"])
+        checksums[file_href] = (size, checksum_tag.text.strip().lower())
+    return checksums
 
 
 # DEPRECATED
@@ -0,0 +1,369 @@
+"""Xarray indexes that compute the time coordinates of a swath on demand.
+
+The azimuth time of the lines is regularly spaced within each burst and the slant
+range time and the ground range of the pixels are regularly spaced over the swath,
+so the coordinates are computed from a few numbers instead of being stored.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Hashable, Mapping
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import xarray as xr
+from xarray.core.indexing import IndexSelResult
+
+DataArrayOrDataset = TypeVar("DataArrayOrDataset", xr.DataArray, xr.Dataset)
+
+# tolerance in lines on the positions of the bounds of a slice
+SLICE_TOLERANCE = 1e-3
+
+
+class AzimuthTimeTransform(xr.indexes.CoordinateTransform):
+    """Azimuth time of the lines of a swath, evenly spaced within every burst.
+
+    The azimuth time of a line is `time_start + floor((line - line_origin) * step)`
+    in units of `resolution` nanoseconds, with the parameters of the burst that
+    contains the line. This is the rounding of `pandas.date_range`.
+
+    :param line_start: the first line of every burst
+    :param line_origin: the line of `time_start` in every burst, it is before the
+        first line of the burst when the first lines are sliced off
+    :param time_start: the azimuth time of `line_origin` in every burst
+    :param step: the azimuth time interval in units of `resolution` nanoseconds
+    :param resolution: the resolution of the azimuth time in nanoseconds
+    """
+
+    def __init__(
+        self,
+        line_start: npt.ArrayLike,
+        line_origin: npt.ArrayLike,
+        time_start: npt.ArrayLike,
+        step: float,
+        size: int,
+        coord_name: Hashable = "azimuth_time",
+        dim: str = "line",
+        resolution: int = 1,
+    ) -> None:
+        super().__init__([coord_name], {dim: size}, dtype=np.dtype("datetime64[ns]"))
+        self.line_start = np.asarray(line_start, dtype=np.int64)
+        self.line_origin = np.asarray(line_origin, dtype=np.int64)
+        self.time_start = np.asarray(time_start, dtype="datetime64[ns]").view(np.int64)
+        self.step = step
+        self.resolution = resolution
+
+    @classmethod
+    def from_bursts(
+        cls,
+        burst_start: npt.ArrayLike,
+        lines_per_burst: int,
+        step: float,
+        size: int,
+        coord_name: Hashable = "azimuth_time",
+        dim: str = "line",
+    ) -> AzimuthTimeTransform:
+        """Build the transform of a swath made of bursts of `lines_per_burst` lines.
+
+        :param burst_start: the azimuth time of the first line of every burst
+        """
+        line_start = np.arange(np.size(burst_start)) * lines_per_burst
+        return cls(line_start, line_start, burst_start, step, size, coord_name, dim)
+
+    @property
+    def dim(self) -> str:
+        return self.dims[0]
+
+    @property
+    def size(self) -> int:
+        return self.dim_size[self.dim]
+
+    def burst(self, line: npt.NDArray[np.int64]) -> npt.NDArray[np.intp]:
+        return np.searchsorted(self.line_start, line, side="right") - 1
+
+    def forward(self, dim_positions: dict[str, Any]) -> dict[Hashable, Any]:
+        line = np.asarray(dim_positions[self.dim], dtype=np.int64)
+        burst = self.burst(line)
+        offset = np.floor((line - self.line_origin[burst]) * self.step)
+        time = self.time_start[burst] + offset.astype(np.int64) * self.resolution
+        return {self.coord_names[0]: time.astype("datetime64[ns]")}
+
+    def cuts(self) -> npt.NDArray[np.int64]:
+        """Return the times that split the swath between consecutive bursts.
+
+        The overlapping bursts are cut at the middle of their overlap.
+        """
+        first_line = self.line_start[1:]
+        first = self.forward({self.dim: first_line})[self.coord_names[0]]
+        last = self.forward({self.dim: first_line - 1})[self.coord_names[0]]
+        cuts: npt.NDArray[np.int64] = (last.view(np.int64) + first.view(np.int64)) // 2
+        return cuts
+
+    def reverse(self, coord_labels: dict[Hashable, Any]) -> dict[str, Any]:
+        labels = np.asarray(coord_labels[self.coord_names[0]], dtype="datetime64[ns]")
+        time = labels.view(np.int64)
+        burst = np.searchsorted(self.cuts(), time, side="right")
+        offset = (time - self.time_start[burst]) / self.resolution
+        line = self.line_origin[burst] + offset / self.step
+        return {self.dim: line}
+
+    def lookup(self, labels: npt.NDArray[np.datetime64]) -> npt.NDArray[np.intp]:
+        """Return the line of every azimuth time, -1 if no line has that time.
+
+        The times in the overlap between two bursts are searched in both bursts.
+        """
+        time = labels.view(np.int64)
+        nearest = np.searchsorted(self.cuts(), time, side="right")
+        line_stop = np.append(self.line_start[1:], self.size)
+        position = np.full(time.shape, -1, dtype=np.intp)
+        for shift in (0, -1, 1):
+            burst = np.clip(nearest + shift, 0, self.line_start.size - 1)
+            offset = (time - self.time_start[burst]) / self.resolution
+            line = np.rint(self.line_origin[burst] + offset / self.step).astype(np.intp)
+            inside = (line >= self.line_start[burst]) & (line < line_stop[burst])
+            found = self.forward({self.dim: np.where(inside, line, 0)})
+            match = inside & (found[self.coord_names[0]] == labels) & (position < 0)
+            position[match] = line[match]
+        return position
+
+    def slice(self, sl: slice) -> AzimuthTimeTransform:
+        start, stop, _ = sl.indices(self.size)
+        stop = max(start, stop)
+        line_stop = np.append(self.line_start[1:], self.size)
+        keep = (self.line_start < stop) & (line_stop > start)
+        keep[self.burst(np.array(start))] = True
+        return type(self)(
+            np.maximum(self.line_start[keep] - start, 0),
+            self.line_origin[keep] - start,
+            self.time_start[keep].astype("datetime64[ns]"),
+            self.step,
+            stop - start,
+            self.coord_names[0],
+            self.dim,
+            self.resolution,
+        )
+
+    def equals(
+        self,
+        other: xr.indexes.CoordinateTransform,
+        exclude: frozenset[Hashable] | None = None,
+    ) -> bool:
+        if not isinstance(other, AzimuthTimeTransform):
+            return False
+        return (
+            self.dim_size == other.dim_size
+            and (self.step, self.resolution) == (other.step, other.resolution)
+            and np.array_equal(self.line_start, other.line_start)
+            and np.array_equal(self.line_origin, other.line_origin)
+            and np.array_equal(self.time_start, other.time_start)
+        )
+
+
+class LinspaceTransform(xr.indexes.CoordinateTransform):
+    """Evenly spaced values with the same rounding as `numpy.linspace`.
+
+    :param start: the first value of the original `numpy.linspace`
+    :param stop: the last value of the original `numpy.linspace`
+    :param num: the number of values of the original `numpy.linspace`
+    :param offset: the position in the original values of the first value
+    """
+
+    def __init__(
+        self,
+        start: float,
+        stop: float,
+        num: int,
+        coord_name: Hashable,
+        dim: str,
+        offset: int = 0,
+        size: int | None = None,
+    ) -> None:
+        if size is None:
+            size = num - offset
+        super().__init__([coord_name], {dim: size})
+        self.start = start
+        self.stop = stop
+        self.num = num
+        self.offset = offset
+
+    @property
+    def dim(self) -> str:
+        return self.dims[0]
+
+    @property
+    def size(self) -> int:
+        return self.dim_size[self.dim]
+
+    @property
+    def step(self) -> float:
+        return (self.stop - self.start) / max(self.num - 1, 1)
+
+    def forward(self, dim_positions: dict[str, Any]) -> dict[Hashable, Any]:
+        index = np.asarray(dim_positions[self.dim]) + self.offset
+        values = np.where(
+            index == self.num - 1, self.stop, index * self.step + self.start
+        )
+        return {self.coord_names[0]: values}
+
+    def reverse(self, coord_labels: dict[Hashable, Any]) -> dict[str, Any]:
+        labels = np.asarray(coord_labels[self.coord_names[0]], dtype=np.float64)
+        return {self.dim: (labels - self.start) / self.step - self.offset}
+
+    def lookup(self, labels: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        """Return the position of every value, -1 if no position has that value."""
+        position = np.rint(self.reverse({self.coord_names[0]: labels})[self.dim])
+        position = position.astype(np.intp)
+        inside = (position >= 0) & (position < self.size)
+        found = self.forward({self.dim: np.where(inside, position, 0)})
+        match = inside & (found[self.coord_names[0]] == labels)
+        return np.where(match, position, -1)
+
+    def slice(self, sl: slice) -> LinspaceTransform:
+        start, stop, _ = sl.indices(self.size)
+        return type(self)(
+            self.start,
+            self.stop,
+            self.num,
+            self.coord_names[0],
+            self.dim,
+            offset=self.offset + start,
+            size=max(stop - start, 0),
+        )
+
+    def equals(
+        self,
+        other: xr.indexes.CoordinateTransform,
+        exclude: frozenset[Hashable] | None = None,
+    ) -> bool:
+        if not isinstance(other, LinspaceTransform):
+            return False
+        return self.dim_size == other.dim_size and (
+            self.start,
+            self.stop,
+            self.num,
+            self.offset,
+        ) == (other.start, other.stop, other.num, other.offset)
+
+
+class SwathIndex(xr.indexes.CoordinateTransformIndex):
+    """Index of a 1-dimensional coordinate of a swath computed on demand.
+
+    Scalar and array labels select the closest position with `method="nearest"`
+    and only the exact values otherwise. A slice selects all the positions between
+    the positions of its bounds, in the overlap between two bursts the azimuth time
+    is assigned to the burst on its side of the middle of the overlap.
+    Slicing by position keeps the index, any other selection drops it.
+    """
+
+    transform: AzimuthTimeTransform | LinspaceTransform
+
+    def __init__(self, transform: AzimuthTimeTransform | LinspaceTransform) -> None:
+        super().__init__(transform)
+
+    @property
+    def coord_name(self) -> Hashable:
+        return self.transform.coord_names[0]
+
+    @property
+    def dim(self) -> str:
+        return self.transform.dims[0]
+
+    def create_variables(
+        self, variables: Mapping[Any, xr.Variable] | None = None
+    ) -> dict[Any, xr.Variable]:
+        new_variables = dict(super().create_variables(variables))
+        for name, variable in (variables or {}).items():
+            if name in new_variables:
+                new_variables[name].encoding = dict(variable.encoding)
+        return new_variables
+
+    def isel(
+        self, indexers: Mapping[Any, int | slice | np.ndarray[Any, Any] | xr.Variable]
+    ) -> SwathIndex | None:
+        indexer = indexers[self.dim]
+        if isinstance(indexer, slice) and indexer.step in (None, 1):
+            return type(self)(self.transform.slice(indexer))
+        return None
+
+    def sel(
+        self, labels: dict[Any, Any], method: Any = None, tolerance: Any = None
+    ) -> IndexSelResult:
+        label = labels[self.coord_name]
+        size = self.transform.size
+
+        if isinstance(label, slice):
+            if label.step is not None:
+                raise ValueError("SwathIndex does not support slices with a step")
+            start, stop = 0, size
+            if label.start is not None:
+                bound = self.reverse(label.start)
+                start = max(math.ceil(bound - SLICE_TOLERANCE), 0)
+            if label.stop is not None:
+                bound = self.reverse(label.stop)
+                stop = min(math.floor(bound + SLICE_TOLERANCE) + 1, size)
+            return IndexSelResult({self.dim: slice(start, max(start, stop))})
+
+        if method not in (None, "nearest"):
+            raise ValueError(f"SwathIndex does not support method={method!r}")
+        if isinstance(label, (xr.DataArray, xr.Variable)):
+            values = np.asarray(label.values)
+        else:
+            values = np.asarray(label)
+        if self.transform.dtype.kind == "M":
+            values = values.astype("datetime64[ns]")
+            if tolerance is not None:
+                tolerance = pd.Timedelta(tolerance).to_timedelta64()
+
+        if size == 0:
+            raise KeyError(f"not all values found in index {self.coord_name!r}")
+        position: npt.NDArray[np.intp]
+        missing: npt.NDArray[np.bool_]
+        if method is None:
+            position = self.transform.lookup(values)
+            missing = position < 0
+        else:
+            reverse = self.transform.reverse({self.coord_name: values})[self.dim]
+            position = np.clip(np.rint(reverse), 0, size - 1).astype(np.intp)
+            found = self.transform.forward({self.dim: position})[self.coord_name]
+            missing = np.zeros(values.shape, dtype=bool)
+            if tolerance is not None:
+                missing = abs(found - values) > tolerance
+        if np.any(missing):
+            raise KeyError(f"not all values found in index {self.coord_name!r}")
+
+        indexer: Any = position
+        if position.ndim == 0:
+            indexer = int(position)
+        elif isinstance(label, xr.DataArray):
+            indexer = xr.DataArray(position, dims=label.dims)
+        elif isinstance(label, xr.Variable):
+            indexer = xr.Variable(label.dims, position)
+        return IndexSelResult({self.dim: indexer})
+
+    def reverse(self, label: Any) -> float:
+        values = np.asarray(label)
+        if self.transform.dtype.kind == "M":
+            values = values.astype("datetime64[ns]")
+        return float(self.transform.reverse({self.coord_name: values})[self.dim])
+
+    def to_pandas_index(self) -> pd.Index:
+        values = np.asarray(self.transform.generate_coords()[self.coord_name])
+        return pd.Index(values)
+
+    def _repr_inline_(self, max_width: int) -> str:
+        return f"{type(self).__name__} ({type(self.transform).__name__})"
+
+
+def drop_swath_indexes(obj: DataArrayOrDataset) -> DataArrayOrDataset:
+    """Drop the `SwathIndex` indexes, the coordinates are kept as plain variables.
+
+    `swap_dims` and `concat` do not support the indexes computed on demand, the
+    selected coordinates are computed instead.
+    """
+    names = [
+        name for name, index in obj.xindexes.items() if isinstance(index, SwathIndex)
+    ]
+    return obj.drop_indexes(names)
@@ -24,8 +24,8 @@ def to_group_zarr(
                 engine="sentinel-1",
                 group=group_in,
                 chunks={},
-                # rasterio_chunks={"x": 4096, "y": 2048},
-                rasterio_chunks={"y": 2048},
+                # one chunk per burst, so the measurements are copied chunk by chunk
+                rasterio_chunks="auto",
             )
             if "ground_range" in group_ds.dims:
                 group_ds = group_ds.chunk(azimuth_time=2048, ground_range=4096)
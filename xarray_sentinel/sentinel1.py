@@ -12,51 +12,42 @@ References
 
 from __future__ import annotations
 
+import contextlib
 import os
+import posixpath
+import threading
 import warnings
-from typing import Any, Sequence, TypeVar
-from xml.etree import ElementTree
+from typing import Any, Iterator, Sequence, TypeVar
 
 import fsspec
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
-import rasterio
 import xarray as xr
+from xarray.core import indexing
 
-from . import conventions, eopf_metadata, esa_safe
+from . import conventions, eopf_metadata, esa_safe, indexes
 
 SPEED_OF_LIGHT = 299_792_458  # m / s
+WGS84_SEMI_MAJOR_AXIS = 6_378_137.0  # m
+WGS84_FLATTENING = 1 / 298.257223563
+# the variables of the backward geocoding
+RADAR_NAMES = ["azimuth_time", "slant_range_time", "line", "pixel"]
 ONE_SECOND = np.timedelta64(1, "s")
+GCP_VARIABLES = (
+    "latitude",
+    "longitude",
+    "height",
+    "incidenceAngle",
+    "elevationAngle",
+)
 
 
 DataArrayOrDataset = TypeVar("DataArrayOrDataset", xr.DataArray, xr.Dataset)
 
-
-def get_fs_path(
-    urlpath_or_path: esa_safe.PathType,
-    fs: fsspec.AbstractFileSystem | None = None,
-    storage_options: dict[str, Any] | None = None,
-) -> tuple[fsspec.AbstractFileSystem, str]:
-    if fs is not None and storage_options is not None:
-        raise TypeError("only one of 'fs' and 'storage_options' can be not None")
-
-    if fs is None:
-        fs, _, paths = fsspec.get_fs_token_paths(
-            urlpath_or_path, storage_options=storage_options
-        )
-        if len(paths) == 0:
-            raise ValueError(f"file or object not found {urlpath_or_path!r}")
-        elif len(paths) > 1:
-            raise ValueError(f"multiple files or objects found {urlpath_or_path!r}")
-        path = paths[0]
-    else:
-        path = str(urlpath_or_path)
-
-    if fs.isdir(path):
-        path = os.path.join(path, "manifest.safe")
-
-    return fs, path
+# kept here for backward compatibility, the function lives in esa_safe so that the
+#   lightweight modules can use it without importing xarray
+get_fs_path = esa_safe.get_fs_path
 
 
 def normalise_group(group: str | None) -> tuple[str, int | None]:
@@ -72,52 +63,140 @@ def normalise_group(group: str | None) -> tuple[str, int | None]:
     return group, burst_index
 
 
+@contextlib.contextmanager
+def open_product_file(
+    path: esa_safe.PathOrFileType, fs: fsspec.AbstractFileSystem | None = None
+) -> Iterator[esa_safe.PathOrFileType]:
+    if fs is None:
+        yield path
+    else:
+        with fs.open(path) as file:
+            yield file
+
+
+class VectorFieldsLoader:
+    """Decode the vector fields of a tag on first access, once for all variables."""
+
+    def __init__(
+        self,
+        xml_path: esa_safe.PathOrFileType,
+        query: str,
+        schema_type: str,
+        fields: list[str],
+        fs: fsspec.AbstractFileSystem | None = None,
+    ) -> None:
+        self.xml_path = xml_path
+        self.query = query
+        self.schema_type = schema_type
+        self.fields = fields
+        self.fs = fs
+        self._columns: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[str, Any]:
+        with self._lock:
+            if self._columns is None:
+                with open_product_file(self.xml_path, self.fs) as file:
+                    self._columns = esa_safe.parse_vector_tag(
+                        file, self.query, self.schema_type, fields=self.fields
+                    )
+        return self._columns
+
+    def __getstate__(self) -> dict[str, Any]:
+        # locks cannot be pickled and decoded columns are not worth shipping to workers
+        state = self.__dict__.copy()
+        state["_columns"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class VectorFieldArray(xr.backends.BackendArray):
+    def __init__(
+        self, loader: VectorFieldsLoader, field: str, shape: tuple[int, ...]
+    ) -> None:
+        self.loader = loader
+        self.field = field
+        self.shape = shape
+        self.dtype = np.dtype(esa_safe.VECTOR_TAG_FIELDS[loader.query][field][0])
+
+    def __getitem__(self, key: indexing.ExplicitIndexer) -> Any:
+        return indexing.explicit_indexing_adapter(
+            key, self.shape, indexing.IndexingSupport.BASIC, self._getitem
+        )
+
+    def _getitem(self, key: tuple[Any, ...]) -> Any:
+        array = self.loader.load()[self.field]
+        if array.shape != self.shape:
+            raise ValueError(f"{self.field} has shape {array.shape} not {self.shape}")
+        return array[key]
+
+
+def open_vector_fields(
+    xml_path: esa_safe.PathOrFileType,
+    query: str,
+    schema_type: str,
+    fields: list[str],
+    shape: tuple[int, ...],
+    fs: fsspec.AbstractFileSystem | None = None,
+) -> dict[str, Any]:
+    """Return lazily loaded arrays of the vector fields of a tag.
+
+    The XML is decoded when the data of any of the arrays is first accessed.
+    """
+    loader = VectorFieldsLoader(xml_path, query, schema_type, fields, fs)
+    return {
+        field: indexing.LazilyIndexedArray(VectorFieldArray(loader, field, shape))
+        for field in fields
+    }
+
+
 def open_calibration_dataset(
-    calibration: esa_safe.PathType, attrs: dict[str, Any] = {}
+    calibration: esa_safe.PathOrFileType,
+    attrs: dict[str, Any] = {},
+    fs: fsspec.AbstractFileSystem | None = None,
+    lazy: bool = False,
 ) -> xr.Dataset:
-    calibration_vectors = esa_safe.parse_tag_as_list(
-        calibration, "//calibrationVector", "calibration"
-    )
-    cal_attrs = esa_safe.parse_tag(
-        calibration, "//calibrationInformation", "calibration"
-    )
-    attrs["absoluteCalibrationConstant"] = cal_attrs["absoluteCalibrationConstant"]
-    azimuth_time_list = []
-    pixel_list = []
-    line_list = []
-    sigmaNought_list = []
-    betaNought_list = []
-    gamma_list = []
-    dn_list = []
-    for vector in calibration_vectors:
-        azimuth_time_list.append(vector["azimuthTime"])
-        line_list.append(vector["line"])
-        pixel = np.fromstring(vector["pixel"]["$"], dtype=int, sep=" ")
-        pixel_list.append(pixel)
-        sigmaNought = np.fromstring(
-            vector["sigmaNought"]["$"], dtype=np.float32, sep=" "
+    """Open the calibration LUTs.
+
+    :param calibration: the calibration XML file, a path in `fs` if given
+    :param attrs: attributes of the dataset
+    :param fs: the fsspec filesystem of the calibration XML file
+    :param lazy: if True, the LUTs are decoded only when their data is accessed
+    """
+    query = "//calibrationVector"
+    lut_fields = ["sigmaNought", "betaNought", "gamma", "dn"]
+    with open_product_file(calibration, fs) as file:
+        calibration_vectors = esa_safe.parse_vector_tag(
+            file,
+            query,
+            "calibration",
+            fields=["azimuthTime", "line", "pixel"] if lazy else None,
         )
-        sigmaNought_list.append(sigmaNought)
-        betaNought = np.fromstring(vector["betaNought"]["$"], dtype=np.float32, sep=" ")
-        betaNought_list.append(betaNought)
-        gamma = np.fromstring(vector["gamma"]["$"], dtype=np.float32, sep=" ")
-        gamma_list.append(gamma)
-        dn = np.fromstring(vector["dn"]["$"], dtype=np.float32, sep=" ")
-        dn_list.append(dn)
-
-    pixel = np.array(pixel_list)
-    if (pixel - pixel[0]).any():
+        cal_attrs = esa_safe.parse_tag(file, "//calibrationInformation", "calibration")
+    attrs = attrs.copy()
+    attrs["absoluteCalibrationConstant"] = cal_attrs["absoluteCalibrationConstant"]
+
+    pixel = calibration_vectors["pixel"]
+    if (pixel != pixel[0]).any():
         raise ValueError(
             "Unable to organise calibration vectors in a regular line-pixel grid"
         )
-    data_vars = {
-        "azimuth_time": ("line", [np.datetime64(dt, "ns") for dt in azimuth_time_list]),
-        "sigmaNought": (("line", "pixel"), sigmaNought_list),
-        "betaNought": (("line", "pixel"), betaNought_list),
-        "gamma": (("line", "pixel"), gamma_list),
-        "dn": (("line", "pixel"), dn_list),
+    if lazy:
+        luts = open_vector_fields(
+            calibration, query, "calibration", lut_fields, pixel.shape, fs
+        )
+    else:
+        luts = calibration_vectors
+    data_vars: dict[str, Any] = {
+        "azimuth_time": ("line", calibration_vectors["azimuthTime"]),
     }
-    coords = {"line": line_list, "pixel": pixel_list[0]}
+    for field in lut_fields:
+        data_vars[field] = (("line", "pixel"), luts[field])
+    coords = {"line": calibration_vectors["line"], "pixel": pixel[0]}
 
     return xr.Dataset(data_vars=data_vars, coords=coords, attrs=attrs)
 
@@ -128,6 +207,7 @@ def open_reference_replica_dataset(
     reference_replica = esa_safe.parse_tag_as_list(
         annotation_path, "//replicaInformationList/replicaInformation/referenceReplica"
     )[0]
+    attrs = attrs.copy()
     attrs.update(
         {
             "azimuth_time": reference_replica["azimuthTime"],
@@ -159,69 +239,55 @@ def open_reference_replica_dataset(
 
 
 def open_antenna_pattern(
-    annotation_path: esa_safe.PathType, attrs: dict[str, Any] = {}
+    annotation_path: esa_safe.PathOrFileType,
+    attrs: dict[str, Any] = {},
+    fs: fsspec.AbstractFileSystem | None = None,
+    lazy: bool = False,
 ) -> xr.Dataset:
-    antenna_pattern_list = esa_safe.parse_tag_as_list(
-        annotation_path, "//antennaPattern/antennaPatternList/antennaPattern"
-    )
-
-    slant_range_time_list = []
-    azimuth_time_list = []
-    elevation_angle_list = []
-    elevation_pattern_list = []
-    incidence_angle_list = []
-    terrain_height_list = []
-    roll_list = []
-
-    for vector in antenna_pattern_list:
-        azimuth_time_list.append(vector["azimuthTime"])
-        slant_range_time = np.fromstring(
-            vector["slantRangeTime"]["$"], dtype=np.float32, sep=" "
-        )
-        slant_range_time_list.append(slant_range_time)
-
-        elevation_angle = np.fromstring(
-            vector["elevationAngle"]["$"], dtype=np.float32, sep=" "
-        )
-        elevation_angle_list.append(elevation_angle)
-
-        elevation_pattern = np.fromstring(
-            vector["elevationPattern"]["$"], dtype=np.float32, sep=" "
-        )
-        elevation_pattern_list.append(
-            elevation_pattern[::2] * 1j + elevation_pattern[1::2]
-        )
-
-        incidence_angle = np.fromstring(
-            vector["incidenceAngle"]["$"], dtype=np.float32, sep=" "
+    query = "//antennaPattern/antennaPatternList/antennaPattern"
+    angle_fields = ["elevationAngle", "incidenceAngle"]
+    with open_product_file(annotation_path, fs) as file:
+        antenna_patterns = esa_safe.parse_vector_tag(
+            file,
+            query,
+            fields=["azimuthTime", "slantRangeTime", "terrainHeight", "roll"]
+            if lazy
+            else None,
         )
-        incidence_angle_list.append(incidence_angle)
 
-        terrain_height_list.append(vector["terrainHeight"])
-        roll_list.append(vector["roll"])
-
-    slant_range_time_array = np.array(slant_range_time_list)
-    if (slant_range_time_array - slant_range_time_array[0]).any():
+    slant_range_time_array = antenna_patterns["slantRangeTime"]
+    if (slant_range_time_array != slant_range_time_array[0]).any():
         raise ValueError(
             "Unable to organise noise vectors in a regular line-pixel grid"
         )
+    if lazy:
+        angles = open_vector_fields(
+            annotation_path,
+            query,
+            "annotation",
+            angle_fields,
+            slant_range_time_array.shape,
+            fs,
+        )
+    else:
+        angles = antenna_patterns
     data_vars = {
         "elevationAngle": (
             ("azimuth_time", "slant_range_time"),
-            np.array(elevation_angle_list),
+            angles["elevationAngle"],
         ),
         # "elevationPattern": (
         #     ( "azimuth_time", "slant_range_time"), np.array(elevation_pattern_list)),
         "incidenceAngle": (
             ("azimuth_time", "slant_range_time"),
-            np.array(incidence_angle_list),
+            angles["incidenceAngle"],
         ),
-        "terrainHeight": ("azimuth_time", terrain_height_list),
-        "roll": ("azimuth_time", roll_list),
+        "terrainHeight": ("azimuth_time", antenna_patterns["terrainHeight"]),
+        "roll": ("azimuth_time", antenna_patterns["roll"]),
     }
     coords = {
         "slant_range_time": slant_range_time_array[0],
-        "azimuth_time": [np.datetime64(dt, "ns") for dt in azimuth_time_list],
+        "azimuth_time": antenna_patterns["azimuthTime"],
     }
     da = xr.Dataset(data_vars=data_vars, coords=coords, attrs=attrs)
     return da
@@ -306,34 +372,36 @@ def open_replica_dataset(
 
 
 def open_noise_range_dataset(
-    noise: esa_safe.PathType, attrs: dict[str, Any] = {}
+    noise: esa_safe.PathOrFileType,
+    attrs: dict[str, Any] = {},
+    fs: fsspec.AbstractFileSystem | None = None,
+    lazy: bool = False,
 ) -> xr.Dataset:
-    noise_vectors = esa_safe.parse_tag_as_list(noise, "//noiseRangeVector", "noise")
-
-    azimuth_time_list = []
-    pixel_list = []
-    line_list = []
-    noiseRangeLut_list = []
-    for vector in noise_vectors:
-        azimuth_time_list.append(vector["azimuthTime"])
-        line_list.append(vector["line"])
-        pixel = np.fromstring(vector["pixel"]["$"], dtype=int, sep=" ")
-        pixel_list.append(pixel)
-        noiseRangeLut = np.fromstring(
-            vector["noiseRangeLut"]["$"], dtype=np.float32, sep=" "
+    query = "//noiseRangeVector"
+    with open_product_file(noise, fs) as file:
+        noise_vectors = esa_safe.parse_vector_tag(
+            file,
+            query,
+            "noise",
+            fields=["azimuthTime", "line", "pixel"] if lazy else None,
         )
-        noiseRangeLut_list.append(noiseRangeLut)
 
-    pixel = np.array(pixel_list)
-    if (pixel - pixel[0]).any():
+    pixel = noise_vectors["pixel"]
+    if (pixel != pixel[0]).any():
         raise ValueError(
             "Unable to organise noise vectors in a regular line-pixel grid"
         )
+    if lazy:
+        luts = open_vector_fields(
+            noise, query, "noise", ["noiseRangeLut"], pixel.shape, fs
+        )
+    else:
+        luts = noise_vectors
     data_vars = {
-        "azimuth_time": ("line", [np.datetime64(dt, "ns") for dt in azimuth_time_list]),
-        "noiseRangeLut": (("line", "pixel"), noiseRangeLut_list),
+        "azimuth_time": ("line", noise_vectors["azimuthTime"]),
+        "noiseRangeLut": (("line", "pixel"), luts["noiseRangeLut"]),
     }
-    coords = {"line": line_list, "pixel": pixel_list[0]}
+    coords = {"line": noise_vectors["line"], "pixel": pixel[0]}
 
     return xr.Dataset(data_vars=data_vars, coords=coords, attrs=attrs)
 
@@ -365,6 +433,54 @@ def open_noise_azimuth_dataset(
     return xr.Dataset(data_vars=data_vars, coords=coords, attrs=attrs)
 
 
+def open_noise_azimuth_blocks_dataset(
+    noise: esa_safe.PathOrFileType,
+    attrs: dict[str, Any] = {},
+    fs: fsspec.AbstractFileSystem | None = None,
+) -> xr.Dataset:
+    """Open all the blocks of the azimuth noise LUT.
+
+    Each `block` is the rectangle of the image between the first and the last
+    azimuth line and range sample, the LUTs of all blocks are concatenated along
+    the `point` dimension and the LUT of block `k` starts at `offset[k]`.
+
+    :param noise: the noise XML file, a path in `fs` if given
+    :param attrs: attributes of the dataset
+    :param fs: the fsspec filesystem of the noise XML file
+    """
+    block_fields = [
+        "firstAzimuthLine",
+        "firstRangeSample",
+        "lastAzimuthLine",
+        "lastRangeSample",
+    ]
+    swaths: list[str] = []
+    blocks: list[list[str]] = []
+    lines: list[str] = []
+    luts: list[str] = []
+    with open_product_file(noise, fs) as file:
+        for element in esa_safe.iter_matching_elements(file, ("noiseAzimuthVector",)):
+            swaths.append(element.findtext("swath", ""))
+            blocks.append([element.findtext(field, "") for field in block_fields])
+            lines.append(element.findtext("line", ""))
+            luts.append(element.findtext("noiseAzimuthLut", ""))
+
+    line, offsets = esa_safe.parse_ragged_vectors(lines, "int64")
+    lut, lut_offsets = esa_safe.parse_ragged_vectors(luts, "float32")
+    if (offsets != lut_offsets).any():
+        raise ValueError("line and noiseAzimuthLut have different sizes")
+    block_values = np.array(blocks, dtype="int64").reshape(-1, len(block_fields))
+
+    data_vars: dict[str, Any] = {"swath": ("block", np.array(swaths, dtype=str))}
+    for field, values in zip(block_fields, block_values.T):
+        data_vars[field] = ("block", values)
+    data_vars["offset"] = ("block", offsets[:-1])
+    data_vars["line"] = ("point", line)
+    data_vars["noiseAzimuthLut"] = ("point", lut)
+
+    return xr.Dataset(data_vars=data_vars, attrs=attrs)
+
+
 def open_coordinate_conversion_dataset(
     annotation_path: esa_safe.PathType, attrs: dict[str, Any] = {}
 ) -> xr.Dataset:
@@ -419,37 +535,27 @@ def is_clockwise(poly: list[tuple[float, float]]) -> bool:
 def open_gcp_dataset(
     annotation: esa_safe.PathOrFileType, attrs: dict[str, Any] = {}
 ) -> xr.Dataset:
-    geolocation_grid_points = esa_safe.parse_tag_as_list(
+    geolocation_grid_points = esa_safe.parse_vector_tag(
         annotation, "//geolocationGridPoint"
     )
 
-    azimuth_time = []
-    slant_range_time = []
-    line_set = set()
-    pixel_set = set()
-    for ggp in geolocation_grid_points:
-        if ggp["line"] not in line_set:
-            azimuth_time.append(np.datetime64(ggp["azimuthTime"], "ns"))
-            line_set.add(ggp["line"])
-        if ggp["pixel"] not in pixel_set:
-            slant_range_time.append(ggp["slantRangeTime"])
-            pixel_set.add(ggp["pixel"])
-    shape = (len(azimuth_time), len(slant_range_time))
+    # the grid axes are the sorted unique lines and pixels, every point is placed
+    #   in the grid via the inverse indices
+    line, line_index, j = np.unique(
+        geolocation_grid_points["line"], return_index=True, return_inverse=True
+    )
+    pixel, pixel_index, i = np.unique(
+        geolocation_grid_points["pixel"], return_index=True, return_inverse=True
+    )
+    azimuth_time = geolocation_grid_points["azimuthTime"][line_index]
+    slant_range_time = geolocation_grid_points["slantRangeTime"][pixel_index]
+    shape = (line.size, pixel.size)
     dims = ("azimuth_time", "slant_range_time")
-    data_vars = {
-        "latitude": (dims, np.full(shape, np.nan), attrs),
-        "longitude": (dims, np.full(shape, np.nan), attrs),
-        "height": (dims, np.full(shape, np.nan), attrs),
-        "incidenceAngle": (dims, np.full(shape, np.nan), attrs),
-        "elevationAngle": (dims, np.full(shape, np.nan), attrs),
-    }
-    line = sorted(line_set)
-    pixel = sorted(pixel_set)
-    for ggp in geolocation_grid_points:
-        for var in data_vars:
-            j = line.index(ggp["line"])
-            i = pixel.index(ggp["pixel"])
-            data_vars[var][1][j, i] = ggp[var]
+    data_vars = {}
+    for var in GCP_VARIABLES:
+        data = np.full(shape, np.nan)
+        data[j.ravel(), i.ravel()] = geolocation_grid_points[var]
+        data_vars[var] = (dims, data, attrs)
 
     ds = xr.Dataset(
         data_vars=data_vars,
@@ -476,35 +582,54 @@ def get_footprint_linestring(
     method: xr.core.types.InterpOptions = "linear",
     kwargs: dict[str, Any] = {"fill_value": "extrapolate"},
 ) -> list[tuple[float, float]]:
-    azimuth_time_mm = [azimuth_time.min(), azimuth_time.max()]
-    slant_range_time_mm = [slant_range_time.min(), slant_range_time.max()]
-
-    footprint = []
-    for j, i in [(0, 0), (1, 0), (1, 1), (0, 1)]:
-        lat_array = gcp["latitude"].interp(
-            azimuth_time=azimuth_time_mm[j],
-            slant_range_time=slant_range_time_mm[i],
-            method=method,
-            kwargs=kwargs,
-        )
-        lat = round(lat_array.item(), 6)
-        lon_array = gcp["longitude"].interp(
-            azimuth_time=azimuth_time_mm[j],
-            slant_range_time=slant_range_time_mm[i],
-            method=method,
-            kwargs=kwargs,
-        )
-        lon = round(lon_array.item(), 6)
-        footprint.append((lon, lat))
+    azimuth_time_bounds = [[azimuth_time.values.min(), azimuth_time.values.max()]]
+    slant_range_time_bounds = [
+        slant_range_time.values.min(),
+        slant_range_time.values.max(),
+    ]
+    return get_footprint_linestrings(
+        azimuth_time_bounds, slant_range_time_bounds, gcp, method, kwargs
+    )[0]
 
-    # check that the poly as the correct orientation
-    if is_clockwise(footprint):
-        footprint = footprint[::-1]
 
-    # close the polygon
-    footprint.append(footprint[0])
+def get_footprint_linestrings(
+    azimuth_time_bounds: npt.ArrayLike,
+    slant_range_time_bounds: npt.ArrayLike,
+    gcp: xr.Dataset,
+    method: xr.core.types.InterpOptions = "linear",
+    kwargs: dict[str, Any] = {"fill_value": "extrapolate"},
+) -> list[list[tuple[float, float]]]:
+    """Return the footprints of many images with the same slant range extent.
 
-    return footprint
+    The corners of all the footprints are interpolated in the GCP grid at once.
+
+    :param azimuth_time_bounds: the first and the last azimuth time of every
+        image, an array of shape (N, 2)
+    :param slant_range_time_bounds: the first and the last slant range time
+    :param gcp: the GCP dataset, see `open_gcp_dataset`
+    """
+    azimuth_time_bounds = np.asarray(azimuth_time_bounds)
+    corners = gcp[["latitude", "longitude"]].interp(
+        azimuth_time=azimuth_time_bounds.ravel(),
+        slant_range_time=np.asarray(slant_range_time_bounds),
+        method=method,
+        kwargs=kwargs,
+    )
+    corners = corners.transpose("azimuth_time", "slant_range_time")
+    lat = corners.latitude.values.reshape(-1, 2, 2)
+    lon = corners.longitude.values.reshape(-1, 2, 2)
+
+    footprints = []
+    for k in range(lat.shape[0]):
+        footprint = [
+            (round(float(lon[k, j, i]), 6), round(float(lat[k, j, i]), 6))
+            for j, i in [(0, 0), (1, 0), (1, 1), (0, 1)]
+        ]
+        if is_clockwise(footprint):
+            footprint = footprint[::-1]
+        footprint.append(footprint[0])
+        footprints.append(footprint)
+    return footprints
 
 
 def make_geospatial_attributes(
@@ -570,31 +695,19 @@ def make_orbit(
 def open_orbit_dataset(
     annotation: esa_safe.PathOrFileType, attrs: dict[str, Any] = {}
 ) -> xr.Dataset:
-    orbits = esa_safe.parse_tag_as_list(annotation, "//orbit")
+    orbits = esa_safe.parse_vector_tag(annotation, "//orbit")
 
     attrs = attrs.copy()
-    reference_system = orbits[0]["frame"]
+    reference_system = orbits["frame"][0]
     if reference_system is not None:
         attrs.update({"reference_system": reference_system})
+    if (orbits["frame"] != reference_system).any():
+        warnings.warn("reference_system is not consistent in all the state vectors. ")
 
-    azimuth_times: list[Any] = []
-    positions: list[list[Any]] = [[], [], []]
-    velocities: list[list[Any]] = [[], [], []]
-    for orbit in orbits:
-        azimuth_times.append(orbit["time"])
-        positions[0].append(orbit["position"]["x"])
-        positions[1].append(orbit["position"]["y"])
-        positions[2].append(orbit["position"]["z"])
-        velocities[0].append(orbit["velocity"]["x"])
-        velocities[1].append(orbit["velocity"]["y"])
-        velocities[2].append(orbit["velocity"]["z"])
-        if orbit["frame"] != reference_system:
-            warnings.warn(
-                "reference_system is not consistent in all the state vectors. "
-            )
-            reference_system = None
+    positions = [orbits["position/x"], orbits["position/y"], orbits["position/z"]]
+    velocities = [orbits["velocity/x"], orbits["velocity/y"], orbits["velocity/z"]]
 
-    return make_orbit(azimuth_times, positions, velocities, attrs)
+    return make_orbit(orbits["time"], positions, velocities, attrs)
 
 
 def open_dc_estimate_dataset(
@@ -699,6 +812,33 @@ def open_azimuth_fm_rate_dataset(
     return ds
 
 
+def normalise_fs_path(path: str, fs: fsspec.AbstractFileSystem) -> str:
+    """Return the normalised path without the protocol of the filesystem."""
+    return posixpath.normpath(
+        str(fsspec.core.strip_protocol(fs.unstrip_protocol(path)))
+    )
+
+
+def list_product_files(
+    product_path: str, fs: fsspec.AbstractFileSystem
+) -> frozenset[str] | None:
+    """Return the paths of all the files of a product with a single listing.
+
+    On object storage the recursive listing of the product prefix is one request,
+    instead of one request per file. The listing is not cached across calls, so that
+    files deleted or replaced in the product subdirectories are always detected.
+    Return None if the filesystem cannot list the product.
+    """
+    try:
+        paths = fs.find(product_path)
+    except (OSError, NotImplementedError):
+        return None
+    # the manifest is always there, so an empty listing means it is not supported
+    if len(paths) == 0:
+        return None
+    return frozenset(normalise_fs_path(path, fs) for path in paths)
+
+
 def find_available_groups(
     product_files: dict[str, tuple[str, str, str, str, str]],
     product_path: str,
@@ -706,12 +846,21 @@ def find_available_groups(
     check_files_exist: bool = False,
     fs: fsspec.AbstractFileSystem = fsspec.filesystem("file"),
 ) -> dict[str, list[str]]:
+    existing_files = None
+    if check_files_exist:
+        existing_files = list_product_files(product_path, fs)
+    # the paths in the listing of the product are all inside its directory
+    listed_prefix = normalise_fs_path(product_path, fs).rstrip("/") + "/"
     groups: dict[str, list[str]] = {}
     for path, (type, _, swath, polarization, _) in product_files.items():
         swath_pol_group = f"{swath}/{polarization}".upper()
         abspath = os.path.join(product_path, os.path.normpath(path))
         if check_files_exist:
-            if not fs.exists(abspath):
+            normalised_path = normalise_fs_path(abspath, fs)
+            if existing_files is None or not normalised_path.startswith(listed_prefix):
+                if not fs.exists(abspath):
+                    continue
+            elif normalised_path not in existing_files:
                 continue
         if type == "s1Level1ProductSchema":
             groups[swath.upper()] = [""]
@@ -747,6 +896,9 @@ def open_rasterio_dataarray(
     fs: fsspec.AbstractFileSystem | None,
     chunks: dict[str, int] | None,
 ) -> xr.DataArray:
+    # GDAL is only loaded when a measurement is opened
+    import rasterio
+
     # fsspec needs rasterio >= 1.3.0, but we allow earlier rasterio versions for local files
     if fs is None or isinstance(fs, fsspec.implementations.local.LocalFileSystem):
         try:
@@ -766,6 +918,43 @@ def open_rasterio_dataarray(
     return arr
 
 
+def auto_rasterio_chunks(
+    shape: tuple[int, int],
+    block_shape: tuple[int, int],
+    itemsize: int,
+    lines_per_burst: int | None = None,
+    target_bytes: int | None = None,
+) -> dict[str, int]:
+    """Return the rasterio chunks of a measurement aligned to bursts and blocks.
+
+    The line chunks are a multiple of `lines_per_burst`, or of the block lines
+    when there are no bursts, so every burst is a whole chunk. The pixel chunks
+    are a multiple of the block width, that is the full width of stripped files.
+    As many bursts or blocks as fit in `target_bytes` are put in every chunk,
+    but a chunk never holds less than one burst.
+
+    :param shape: number of lines and pixels of the image
+    :param block_shape: number of lines and pixels of the TIFF strips or tiles
+    :param itemsize: size in bytes of the image data type
+    :param lines_per_burst: number of lines of every burst of TOPS products
+    :param target_bytes: chunk size in bytes, defaults to dask `array.chunk-size`
+    """
+    if target_bytes is None:
+        import dask
+        import dask.utils
+
+        target_bytes = dask.utils.parse_bytes(dask.config.get("array.chunk-size"))
+    lines, pixels = shape
+    block_lines, block_pixels = block_shape
+    line_step = lines_per_burst or block_lines
+
+    x = pixels
+    if block_pixels < pixels:
+        x = max(1, target_bytes // (line_step * block_pixels * itemsize)) * block_pixels
+    y = max(1, target_bytes // (line_step * min(x, pixels) * itemsize)) * line_step
+    return {"y": min(y, lines), "x": min(x, pixels)}
+
+
 def make_azimuth_time(
     product_first_line_utc_time: str,
     product_last_line_utc_time: str,
@@ -780,17 +969,87 @@ def make_azimuth_time(
     return np.array(azimuth_time.values, dtype="datetime64[ns]")
 
 
+def make_lazy_coords(
+    tags: dict[str, Any], line_dim: str = "line", pixel_dim: str = "pixel"
+) -> xr.Coordinates:
+    """Return the azimuth time and the range coordinates of a measurement.
+
+    The coordinates are computed on demand by a `indexes.SwathIndex`, their values
+    are the same as the ones of the coordinates of `open_pol_dataset`.
+
+    :param tags: the `//productInformation`, `//imageInformation` and
+        `//swathTiming` tags of the annotation, see `esa_safe.parse_tags`
+    """
+    product_information = tags["//productInformation"]
+    image_information = tags["//imageInformation"]
+    swath_timing = tags["//swathTiming"]
+    number_of_lines = image_information["numberOfLines"]
+    number_of_samples = image_information["numberOfSamples"]
+
+    if swath_timing["burstList"]["@count"] == 0:
+        # the same rounding as `make_azimuth_time`
+        first = pd.Timestamp(image_information["productFirstLineUtcTime"])
+        last = pd.Timestamp(image_information["productLastLineUtcTime"])
+        resolution = pd.Timedelta(1, unit=first.unit).value
+        duration = (last.value - first.value) // resolution
+        step = duration / max(number_of_lines - 1, 1)
+        azimuth_time_transform = indexes.AzimuthTimeTransform(
+            [0],
+            [0],
+            [first.as_unit("ns").to_datetime64()],
+            step,
+            number_of_lines,
+            dim=line_dim,
+            resolution=resolution,
+        )
+    else:
+        interval = image_information["azimuthTimeInterval"]
+        burst_start = [
+            pd.Timestamp(burst["azimuthTime"]).as_unit("ns").to_datetime64()
+            for burst in swath_timing["burstList"]["burst"]
+        ]
+        azimuth_time_transform = indexes.AzimuthTimeTransform.from_bursts(
+            burst_start,
+            swath_timing["linesPerBurst"],
+            pd.Timedelta(interval * 10**9, unit="ns").value,
+            number_of_lines,
+            dim=line_dim,
+        )
+
+    if product_information["projection"] == "Slant Range":
+        start = image_information["slantRangeTime"]
+        stop = (
+            start + (number_of_samples - 1) / product_information["rangeSamplingRate"]
+        )
+        range_name = "slant_range_time"
+    else:
+        start = 0
+        stop = image_information["rangePixelSpacing"] * (number_of_samples - 1)
+        range_name = "ground_range"
+    range_transform = indexes.LinspaceTransform(
+        start, stop, number_of_samples, range_name, pixel_dim
+    )
+
+    coords = xr.Coordinates.from_xindex(indexes.SwathIndex(azimuth_time_transform))
+    coords.update(xr.Coordinates.from_xindex(indexes.SwathIndex(range_transform)))
+    return coords
+
+
 def open_pol_dataset(
     measurement: esa_safe.PathOrFileType,
     annotation: esa_safe.PathOrFileType,
     fs: fsspec.AbstractFileSystem | None = None,
     attrs: dict[str, Any] = {},
     gcp: xr.Dataset | None = None,
-    rasterio_chunks: dict[str, int] | None = None,
+    rasterio_chunks: dict[str, int] | str | None = None,
+    lazy_coords: bool = False,
 ) -> xr.Dataset:
-    product_information = esa_safe.parse_tag(annotation, "//productInformation")
-    image_information = esa_safe.parse_tag(annotation, "//imageInformation")
-    swath_timing = esa_safe.parse_tag(annotation, "//swathTiming")
+    tags = esa_safe.parse_tags(
+        annotation, ["//productInformation", "//imageInformation", "//swathTiming"]
+    )
+    product_information = tags["//productInformation"]
+    image_information = tags["//imageInformation"]
+    swath_timing = tags["//swathTiming"]
 
     number_of_samples = image_information["numberOfSamples"]
     range_sampling_rate = product_information["rangeSamplingRate"]
@@ -827,7 +1086,8 @@ def open_pol_dataset(
         if rasterio_chunks is None:
             rasterio_chunks = {}
     except ModuleNotFoundError:
-        pass
+        if rasterio_chunks == "auto":
+            rasterio_chunks = None
 
     azimuth_time = make_azimuth_time(
         product_first_line_utc_time,
@@ -850,7 +1110,8 @@ def open_pol_dataset(
                 "lines_per_burst": lines_per_burst,
             }
         )
-        for burst_index, burst in enumerate(swath_timing["burstList"]["burst"]):
+        bursts = [] if lazy_coords else swath_timing["burstList"]["burst"]
+        for burst_index, burst in enumerate(bursts):
             first_azimuth_time_burst = burst["azimuthTime"]
             azimuth_time_burst = pd.date_range(
                 start=first_azimuth_time_burst,
@@ -870,7 +1131,11 @@ def open_pol_dataset(
         "azimuth_time": ("line", azimuth_time),
     }
 
-    if product_information["projection"] == "Slant Range":
+    if lazy_coords:
+        coords.pop("azimuth_time")
+        if product_information["projection"] == "Ground Range":
+            swap_dims = {"line": "azimuth_time", "pixel": "ground_range"}
+    elif product_information["projection"] == "Slant Range":
         slant_range_time = np.linspace(
             image_slant_range_time,
             image_slant_range_time + (number_of_samples - 1) / range_sampling_rate,
@@ -893,6 +1158,19 @@ def open_pol_dataset(
     else:
         raise ValueError(f"unknown projection {product_information['projection']}")
 
+    if rasterio_chunks == "auto":
+        # opening the TIFF without dask only reads its header
+        header = open_rasterio_dataarray(measurement, fs, None)
+        block_chunks = header.encoding["preferred_chunks"]
+        rasterio_chunks = auto_rasterio_chunks(
+            (header.sizes["y"], header.sizes["x"]),
+            (block_chunks["y"], block_chunks["x"]),
+            header.dtype.itemsize,
+            lines_per_burst=attrs.get("lines_per_burst"),
+        )
+    elif isinstance(rasterio_chunks, str):
+        raise ValueError(f"invalid rasterio_chunks {rasterio_chunks!r}")
+
     arr = open_rasterio_dataarray(measurement, fs, rasterio_chunks)
 
     preferred_chunks = arr.encoding["preferred_chunks"]
@@ -900,9 +1178,23 @@ def open_pol_dataset(
     arr.encoding.clear()
 
     arr = arr.squeeze("band").drop_vars(["band", "spatial_ref"])
-    arr = arr.rename({"y": "line", "x": "pixel"})
-    arr = arr.assign_coords(coords)
-    arr = arr.swap_dims(swap_dims)
+    if lazy_coords:
+        line_dim = swap_dims.get("line", "line")
+        pixel_dim = swap_dims.get("pixel", "pixel")
+        arr = arr.drop_vars(["y", "x"]).rename({"y": line_dim, "x": pixel_dim})
+        arr = arr.assign_coords(
+            line=(line_dim, coords["line"]), pixel=(pixel_dim, coords["pixel"])
+        )
+        arr = arr.assign_coords(
+            make_lazy_coords(tags, line_dim=line_dim, pixel_dim=pixel_dim)
+        )
+        for name in ("slant_range_time", "ground_range"):
+            if name in arr.coords:
+                arr.coords[name].encoding["_FillValue"] = None
+    else:
+        arr = arr.rename({"y": "line", "x": "pixel"})
+        arr = arr.assign_coords(coords)
+        arr = arr.swap_dims(swap_dims)
 
     # setting the preferred_chunks for the output to the current arr chunks
     if rasterio_chunks is None:
@@ -922,26 +1214,87 @@ def open_pol_dataset(
     return xr.Dataset(attrs=attrs, data_vars={"measurement": arr})
 
 
+def burst_anx_times(
+    pol_dataset: DataArrayOrDataset, use_center: bool = False
+) -> npt.NDArray[np.timedelta64]:
+    """Return the azimuth anx time of the first line of every burst.
+
+    :param xr.Dataset pol_dataset: measurement dataset
+    :param bool use_center: If `True`, return the azimuth anx time of the burst
+    centers instead of the first lines
+    """
+    lines_per_burst = pol_dataset.attrs["lines_per_burst"]
+    anx_datetime = np.datetime64(pol_dataset.attrs["ascending_node_time"], "ns")
+    start = lines_per_burst // 2 if use_center else 0
+    azimuth_time = pol_dataset.azimuth_time[start::lines_per_burst].values
+    anx_times: npt.NDArray[np.timedelta64] = (
+        azimuth_time.astype("datetime64[ns]") - anx_datetime
+    )
+    return anx_times
+
+
+def find_bursts_indexes(
+    pol_dataset: DataArrayOrDataset,
+    azimuth_anx_seconds: npt.ArrayLike,
+    use_center: bool = False,
+) -> npt.NDArray[np.intp]:
+    """Return the index of the burst nearest to each of the azimuth anx times.
+
+    The burst azimuth anx times are computed once and all the queries are resolved
+    with a single `searchsorted`, ties go to the earlier burst like in `find_bursts_index`.
+
+    :param xr.Dataset pol_dataset: measurement dataset
+    :param azimuth_anx_seconds: azimuth anx times in seconds
+    :param bool use_center: If `True`, it uses the azimuth anx times as a reference for
+    the burst centers instead of the first lines
+    """
+    anx_times = burst_anx_times(pol_dataset, use_center=use_center).astype(np.int64)
+    seconds = np.asarray(azimuth_anx_seconds, dtype=np.float64)
+    queries = (seconds * 10**9).astype(np.int64)
+    after = np.searchsorted(anx_times, queries).clip(0, anx_times.size - 1)
+    before = (after - 1).clip(0)
+    is_after = abs(anx_times[after] - queries) < abs(anx_times[before] - queries)
+    return np.where(is_after, after, before)
+
+
 def find_bursts_index(
     pol_dataset: DataArrayOrDataset,
     azimuth_anx_seconds: float,
     use_center: bool = False,
 ) -> int:
-    lines_per_burst = pol_dataset.attrs["lines_per_burst"]
-    anx_datetime = np.datetime64(pol_dataset.attrs["ascending_node_time"], "ns")
-    azimuth_anx_time = pd.Timedelta(int(azimuth_anx_seconds * 10**9), unit="ns")
-    if use_center:
-        azimuth_anx_time_center = (
-            pol_dataset.azimuth_time[lines_per_burst // 2 :: lines_per_burst]
-            - anx_datetime
+    return find_bursts_indexes(
+        pol_dataset, azimuth_anx_seconds, use_center=use_center
+    ).item()
+
+
+def find_burst_ids_indexes(
+    pol_dataset: DataArrayOrDataset, burst_ids: npt.ArrayLike
+) -> npt.NDArray[np.intp]:
+    """Return the index of each of the relative burst ids in the measurement dataset.
+
+    :param xr.Dataset pol_dataset: measurement dataset
+    :param burst_ids: relative burst ids to look up
+    """
+    product_burst_ids = pol_dataset.attrs.get("burst_ids")
+    if product_burst_ids is None:
+        raise TypeError(
+            "'burst_ids' list can't be found in product attributes, "
+            "probably Sentinel-1 IPF processor version is older than 3.40"
         )
-        distance = abs(azimuth_anx_time_center - azimuth_anx_time)
-    else:
-        azimuth_anx_time_first_line = (
-            pol_dataset.azimuth_time[::lines_per_burst] - anx_datetime
+    product_burst_ids = np.asarray(product_burst_ids)
+    queries = np.asarray(burst_ids)
+    order = np.argsort(product_burst_ids, kind="stable")
+    sorted_burst_ids = product_burst_ids[order]
+    positions = np.searchsorted(sorted_burst_ids, queries)
+    positions = positions.clip(0, sorted_burst_ids.size - 1)
+    found = sorted_burst_ids[positions] == queries
+    if not np.all(found):
+        burst_id = queries[~found].tolist()
+        raise KeyError(
+            f"{burst_id=} not found in product burst_ids={product_burst_ids.tolist()}"
         )
-        distance = abs(azimuth_anx_time_first_line - azimuth_anx_time)
-    return np.argmin(distance.data).item()
+    burst_indexes: npt.NDArray[np.intp] = order[positions]
+    return burst_indexes
 
 
 def crop_burst_dataset(
@@ -981,16 +1334,7 @@ def crop_burst_dataset(
                 pol_dataset, azimuth_anx_time, use_center=use_center
             )
         elif burst_id is not None:
-            burst_ids = pol_dataset.attrs.get("burst_ids")
-            if burst_ids is None:
-                raise TypeError(
-                    "'burst_ids' list can't be found in product attributes, "
-                    "probably Sentinel-1 IPF processor version is older than 3.40"
-                )
-            try:
-                burst_index = burst_ids.index(burst_id)
-            except ValueError:
-                raise KeyError(f"{burst_id=} not found in product {burst_ids=}")
+            burst_index = find_burst_ids_indexes(pol_dataset, burst_id).item()
         else:
             raise TypeError(
                 "one keyword between 'burst_index' and 'azimuth_anx_time' must be defined"
@@ -1006,6 +1350,7 @@ def crop_burst_dataset(
         )
     )
 
+    ds = indexes.drop_swath_indexes(ds)
     ds = ds.swap_dims({"line": "azimuth_time", "pixel": "slant_range_time"})
 
     anx_datetime = np.datetime64(pol_dataset.attrs["ascending_node_time"], "ns")
@@ -1026,14 +1371,335 @@ def crop_burst_dataset(
     return ds
 
 
+def iter_bursts(
+    pol_dataset: DataArrayOrDataset, gcp: xr.Dataset | None = None
+) -> Iterator[DataArrayOrDataset]:
+    """Yield all the bursts of a swath, see `crop_burst_dataset`.
+
+    :param pol_dataset: measurement dataset
+    :param gcp: if not None, the footprints of all the bursts are computed at
+        once from the GCP dataset and set as geospatial attributes
+    """
+    number_of_bursts = pol_dataset.attrs["number_of_bursts"]
+    footprints = None
+    if gcp is not None:
+        lines_per_burst = pol_dataset.attrs["lines_per_burst"]
+        azimuth_time = pol_dataset.azimuth_time.values
+        azimuth_time = azimuth_time[: number_of_bursts * lines_per_burst]
+        azimuth_time = azimuth_time.reshape(number_of_bursts, lines_per_burst)
+        slant_range_time = pol_dataset.slant_range_time.values
+        footprints = get_footprint_linestrings(
+            np.stack([azimuth_time.min(axis=1), azimuth_time.max(axis=1)], axis=1),
+            [slant_range_time.min(), slant_range_time.max()],
+            gcp,
+        )
+    for burst_index in range(number_of_bursts):
+        burst = crop_burst_dataset(pol_dataset, burst_index=burst_index)
+        if footprints is not None:
+            burst.attrs.update(make_geospatial_attributes(footprints[burst_index]))
+        yield burst
+
+
 def mosaic_slc_iw(
     slc_iw_image: DataArrayOrDataset, crop: int = 90
 ) -> DataArrayOrDataset:
-    bursts = []
-    for i in range(slc_iw_image.attrs["number_of_bursts"]):
-        burst = crop_burst_dataset(slc_iw_image, burst_index=i)
-        bursts.append(burst.isel(azimuth_time=slice(crop, -crop)))
-    return xr.concat(bursts, dim="azimuth_time")
+    """Return the bursts of a TOPS SLC image stacked along `azimuth_time`.
+
+    The first and the last `crop` lines of every burst are dropped. The kept lines
+    of each burst are a single slice of the image, so only the chunks and the
+    lines that are kept are ever read.
+
+    :param slc_iw_image: measurement dataset or data array of an IW or EW swath
+    :param crop: number of lines dropped at the start and at the end of every burst
+    """
+    lines_per_burst = slc_iw_image.attrs["lines_per_burst"]
+    number_of_bursts = slc_iw_image.attrs["number_of_bursts"]
+    starts = np.arange(number_of_bursts) * lines_per_burst + crop
+    stops = starts + lines_per_burst - 2 * crop
+    image = indexes.drop_swath_indexes(slc_iw_image)
+    bursts = [image.isel(line=slice(a, b)) for a, b in zip(starts, stops)]
+    # the bursts share all the other coordinates, there is nothing to compare
+    mosaic = xr.concat(
+        bursts,
+        dim="line",
+        coords="minimal",
+        compat="override",
+        join="override",
+        combine_attrs="override",
+    )
+    mosaic = mosaic.swap_dims({"line": "azimuth_time", "pixel": "slant_range_time"})
+    mosaic.attrs = crop_burst_dataset(slc_iw_image, burst_index=0).attrs
+    return mosaic
+
+
+def deburst_line_index(
+    azimuth_time: npt.NDArray[np.datetime64],
+    lines_per_burst: int,
+    grid_time: npt.NDArray[np.datetime64],
+) -> npt.NDArray[np.intp]:
+    """Return the line of a TOPS swath that is closest to every time of a grid.
+
+    Consecutive bursts are cut at the middle of their overlap, the index is -1
+    for the times outside the first and the last burst.
+
+    :param azimuth_time: the azimuth time of every line of the swath
+    :param lines_per_burst: the number of lines of every burst
+    :param grid_time: the azimuth times of the output lines
+    """
+    time = azimuth_time.astype("datetime64[ns]").astype(np.int64)
+    grid = grid_time.astype("datetime64[ns]").astype(np.int64)
+    burst_start = time[::lines_per_burst]
+    burst_stop = time[lines_per_burst - 1 :: lines_per_burst]
+    cut = (burst_stop[:-1] + burst_start[1:]) // 2
+    burst = np.searchsorted(cut, grid, side="right")
+    interval = (burst_stop[0] - burst_start[0]) / (lines_per_burst - 1)
+    offset = np.rint((grid - burst_start[burst]) / interval).astype(np.intp)
+    index: npt.NDArray[np.intp] = burst * lines_per_burst + offset
+    index[(offset < 0) | (offset >= lines_per_burst)] = -1
+    return index
+
+
+def isel_runs(
+    obj: DataArrayOrDataset, dim: str, index: npt.NDArray[np.intp]
+) -> DataArrayOrDataset:
+    """Select the positions in `index` along `dim`, a -1 selects a missing value.
+
+    Every run of consecutive positions is selected with a slice, so it maps onto
+    the chunks of `obj` without reading the positions that are not selected.
+    """
+    valid = index >= 0
+    jumps = (np.diff(index) != 1) & valid[1:]
+    breaks = np.flatnonzero(jumps | (valid[1:] != valid[:-1])) + 1
+    pieces: list[DataArrayOrDataset] = []
+    leading = 0
+    for run in np.split(np.arange(index.size), breaks):
+        if run.size == 0:
+            continue
+        if valid[run[0]]:
+            start = index[run[0]]
+            piece = obj.isel({dim: slice(start, start + run.size)})
+            if leading:
+                piece = piece.pad({dim: (leading, 0)})
+                leading = 0
+            pieces.append(piece)
+        elif pieces:
+            # missing values are padded to the neighbouring runs
+            pieces[-1] = pieces[-1].pad({dim: (0, run.size)})
+        else:
+            leading += run.size
+    if not pieces:
+        raise ValueError(f"no valid position in index along {dim=}")
+    return xr.concat(
+        pieces,
+        dim=dim,
+        coords="minimal",
+        compat="override",
+        join="override",
+        combine_attrs="override",
+    )
+
+
+def merge_slc_iw(
+    slc_iw_images: Sequence[DataArrayOrDataset],
+) -> DataArrayOrDataset:
+    """Return the debursted image of all the swaths of a TOPS SLC product.
+
+    The output is on a regular azimuth time and slant range time grid that covers
+    all the swaths. Bursts are cut at the middle of their azimuth overlap and the
+    swaths at the middle of their range overlap, the times outside all the swaths
+    are missing values. Every swath is selected with a few slices of its image,
+    so the chunks of the output read directly from the measurement files.
+
+    :param slc_iw_images: measurement datasets or data arrays of the swaths, for
+        example the `IW1/VV`, `IW2/VV` and `IW3/VV` groups of an IW SLC product
+    """
+    images = sorted(slc_iw_images, key=lambda image: float(image.slant_range_time[0]))
+    reference = images[0]
+    azimuth_time_interval = reference.attrs["azimuth_time_interval"]
+    range_interval = 1 / reference.attrs["range_sampling_rate"]
+
+    start_time = min(image.azimuth_time.values[0] for image in images)
+    stop_time = max(image.azimuth_time.values[-1] for image in images)
+    number_of_lines = int(
+        np.rint((stop_time - start_time) / ONE_SECOND / azimuth_time_interval) + 1
+    )
+    line_time = np.arange(number_of_lines) * azimuth_time_interval * 10**9
+    azimuth_time = start_time + line_time.round().astype("timedelta64[ns]")
+
+    # the first and the last sample of every swath and the range cuts on the grid
+    start_range = float(reference.slant_range_time[0])
+    first_samples = [
+        int(np.rint((image.slant_range_time.values[0] - start_range) / range_interval))
+        for image in images
+    ]
+    last_samples = [
+        first_sample + image.sizes["pixel"] - 1
+        for first_sample, image in zip(first_samples, images)
+    ]
+    if any(a < b for a, b in zip(last_samples, first_samples[1:])):
+        raise ValueError("the swaths do not overlap in slant range")
+    cuts = [0]
+    cuts += [(a + b) // 2 + 1 for a, b in zip(last_samples, first_samples[1:])]
+    cuts += [last_samples[-1] + 1]
+    slant_range_time = start_range + np.arange(cuts[-1]) * range_interval
+
+    swaths = []
+    for image, first_sample, start, stop in zip(images, first_samples, cuts, cuts[1:]):
+        line_index = deburst_line_index(
+            image.azimuth_time.values, image.attrs["lines_per_burst"], azimuth_time
+        )
+        image = image.drop_vars(list(image.coords))
+        image = image.isel(pixel=slice(start - first_sample, stop - first_sample))
+        swaths.append(isel_runs(image, "line", line_index))
+    merged = xr.concat(swaths, dim="pixel", combine_attrs="drop_conflicts")
+    merged = merged.rename({"line": "azimuth_time", "pixel": "slant_range_time"})
+    merged = merged.assign_coords(
+        azimuth_time=azimuth_time, slant_range_time=slant_range_time
+    )
+    for name in ["number_of_bursts", "lines_per_burst", "burst_ids", "subgroups"]:
+        merged.attrs.pop(name, None)
+    return merged
+
+
+BILINEAR_STRIP_SIZE = 1024 * 1024
+
+
+def linear_weights(
+    grid: npt.NDArray[Any], x: npt.NDArray[Any]
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+    """Return the index of the left grid node and the weight of the right one.
+
+    The weight is NaN for the points outside the grid.
+    """
+    index = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, grid.size - 2)
+    left = grid[index]
+    weight = (x - left) / (grid[index + 1] - left)
+    weight[(x < grid[0]) | (x > grid[-1])] = np.nan
+    return index, weight
+
+
+def bilinear_interpolate(
+    line: npt.NDArray[Any],
+    pixel: npt.NDArray[Any],
+    lut: npt.NDArray[Any],
+    lut_line: npt.NDArray[Any],
+    lut_pixel: npt.NDArray[Any],
+    dtype: npt.DTypeLike = np.float32,
+) -> npt.NDArray[Any]:
+    """Interpolate a LUT on a sparse line-pixel grid on the line x pixel grid.
+
+    The interpolation is separable: the LUT is first interpolated along the lines
+    on its own pixels and then along the pixels, so the only full-size
+    array is the output of type `dtype`.
+    Points outside the LUT grid are NaN.
+    """
+    # apply_ufunc passes the coordinates broadcast against each other
+    i, wi = linear_weights(lut_line, np.ravel(line))
+    j, wj = linear_weights(lut_pixel, np.ravel(pixel))
+    rows = lut[i] * (1.0 - wi[:, None]) + lut[i + 1] * wi[:, None]
+    rows = rows.astype(dtype, copy=False)
+    left_weight = (1.0 - wj).astype(dtype)
+    right_weight = wj.astype(dtype)
+    out = np.empty((i.size, j.size), dtype=dtype)
+    # the right node values are gathered in strips to bound the temporary size
+    strip_size = max(1, BILINEAR_STRIP_SIZE // max(j.size, 1))
+    for start in range(0, i.size, strip_size):
+        strip = slice(start, start + strip_size)
+        np.take(rows[strip], j, axis=1, out=out[strip])
+        out[strip] *= left_weight
+        right = np.take(rows[strip], j + 1, axis=1)
+        right *= right_weight
+        out[strip] += right
+    return out
+
+
+def lut_kernel_arguments(
+    lut: xr.DataArray,
+    like: xr.DataArray,
+    coords: tuple[str, str] = ("line", "pixel"),
+) -> tuple[xr.Variable, xr.Variable, dict[str, Any]]:
+    """Return the line and pixel of `like`, chunked like it, and the LUT arguments.
+
+    The LUT arguments are the keyword arguments of `bilinear_interpolate`.
+    """
+    line_name, pixel_name = coords
+    lut = lut.transpose(lut[line_name].dims[0], lut[pixel_name].dims[0])
+    # plain variables, as index variables cannot be chunked
+    line = xr.Variable(like[line_name].dims, like[line_name].values)
+    pixel = xr.Variable(like[pixel_name].dims, like[pixel_name].values)
+    if like.chunks is not None:
+        line = line.chunk({line.dims[0]: like.chunksizes[line.dims[0]]})
+        pixel = pixel.chunk({pixel.dims[0]: like.chunksizes[pixel.dims[0]]})
+    lut_kwargs = {
+        "lut": np.asarray(lut.values),
+        "lut_line": np.asarray(lut[line_name].values),
+        "lut_pixel": np.asarray(lut[pixel_name].values),
+    }
+    return line, pixel, lut_kwargs
+
+
+def interpolate_lut(
+    lut: xr.DataArray,
+    like: xr.DataArray,
+    coords: tuple[str, str] = ("line", "pixel"),
+    dtype: npt.DTypeLike = np.float32,
+) -> xr.DataArray:
+    """Bilinear interpolation of a LUT on the line and pixel coordinates of an image.
+
+    If `like` is a dask array the LUT is computed independently for every chunk
+    of `like`, so memory scales with the chunk size and not with the image size.
+
+    :param lut: 2D LUT with the 1D `coords` along its two dimensions
+    :param like: 2D image with the 1D `coords` along its two dimensions
+    :param coords: the names of the line and pixel coordinates
+    :param dtype: the type of the output, float32 is enough for radiometric LUTs
+    """
+    line, pixel, lut_kwargs = lut_kernel_arguments(lut, like, coords)
+    interpolated: xr.DataArray = xr.apply_ufunc(
+        bilinear_interpolate,
+        line,
+        pixel,
+        kwargs={**lut_kwargs, "dtype": dtype},
+        dask="parallelized",
+        output_dtypes=[np.dtype(dtype)],
+    )
+    interpolated = xr.DataArray(
+        interpolated,
+        coords={
+            name: coord
+            for name, coord in like.coords.items()
+            if set(coord.dims) <= {line.dims[0], pixel.dims[0]}
+        },
+        attrs=lut.attrs,
+    )
+    return interpolated.transpose(*like.dims)
+
+
+def interpolate_gcp(
+    gcp: xr.Dataset,
+    like: xr.DataArray,
+    variables: Sequence[str] = GCP_VARIABLES,
+    dtype: npt.DTypeLike | None = None,
+) -> xr.Dataset:
+    """Return the geolocation grid variables on every line and pixel of an image.
+
+    Every variable is the bilinear interpolation of the geolocation grid, see
+    `interpolate_lut`, so if `like` is a dask array the result is a lazy dask
+    array with the same chunks that is computed independently for every chunk.
+
+    :param gcp: geolocation grid, the measurement sub-group `gcp`
+    :param like: 2D image with the 1D line and pixel coordinates
+    :param variables: the names of the geolocation grid variables to interpolate
+    :param dtype: the type of the output, by default the type of every variable,
+    so latitude and longitude keep the sub-metre resolution of float64
+    """
+    data_vars = {
+        name: interpolate_lut(
+            gcp[name], like, dtype=gcp[name].dtype if dtype is None else dtype
+        )
+        for name in variables
+    }
+    return xr.Dataset(data_vars, attrs=gcp.attrs)
 
 
 def calibrate_amplitude(
@@ -1052,12 +1718,7 @@ def calibrate_amplitude(
     if np.allclose(calibration_lut_mean, calibration_lut, **kwargs):
         calibration: xr.DataArray = calibration_lut_mean.astype(np.float32)
     else:
-        calibration = calibration_lut.interp(
-            line=digital_number.line,
-            pixel=digital_number.pixel,
-        ).astype(np.float32)
-        if digital_number.chunks is not None:
-            calibration = calibration.chunk(digital_number.chunksizes)
+        calibration = interpolate_lut(calibration_lut, digital_number)
     amplitude = digital_number / calibration
     amplitude.attrs.update(digital_number.attrs)
     try:
@@ -1069,40 +1730,346 @@ def calibrate_amplitude(
     return amplitude
 
 
+def power_kernel(
+    digital_number: npt.NDArray[Any],
+    noise: npt.NDArray[np.float32] | None = None,
+) -> npt.NDArray[np.float32]:
+    """Return `|digital_number| ** 2` as float32, minus `noise` if given.
+
+    The negative values left by the noise subtraction are set to zero.
+    """
+    out = np.empty(digital_number.shape, dtype=np.float32)
+    if np.iscomplexobj(digital_number):
+        np.abs(digital_number, out=out)
+        np.square(out, out=out)
+    else:
+        np.square(digital_number, out=out, dtype=np.float32)
+    if noise is not None:
+        out -= noise
+        np.maximum(out, np.float32(0.0), out=out)
+    return out
+
+
+def calibrate_power_kernel(
+    power: npt.NDArray[np.float32],
+    calibration: npt.NDArray[np.float32] | float,
+    as_db: bool = False,
+    min_db: float | None = None,
+) -> npt.NDArray[np.float32]:
+    """Divide `power` in place by `calibration ** 2`, optionally converting to dB."""
+    if isinstance(calibration, np.ndarray):
+        # the LUT block is owned by the kernel, it can be squared in place
+        np.square(calibration, out=calibration)
+        power /= calibration
+    else:
+        power /= np.float32(calibration) ** 2
+    if as_db:
+        with np.errstate(divide="ignore"):
+            np.log10(power, out=power)
+        power *= np.float32(10.0)
+        if min_db is not None:
+            np.maximum(power, np.float32(min_db), out=power)
+    return power
+
+
+def intensity_kernel(
+    digital_number: npt.NDArray[Any],
+    calibration: npt.NDArray[np.float32] | float,
+    as_db: bool = False,
+    min_db: float | None = None,
+) -> npt.NDArray[np.float32]:
+    """Return `|digital_number / calibration| ** 2`, optionally in dB.
+
+    All the steps are computed in place in a single float32 output array.
+    """
+    power = power_kernel(digital_number)
+    return calibrate_power_kernel(power, calibration, as_db, min_db)
+
+
+def lut_intensity_kernel(
+    digital_number: npt.NDArray[Any],
+    line: npt.NDArray[Any],
+    pixel: npt.NDArray[Any],
+    lut: npt.NDArray[Any],
+    lut_line: npt.NDArray[Any],
+    lut_pixel: npt.NDArray[Any],
+    as_db: bool = False,
+    min_db: float | None = None,
+) -> npt.NDArray[np.float32]:
+    calibration = bilinear_interpolate(line, pixel, lut, lut_line, lut_pixel)
+    return intensity_kernel(digital_number, calibration, as_db, min_db)
+
+
+def apply_noise_azimuth(
+    noise: npt.NDArray[np.float32],
+    line: npt.NDArray[Any],
+    pixel: npt.NDArray[Any],
+    first_azimuth_line: npt.NDArray[Any],
+    first_range_sample: npt.NDArray[Any],
+    last_azimuth_line: npt.NDArray[Any],
+    last_range_sample: npt.NDArray[Any],
+    offset: npt.NDArray[Any],
+    lut_line: npt.NDArray[Any],
+    lut: npt.NDArray[Any],
+) -> None:
+    """Scale in place the range noise on the line x pixel grid by the azimuth noise.
+
+    The azimuth LUT of each block is linearly interpolated on the lines of the
+    block, with constant extrapolation, and the values of `noise` outside all
+    the blocks are left unchanged. `line` and `pixel` must be sorted.
+    """
+    line = np.ravel(line)
+    pixel = np.ravel(pixel)
+    # the bounds of all the blocks in the grid at once
+    row_start = np.searchsorted(line, first_azimuth_line, side="left")
+    row_stop = np.searchsorted(line, last_azimuth_line, side="right")
+    column_start = np.searchsorted(pixel, first_range_sample, side="left")
+    column_stop = np.searchsorted(pixel, last_range_sample, side="right")
+    point_stop = np.append(offset[1:], lut.size)
+    overlaps = (row_start < row_stop) & (column_start < column_stop)
+    for k in np.flatnonzero(overlaps):
+        rows = slice(row_start[k], row_stop[k])
+        points = slice(offset[k], point_stop[k])
+        scale = np.interp(line[rows], lut_line[points], lut[points])
+        noise[rows, column_start[k] : column_stop[k]] *= scale.astype(np.float32)[
+            :, None
+        ]
+
+
+def noise_azimuth_kernel_arguments(noise_azimuth: xr.Dataset) -> dict[str, Any]:
+    """Return the keyword arguments of `apply_noise_azimuth` for the azimuth blocks.
+
+    The blocks can be opened with `open_noise_azimuth_blocks_dataset`.
+    """
+    return {
+        "first_azimuth_line": noise_azimuth["firstAzimuthLine"].values,
+        "first_range_sample": noise_azimuth["firstRangeSample"].values,
+        "last_azimuth_line": noise_azimuth["lastAzimuthLine"].values,
+        "last_range_sample": noise_azimuth["lastRangeSample"].values,
+        "offset": noise_azimuth["offset"].values,
+        "lut_line": noise_azimuth["line"].values,
+        "lut": noise_azimuth["noiseAzimuthLut"].values,
+    }
+
+
+def noise_kernel(
+    line: npt.NDArray[Any],
+    pixel: npt.NDArray[Any],
+    noise_range: dict[str, Any],
+    noise_azimuth: dict[str, Any] | None = None,
+) -> npt.NDArray[np.float32]:
+    noise = bilinear_interpolate(line, pixel, **noise_range)
+    if noise_azimuth is not None:
+        apply_noise_azimuth(noise, line, pixel, **noise_azimuth)
+    return noise
+
+
+def denoised_intensity_kernel(
+    digital_number: npt.NDArray[Any],
+    line: npt.NDArray[Any],
+    pixel: npt.NDArray[Any],
+    noise_range: dict[str, Any],
+    calibration: dict[str, Any] | float,
+    noise_azimuth: dict[str, Any] | None = None,
+    as_db: bool = False,
+    min_db: float | None = None,
+) -> npt.NDArray[np.float32]:
+    # the noise block is released before the calibration LUT block is allocated
+    power = power_kernel(
+        digital_number, noise_kernel(line, pixel, noise_range, noise_azimuth)
+    )
+    calibration_block = (
+        bilinear_interpolate(line, pixel, **calibration)
+        if isinstance(calibration, dict)
+        else calibration
+    )
+    return calibrate_power_kernel(power, calibration_block, as_db, min_db)
+
+
+def interpolate_noise(
+    noise_range_lut: xr.DataArray,
+    like: xr.DataArray,
+    noise_azimuth: xr.Dataset | None = None,
+) -> xr.DataArray:
+    """Return the thermal noise power on the line and pixel coordinates of an image.
+
+    The noise is the bilinear interpolation of the range noise LUT scaled by the
+    azimuth noise LUT of the block of each pixel, it is computed independently
+    for every chunk of `like`.
+
+    :param noise_range_lut: the `noiseRangeLut` of the `noise_range` sub-group
+    :param like: 2D image with the 1D line and pixel coordinates
+    :param noise_azimuth: the azimuth noise blocks, see `open_noise_azimuth_blocks_dataset`
+    """
+    line, pixel, noise_range = lut_kernel_arguments(noise_range_lut, like)
+    azimuth_kwargs = None
+    if noise_azimuth is not None:
+        azimuth_kwargs = noise_azimuth_kernel_arguments(noise_azimuth)
+    noise: xr.DataArray = xr.apply_ufunc(
+        noise_kernel,
+        line,
+        pixel,
+        kwargs={"noise_range": noise_range, "noise_azimuth": azimuth_kwargs},
+        dask="parallelized",
+        output_dtypes=[np.float32],
+    )
+    noise = xr.DataArray(
+        noise,
+        coords={
+            name: coord
+            for name, coord in like.coords.items()
+            if set(coord.dims) <= {line.dims[0], pixel.dims[0]}
+        },
+    )
+    return noise.transpose(*like.dims)
+
+
 def calibrate_intensity(
     digital_number: xr.DataArray,
     calibration_lut: xr.DataArray,
     as_db: bool = False,
     min_db: float | None = -40.0,
+    noise_range_lut: xr.DataArray | None = None,
+    noise_azimuth: xr.Dataset | None = None,
     **kwargs: Any,
 ) -> xr.DataArray:
     """Return the calibrated intensity using the calibration LUT in the product metadata.
 
+    The LUT interpolation and the calibration are fused in a single float32
+    kernel applied to every chunk of `digital_number`.
+    If `noise_range_lut` is given the thermal noise, see `interpolate_noise`,
+    is removed in the same kernel before the calibration.
+
     :param digital_number: digital numbers to be calibrated
     :param calibration_lut: calibration LUT (sigmaNought, betaNought or gamma).
     The LUT can be opened using the measurement sub-group `calibration`.
     :param as_db: if True, returns the data in db
     :param min_db: minimal value in db, to avoid infinity values.
+    :param noise_range_lut: range noise LUT, the `noiseRangeLut` of the
+    measurement sub-group `noise_range`
+    :param noise_azimuth: azimuth noise blocks, see `open_noise_azimuth_blocks_dataset`
     """
-    amplitude = calibrate_amplitude(digital_number, calibration_lut, **kwargs)
-    intensity = abs(amplitude) ** 2
-    if as_db:
-        intensity = 10.0 * np.log10(intensity)  # type: ignore
-        if min_db is not None:
-            intensity = np.maximum(intensity, min_db)  # type: ignore
-        intensity.attrs.update(amplitude.attrs)
-        intensity.attrs["units"] = "dB"
+    kernel_kwargs: dict[str, Any] = {"as_db": as_db, "min_db": min_db}
+    # an explicit meta, or dask casts the complex digital numbers to infer it
+    dask_gufunc_kwargs = {"meta": np.empty((0,) * digital_number.ndim, np.float32)}
+    calibration_lut_mean = calibration_lut.mean()
+    is_constant = np.allclose(calibration_lut_mean, calibration_lut, **kwargs)
+    if noise_range_lut is not None:
+        line, pixel, noise_range = lut_kernel_arguments(noise_range_lut, digital_number)
+        if is_constant:
+            calibration: dict[str, Any] | float = float(calibration_lut_mean)
+        else:
+            calibration = lut_kernel_arguments(calibration_lut, digital_number)[2]
+        if noise_azimuth is not None:
+            kernel_kwargs["noise_azimuth"] = noise_azimuth_kernel_arguments(
+                noise_azimuth
+            )
+        dims = digital_number.dims
+        intensity: xr.DataArray = xr.apply_ufunc(
+            denoised_intensity_kernel,
+            digital_number.transpose(line.dims[0], pixel.dims[0]),
+            line,
+            pixel,
+            kwargs={
+                "noise_range": noise_range,
+                "calibration": calibration,
+                **kernel_kwargs,
+            },
+            dask="parallelized",
+            dask_gufunc_kwargs=dask_gufunc_kwargs,
+        ).transpose(*dims)
+    elif is_constant:
+        intensity = xr.apply_ufunc(
+            intensity_kernel,
+            digital_number,
+            kwargs={"calibration": float(calibration_lut_mean), **kernel_kwargs},
+            dask="parallelized",
+            dask_gufunc_kwargs=dask_gufunc_kwargs,
+        )
     else:
-        intensity.attrs.update(amplitude.attrs)
-        intensity.attrs["units"] = "m2 m-2"
-    try:
-        lut_name = amplitude.attrs["long_name"].partition("amplitude for ")[2]
-        intensity.attrs["long_name"] = lut_name
-    except KeyError:
-        pass
+        line, pixel, lut_kwargs = lut_kernel_arguments(calibration_lut, digital_number)
+        # the kernel expects the dimensions in line, pixel order
+        dims = digital_number.dims
+        intensity = xr.apply_ufunc(
+            lut_intensity_kernel,
+            digital_number.transpose(line.dims[0], pixel.dims[0]),
+            line,
+            pixel,
+            kwargs={**lut_kwargs, **kernel_kwargs},
+            dask="parallelized",
+            dask_gufunc_kwargs=dask_gufunc_kwargs,
+        ).transpose(*dims)
+
+    intensity.attrs.update(digital_number.attrs)
+    if "long_name" in calibration_lut.attrs:
+        lut_name = calibration_lut.attrs["long_name"].partition("calibration LUT")[0]
+        intensity.attrs["long_name"] = f"amplitude for {lut_name}".strip()
+    if "long_name" in intensity.attrs:
+        intensity.attrs["long_name"] = intensity.attrs["long_name"].partition(
+            "amplitude for "
+        )[2]
+    intensity.attrs["units"] = "dB" if as_db else "m2 m-2"
     return intensity
 
 
+def interp_coordinate_conversion(
+    coordinate_conversion: xr.Dataset, azimuth_time: xr.DataArray
+) -> xr.Dataset:
+    """Interpolate the coordinate conversion polynomials on every azimuth time.
+
+    The result is a per-row lookup table that can be passed in place of the
+    coordinate conversion dataset to the conversion functions, so the polynomial
+    coefficients are interpolated only once for repeated whole-image conversions.
+
+    :param coordinate_conversion: coordinate conversion dataset.
+    The coordinate conversion dataset can be opened using the measurement sub-groub `coordinate_conversion`
+    :param azimuth_time: azimuth time coordinates
+    """
+    return coordinate_conversion.interp(azimuth_time=azimuth_time)
+
+
+def polynomial_kernel(
+    coefficients: npt.NDArray[Any],
+    x: npt.NDArray[Any],
+    origin: npt.NDArray[np.float64] | float = 0.0,
+    scale: float = 1.0,
+) -> npt.NDArray[np.float64]:
+    """Evaluate the polynomial in `x - origin` with the Horner scheme.
+
+    The coefficients are in increasing degree along the last axis, the other
+    axes broadcast against `x`, so the only full-size array is the output.
+    """
+    x = np.asarray(x, dtype=np.float64) - origin
+    shape = np.broadcast_shapes(coefficients.shape[:-1], x.shape)
+    out = np.broadcast_to(coefficients[..., -1], shape).astype(np.float64, copy=True)
+    for degree in range(coefficients.shape[-1] - 2, -1, -1):
+        out *= x
+        out += coefficients[..., degree]
+    if scale != 1.0:
+        out *= scale
+    return out
+
+
+def evaluate_polynomial(
+    coefficients: xr.DataArray,
+    x: xr.DataArray,
+    origin: xr.DataArray | float = 0.0,
+    scale: float = 1.0,
+) -> xr.DataArray:
+    """Evaluate blockwise the polynomial in `x - origin` with the `degree` coefficients."""
+    polynomial: xr.DataArray = xr.apply_ufunc(
+        polynomial_kernel,
+        coefficients,
+        x,
+        origin,
+        input_core_dims=[["degree"], [], []],
+        kwargs={"scale": scale},
+        dask="parallelized",
+        output_dtypes=[np.float64],
+    )
+    return polynomial
+
+
 def slant_range_time_to_ground_range(
     azimuth_time: xr.DataArray,
     slant_range_time: xr.DataArray,
@@ -1113,16 +2080,19 @@ def slant_range_time_to_ground_range(
     :param azimuth_time: azimuth time coordinates
     :param slant_range_time: slant range time
     :param coordinate_conversion: coordinate conversion dataset.
-    The coordinate conversion dataset can be opened using the measurement sub-groub `coordinate_conversion`
+    The coordinate conversion dataset can be opened using the measurement sub-groub `coordinate_conversion`,
+    or already interpolated on `azimuth_time` with `interp_coordinate_conversion`
     """
+    if not coordinate_conversion.azimuth_time.equals(azimuth_time):
+        coordinate_conversion = interp_coordinate_conversion(
+            coordinate_conversion[["sr0", "srgrCoefficients"]], azimuth_time
+        )
     slant_range = SPEED_OF_LIGHT / 2.0 * slant_range_time
-    sr0 = coordinate_conversion.sr0.interp(azimuth_time=azimuth_time)
-    srgrCoefficients = coordinate_conversion.srgrCoefficients.interp(
-        azimuth_time=azimuth_time,
+    return evaluate_polynomial(
+        coordinate_conversion.srgrCoefficients,
+        slant_range,
+        coordinate_conversion.sr0,
     )
-    x = slant_range - sr0
-    ground_range = (srgrCoefficients * x**srgrCoefficients.degree).sum("degree")
-    return ground_range  # type: ignore
 
 
 def ground_range_to_slant_range_time(
@@ -1135,15 +2105,517 @@ def ground_range_to_slant_range_time(
     :param azimuth_time: azimuth time coordinates
     :param ground_range: slant range time
     :param coordinate_conversion: coordinate conversion dataset.
-    The coordinate conversion dataset can be opened using the measurement sub-groub `coordinate_conversion`
+    The coordinate conversion dataset can be opened using the measurement sub-groub `coordinate_conversion`,
+    or already interpolated on `azimuth_time` with `interp_coordinate_conversion`
     """
     assert (coordinate_conversion.gr0 == 0.0).all()
-    grsrCoefficients = coordinate_conversion.grsrCoefficients.interp(
-        azimuth_time=azimuth_time,
+    if not coordinate_conversion.azimuth_time.equals(azimuth_time):
+        coordinate_conversion = interp_coordinate_conversion(
+            coordinate_conversion[["grsrCoefficients"]], azimuth_time
+        )
+    return evaluate_polynomial(
+        coordinate_conversion.grsrCoefficients,
+        ground_range,
+        scale=2 / SPEED_OF_LIGHT,
+    )
+
+
+def orbit_kernel_arguments(orbit: xr.Dataset, order: int) -> dict[str, Any]:
+    """Return the arguments of `orbit_interpolation_kernel` with the precomputed stencils.
+
+    The stencil starting at every state vector is made of the `order` state vectors
+    from it, the Lagrange polynomial of each stencil is stored as its monomial
+    coefficients in the time from the stencil origin in units of the stencil spacing.
+    Times are in seconds from the first state vector, the `epoch`.
+    """
+    epoch = orbit.azimuth_time.values[0].astype("datetime64[ns]")
+    orbit_time = (orbit.azimuth_time.values - epoch) / ONE_SECOND
+    if orbit_time.size < order:
+        raise ValueError(f"{order=} is larger than the {orbit_time.size} state vectors")
+    state_vectors = np.concatenate(
+        [
+            orbit.position.transpose("azimuth_time", "axis").values,
+            orbit.velocity.transpose("azimuth_time", "axis").values,
+        ],
+        axis=1,
+    )
+    starts = np.arange(orbit_time.size - order + 1)
+    origin = orbit_time[starts + order // 2]
+    scale = (orbit_time[starts + order - 1] - orbit_time[starts]) / (order - 1)
+    coefficients = np.empty((starts.size, order, state_vectors.shape[1]))
+    for start in starts:
+        stencil = slice(start, start + order)
+        nodes = (orbit_time[stencil] - origin[start]) / scale[start]
+        vandermonde = np.vander(nodes, order, increasing=True)
+        coefficients[start] = np.linalg.solve(vandermonde, state_vectors[stencil])
+    return {
+        "epoch": epoch,
+        "orbit_time": orbit_time,
+        "origin": origin,
+        "scale": scale,
+        "coefficients": coefficients,
+    }
+
+
+def evaluate_orbit_stencils(
+    time: npt.NDArray[np.float64],
+    orbit_time: npt.NDArray[np.float64],
+    origin: npt.NDArray[np.float64],
+    scale: npt.NDArray[np.float64],
+    coefficients: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Evaluate the polynomials of the stencil nearest to each of the 1D times.
+
+    The times are grouped by stencil, so every group is evaluated with the Horner
+    scheme using the coefficients of a single stencil.
+    Times outside the state vectors times are NaN.
+    """
+    order = coefficients.shape[1]
+    right = np.searchsorted(orbit_time, time, side="right")
+    start = np.clip(right - order // 2, 0, orbit_time.size - order)
+    sort = None
+    if np.any(start[1:] < start[:-1]):
+        sort = np.argsort(start, kind="stable")
+        time = time[sort]
+        start = start[sort]
+    bounds = np.searchsorted(start, np.arange(coefficients.shape[0] + 1))
+    out = np.empty((time.size, coefficients.shape[2]))
+    for stencil, (low, high) in enumerate(zip(bounds[:-1], bounds[1:])):
+        if low == high:
+            continue
+        x = ((time[low:high] - origin[stencil]) / scale[stencil])[:, None]
+        block = out[low:high]
+        block[:] = coefficients[stencil, -1]
+        for degree in range(order - 2, -1, -1):
+            block *= x
+            block += coefficients[stencil, degree]
+    out[(time < orbit_time[0]) | (time > orbit_time[-1])] = np.nan
+    if sort is not None:
+        out[sort] = out.copy()
+    return out
+
+
+def orbit_interpolation_kernel(
+    azimuth_time: npt.NDArray[np.datetime64],
+    epoch: np.datetime64,
+    **stencils: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Return position and velocity at the azimuth times, see `evaluate_orbit_stencils`."""
+    time = (np.ravel(azimuth_time).astype("datetime64[ns]") - epoch) / ONE_SECOND
+    out = evaluate_orbit_stencils(time, **stencils)
+    state_vectors = out.reshape(np.shape(azimuth_time) + (2, -1))
+    return state_vectors[..., 0, :], state_vectors[..., 1, :]
+
+
+def interpolate_orbit(
+    orbit: xr.Dataset, azimuth_time: xr.DataArray, order: int = 8
+) -> xr.Dataset:
+    """Return the satellite position and velocity at the given azimuth times.
+
+    Position and velocity are interpolated with the Lagrange polynomial of the
+    `order` state vectors nearest to every time. The polynomials of all the stencils
+    are computed once and all the times are evaluated with a single vectorised
+    kernel, applied independently to every chunk if `azimuth_time` is a dask array.
+    Times outside the state vectors times are NaN.
+
+    :param orbit: orbit dataset, the measurement sub-group `orbit`
+    :param azimuth_time: azimuth times of any shape
+    :param order: number of state vectors used for every interpolation
+    """
+    kernel_kwargs = orbit_kernel_arguments(orbit, order)
+    # plain variable, as index variables cannot be chunked
+    time = xr.Variable(azimuth_time.dims, azimuth_time.data)
+    position, velocity = xr.apply_ufunc(
+        orbit_interpolation_kernel,
+        time,
+        kwargs=kernel_kwargs,
+        output_core_dims=[["axis"], ["axis"]],
+        dask="parallelized",
+        output_dtypes=[np.float64, np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"axis": orbit.sizes["axis"]}},
+    )
+    data_vars = {
+        "position": position.transpose("axis", *azimuth_time.dims),
+        "velocity": velocity.transpose("axis", *azimuth_time.dims),
+    }
+    coords = {"axis": orbit.axis, **azimuth_time.coords}
+    return xr.Dataset(data_vars, coords=coords, attrs=orbit.attrs)
+
+
+def geodetic_to_ecef(
+    latitude: npt.NDArray[Any], longitude: npt.NDArray[Any], height: npt.NDArray[Any]
+) -> npt.NDArray[np.float64]:
+    """Return the WGS84 Earth Fixed coordinates, along the last axis, of geodetic points.
+
+    :param latitude: geodetic latitude in degrees
+    :param longitude: longitude in degrees
+    :param height: height above the ellipsoid in metres
+    """
+    phi = np.radians(latitude)
+    lam = np.radians(longitude)
+    e2 = WGS84_FLATTENING * (2 - WGS84_FLATTENING)
+    sin_phi = np.sin(phi)
+    normal = WGS84_SEMI_MAJOR_AXIS / np.sqrt(1 - e2 * sin_phi**2)
+    horizontal = (normal + height) * np.cos(phi)
+    ecef: npt.NDArray[np.float64] = np.stack(
+        np.broadcast_arrays(
+            horizontal * np.cos(lam),
+            horizontal * np.sin(lam),
+            (normal * (1 - e2) + height) * sin_phi,
+        ),
+        axis=-1,
+    )
+    return ecef
+
+
+def zero_doppler_kernel(
+    latitude: npt.NDArray[np.float64],
+    longitude: npt.NDArray[np.float64],
+    height: npt.NDArray[np.float64],
+    epoch: np.datetime64,
+    bistatic_reference: float | None = None,
+    max_iterations: int = 10,
+    tolerance: float = 1e-9,
+    **stencils: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.datetime64], npt.NDArray[np.float64]]:
+    """Return the zero-Doppler azimuth time and the slant range time of ground points.
+
+    The zero-Doppler time, where the satellite velocity is orthogonal to the line of
+    sight, is first bracketed between the state vectors and then refined with the
+    Newton method until the time steps are below `tolerance` seconds.
+    If `bistatic_reference` is given the azimuth time is moved back by half the slant
+    range time from it, the azimuth bistatic correction of the Sentinel-1 annotations.
+    The stencils have the position, velocity and acceleration polynomials.
+    Points that are not seen by the orbit are NaT and NaN.
+    """
+    target = geodetic_to_ecef(latitude, longitude, height)
+    shape = target.shape[:-1]
+    target = target.reshape(-1, 3)
+    orbit_time = stencils["orbit_time"]
+    # the Doppler at the state vectors, it increases with time
+    nodes = evaluate_orbit_stencils(orbit_time, **stencils)
+    node_doppler = np.einsum("ij,ij->i", nodes[:, 3:6], nodes[:, :3])
+    doppler = node_doppler - target @ nodes[:, 3:6].T
+    before = np.clip((doppler < 0).sum(axis=1) - 1, 0, orbit_time.size - 2)
+    points = np.arange(target.shape[0])
+    doppler_before = doppler[points, before]
+    weight = doppler_before / (doppler_before - doppler[points, before + 1])
+    time = orbit_time[before] + weight * (orbit_time[before + 1] - orbit_time[before])
+    state = evaluate_orbit_stencils(time, **stencils)
+    line_of_sight = state[:, :3] - target
+    for _ in range(max_iterations):
+        velocity = state[:, 3:6]
+        doppler_rate = np.einsum("ij,ij->i", velocity, velocity)
+        doppler_rate += np.einsum("ij,ij->i", state[:, 6:9], line_of_sight)
+        step = np.einsum("ij,ij->i", velocity, line_of_sight) / doppler_rate
+        time -= step
+        if not np.any(abs(step) > tolerance):
+            break
+        state = evaluate_orbit_stencils(time, **stencils)
+        line_of_sight = state[:, :3] - target
+    # the last step moves along the orbit at the closest approach, the range is unchanged
+    slant_range_time = 2 / SPEED_OF_LIGHT * np.linalg.norm(line_of_sight, axis=1)
+    if bistatic_reference is not None:
+        time -= (slant_range_time - bistatic_reference) / 2
+    azimuth_time = np.full(time.shape, np.datetime64("NaT", "ns"))
+    valid = np.isfinite(time)
+    nanoseconds = np.rint(time[valid] * 10**9).astype("timedelta64[ns]")
+    azimuth_time[valid] = epoch + nanoseconds
+    return azimuth_time.reshape(shape), slant_range_time.reshape(shape)
+
+
+def radar_time_to_line_pixel(
+    measurement: DataArrayOrDataset,
+    azimuth_time: xr.DataArray,
+    slant_range_time: xr.DataArray,
+    coordinate_conversion: xr.Dataset | None = None,
+) -> xr.Dataset:
+    """Return the fractional line and pixel of azimuth times and slant range times.
+
+    The lines are computed burst by burst like the `indexes.SwathIndex` of the azimuth
+    time, the times in the overlap of two bursts are in the burst where they are
+    farther from the edge.
+
+    :param measurement: measurement dataset, with the 1D line and pixel coordinates
+    :param azimuth_time: azimuth times
+    :param slant_range_time: slant range times
+    :param coordinate_conversion: coordinate conversion dataset, only needed for
+    ground range products. The coordinate conversion dataset can be opened using
+    the measurement sub-groub `coordinate_conversion`
+    """
+    line_dim = measurement.azimuth_time.dims[0]
+    size = measurement.sizes[line_dim]
+    lines_per_burst = measurement.attrs.get("lines_per_burst", size)
+    measurement_time = measurement.azimuth_time.values
+    burst_start = measurement_time[::lines_per_burst]
+    step = (measurement_time[lines_per_burst - 1] - measurement_time[0]) / (
+        (lines_per_burst - 1) * np.timedelta64(1, "ns")
+    )
+    transform = indexes.AzimuthTimeTransform.from_bursts(
+        burst_start, lines_per_burst, step, size
+    )
+
+    def line_kernel(time: npt.NDArray[np.datetime64]) -> npt.NDArray[np.float64]:
+        line = transform.reverse({"azimuth_time": time})[transform.dim]
+        return np.where(np.isnat(time), np.nan, line)
+
+    line = xr.apply_ufunc(
+        line_kernel, azimuth_time, dask="parallelized", output_dtypes=[np.float64]
+    )
+    if "slant_range_time" in measurement.coords:
+        range_coordinate = measurement.slant_range_time
+        range_value = slant_range_time
+    else:
+        if coordinate_conversion is None:
+            raise TypeError(
+                "'coordinate_conversion' is needed for ground range products"
+            )
+        range_coordinate = measurement.ground_range
+        range_value = slant_range_time_to_ground_range(
+            azimuth_time, slant_range_time, coordinate_conversion
+        )
+    range_start = range_coordinate.values[0]
+    range_step = (range_coordinate.values[-1] - range_start) / (
+        range_coordinate.size - 1
+    )
+    pixel = (range_value - range_start) / range_step
+    line = (line + measurement.line.values[0]).drop_vars(RADAR_NAMES, errors="ignore")
+    pixel = pixel + measurement.pixel.values[0]
+    pixel = pixel.drop_vars(RADAR_NAMES, errors="ignore")
+    return xr.Dataset({"line": line, "pixel": pixel})
+
+
+def backward_geocode(
+    orbit: xr.Dataset,
+    latitude: xr.DataArray,
+    longitude: xr.DataArray,
+    height: xr.DataArray,
+    measurement: xr.Dataset | None = None,
+    coordinate_conversion: xr.Dataset | None = None,
+    order: int = 8,
+) -> xr.Dataset:
+    """Return the zero-Doppler azimuth time and slant range time of ground points.
+
+    The orbit is interpolated like in `interpolate_orbit` and every point is solved
+    with the vectorised Newton method of `zero_doppler_kernel`, applied independently
+    to every chunk if the points are dask arrays.
+    If `measurement` is given the azimuth time has the azimuth bistatic correction
+    from the first pixel of the measurement, like the azimuth times in the Sentinel-1
+    annotations, and the fractional line and pixel are added, see
+    `radar_time_to_line_pixel`.
+
+    :param orbit: orbit dataset, the measurement sub-group `orbit`
+    :param latitude: geodetic latitude in degrees
+    :param longitude: longitude in degrees
+    :param height: height above the WGS84 ellipsoid in metres
+    :param measurement: measurement dataset
+    :param coordinate_conversion: coordinate conversion dataset, only needed to
+    compute the pixel of ground range products
+    :param order: number of state vectors used for every orbit interpolation
+    """
+    kernel_kwargs = orbit_kernel_arguments(orbit, order)
+    coefficients = kernel_kwargs["coefficients"]
+    # the acceleration polynomials are the derivatives of the velocity ones
+    acceleration = np.zeros(coefficients[..., 3:6].shape)
+    degree = np.arange(1, order)[:, None]
+    scale = kernel_kwargs["scale"][:, None, None]
+    acceleration[:, :-1] = coefficients[:, 1:, 3:6] * degree / scale
+    kernel_kwargs["coefficients"] = np.concatenate([coefficients, acceleration], axis=2)
+    if measurement is not None:
+        kernel_kwargs["bistatic_reference"] = measurement.attrs[
+            "image_slant_range_time"
+        ]
+    # the outputs replace the coordinates of the same name of the points
+    latitude, longitude, height = (
+        point.drop_vars(RADAR_NAMES, errors="ignore")
+        for point in (latitude, longitude, height)
+    )
+    azimuth_time, slant_range_time = xr.apply_ufunc(
+        zero_doppler_kernel,
+        latitude,
+        longitude,
+        height,
+        kwargs=kernel_kwargs,
+        output_core_dims=[[], []],
+        dask="parallelized",
+        output_dtypes=[np.dtype("datetime64[ns]"), np.float64],
+    )
+    ds = xr.Dataset(
+        {"azimuth_time": azimuth_time, "slant_range_time": slant_range_time},
+        attrs=orbit.attrs,
+    )
+    if measurement is not None:
+        line_pixel = radar_time_to_line_pixel(
+            measurement, azimuth_time, slant_range_time, coordinate_conversion
+        )
+        ds = ds.merge(line_pixel)
+    return ds
+
+
+def tops_ramp_kernel_arguments(
+    measurement: xr.DataArray,
+    orbit: xr.Dataset,
+    dc_estimate: xr.Dataset,
+    azimuth_fm_rate: xr.Dataset,
+) -> tuple[xr.Variable, xr.Variable, xr.Variable, dict[str, Any]]:
+    """Return the per-line and per-pixel arguments and the per-burst ones of `tops_ramp_kernel`.
+
+    The per-line burst and burst time and the per-pixel slant range time are
+    chunked like `measurement`. The burst of every line is the position of its
+    burst in the per-burst arguments and the burst time is the azimuth time in
+    seconds from the middle of its burst.
+    The Doppler centroid and the azimuth FM rate polynomials of every burst are the
+    ones nearest to the middle of the burst.
+    """
+    lines_per_burst = measurement.attrs["lines_per_burst"]
+    azimuth_time_interval = measurement.attrs["azimuth_time_interval"]
+    line = measurement.line.values
+    _, first_lines, burst_position = np.unique(
+        line // lines_per_burst, return_index=True, return_inverse=True
+    )
+    line_in_burst = line % lines_per_burst - lines_per_burst / 2
+    burst_time_values = line_in_burst * azimuth_time_interval
+    mid_time = measurement.azimuth_time.values[first_lines].astype("datetime64[ns]")
+    mid_time -= np.rint(burst_time_values[first_lines] * 10**9).astype(
+        "timedelta64[ns]"
+    )
+
+    velocity = interpolate_orbit(orbit, xr.DataArray(mid_time, dims="burst")).velocity
+    speed = np.sqrt((velocity**2).sum("axis").values)
+    radar_frequency = measurement.attrs["radar_frequency"] * 10**9
+    steering_rate = np.radians(measurement.attrs["azimuth_steering_rate"])
+    steering_doppler_rate = 2 * speed / SPEED_OF_LIGHT * radar_frequency * steering_rate
+
+    fm_rate = azimuth_fm_rate.sel(azimuth_time=mid_time, method="nearest")
+    dc = dc_estimate.sel(azimuth_time=mid_time, method="nearest")
+    kernel_kwargs = {
+        "steering_doppler_rate": steering_doppler_rate,
+        "azimuth_fm_rate_t0": fm_rate.t0.values,
+        "azimuth_fm_rate_coefficients": fm_rate.azimuth_fm_rate_polynomial.values,
+        "doppler_centroid_t0": dc.t0.values,
+        "doppler_centroid_coefficients": dc.data_dc_polynomial.values,
+    }
+    # the beam centre crossing time at the first pixel of the swath
+    first_slant_range_time = measurement.attrs["image_slant_range_time"]
+    kernel_kwargs["reference_time"] = -polynomial_kernel(
+        kernel_kwargs["doppler_centroid_coefficients"],
+        first_slant_range_time,
+        kernel_kwargs["doppler_centroid_t0"],
+    ) / polynomial_kernel(
+        kernel_kwargs["azimuth_fm_rate_coefficients"],
+        first_slant_range_time,
+        kernel_kwargs["azimuth_fm_rate_t0"],
+    )
+
+    line_dim = measurement.line.dims[0]
+    pixel_dim = measurement.slant_range_time.dims[0]
+    # plain variables, as index variables cannot be chunked
+    burst = xr.Variable(line_dim, burst_position)
+    burst_time = xr.Variable(line_dim, burst_time_values)
+    slant_range_time = xr.Variable(pixel_dim, measurement.slant_range_time.values)
+    if measurement.chunks is not None:
+        burst = burst.chunk({line_dim: measurement.chunksizes[line_dim]})
+        burst_time = burst_time.chunk({line_dim: measurement.chunksizes[line_dim]})
+        slant_range_time = slant_range_time.chunk(
+            {pixel_dim: measurement.chunksizes[pixel_dim]}
+        )
+    return burst, burst_time, slant_range_time, kernel_kwargs
+
+
+def tops_ramp_kernel(
+    data: npt.NDArray[Any],
+    burst: npt.NDArray[np.intp],
+    burst_time: npt.NDArray[np.float64],
+    slant_range_time: npt.NDArray[np.float64],
+    steering_doppler_rate: npt.NDArray[np.float64],
+    azimuth_fm_rate_t0: npt.NDArray[np.float64],
+    azimuth_fm_rate_coefficients: npt.NDArray[np.float64],
+    doppler_centroid_t0: npt.NDArray[np.float64],
+    doppler_centroid_coefficients: npt.NDArray[np.float64],
+    reference_time: npt.NDArray[np.float64],
+    reramp: bool = False,
+) -> npt.NDArray[np.complex64]:
+    """Remove the TOPS azimuth ramp from the `(line, pixel)` data, or restore it.
+
+    The ramp phase is `pi * kt * eta ** 2 + 2 * pi * fdc * eta`, with `eta` the burst
+    time from the reference time and `kt` the Doppler centroid rate, see
+    "Definition of the TOPS SLC deramping function for products generated by the
+    S-1 IPF". The range dependent terms are computed once per burst and the phase
+    only for the lines of the burst, so the only full-size array is the output.
+    """
+    # the per-line arguments may have a trailing axis to broadcast against the pixels
+    burst = np.ravel(burst)
+    burst_time = np.ravel(burst_time)
+    out = np.empty(data.shape, dtype=np.complex64)
+    for index in np.unique(burst):
+        rows = burst == index
+        azimuth_fm_rate = polynomial_kernel(
+            azimuth_fm_rate_coefficients[index],
+            slant_range_time,
+            azimuth_fm_rate_t0[index],
+        )
+        doppler_centroid = polynomial_kernel(
+            doppler_centroid_coefficients[index],
+            slant_range_time,
+            doppler_centroid_t0[index],
+        )
+        ks = steering_doppler_rate[index]
+        doppler_centroid_rate = azimuth_fm_rate * ks / (azimuth_fm_rate - ks)
+        # the beam centre crossing time relative to the one of the first pixel
+        reference = -doppler_centroid / azimuth_fm_rate - reference_time[index]
+        eta = burst_time[rows, None] - reference
+        phase = eta * (np.pi * doppler_centroid_rate)
+        phase += 2 * np.pi * doppler_centroid
+        phase *= eta
+        if not reramp:
+            np.negative(phase, out=phase)
+        ramp = np.empty(phase.shape, dtype=np.complex64)
+        np.cos(phase, out=ramp.real, casting="same_kind")
+        np.sin(phase, out=ramp.imag, casting="same_kind")
+        ramp *= data[rows]
+        out[rows] = ramp
+    return out
+
+
+def deramp_bursts(
+    measurement: xr.DataArray,
+    orbit: xr.Dataset,
+    dc_estimate: xr.Dataset,
+    azimuth_fm_rate: xr.Dataset,
+    reramp: bool = False,
+) -> xr.DataArray:
+    """Return the TOPS SLC data with the azimuth phase ramp of the bursts removed.
+
+    The ramp phase is computed and applied in a single complex64 kernel, see
+    `tops_ramp_kernel`, applied independently to every chunk of `measurement`,
+    so the full-size phase screen is never stored.
+    The bursts of every line follow its `line` coordinate, so `measurement` can be
+    a swath, a burst or a mosaic of bursts.
+
+    :param measurement: IW or EW SLC measurement
+    :param orbit: orbit dataset, the measurement sub-group `orbit`
+    :param dc_estimate: Doppler centroid dataset, the measurement sub-group `dc_estimate`
+    :param azimuth_fm_rate: azimuth FM rate dataset, the measurement sub-group
+    `azimuth_fm_rate`
+    :param reramp: if True, the ramp is restored instead of removed
+    """
+    burst, burst_time, slant_range_time, kernel_kwargs = tops_ramp_kernel_arguments(
+        measurement, orbit, dc_estimate, azimuth_fm_rate
     )
-    x = ground_range
-    slant_range = (grsrCoefficients * x**grsrCoefficients.degree).sum("degree")
-    return 2 / SPEED_OF_LIGHT * slant_range  # type: ignore
+    # the kernel expects the dimensions in line, pixel order
+    dims = measurement.dims
+    deramped: xr.DataArray = xr.apply_ufunc(
+        tops_ramp_kernel,
+        measurement.transpose(burst.dims[0], slant_range_time.dims[0]),
+        burst,
+        burst_time,
+        slant_range_time,
+        kwargs={**kernel_kwargs, "reramp": reramp},
+        dask="parallelized",
+        output_dtypes=[np.complex64],
+    ).transpose(*dims)
+    deramped.attrs.update(measurement.attrs)
+    return deramped
 
 
 METADATA_OPENERS = {
@@ -1161,6 +2633,13 @@ METADATA_OPENERS = {
     "antenna_pattern": open_antenna_pattern,
 }
 
+# the metadata groups whose large vector variables can be decoded on first access
+LAZY_METADATA_OPENERS = {
+    "calibration": open_calibration_dataset,
+    "noise_range": open_noise_range_dataset,
+    "antenna_pattern": open_antenna_pattern,
+}
+
 
 def do_override_product_files(
     template: str, product_files: dict[str, tuple[str, str, str, str, str]]
@@ -1175,22 +2654,14 @@ def do_override_product_files(
     return overridden_product_files
 
 
-def open_sentinel1_dataset(
+def open_product_groups(
     product_urlpath: esa_safe.PathType,
-    *,
-    drop_variables: tuple[str] | None = None,
-    group: str | None = None,
     fs: fsspec.AbstractFileSystem | None = None,
     storage_options: dict[str, Any] | None = None,
     check_files_exist: bool = False,
     override_product_files: str | None = None,
-    parse_geospatial_attrs: bool = True,
-    parse_eopf_metadata: bool = False,
-    rasterio_chunks: dict[str, int] | None = None,
-) -> xr.Dataset:
-    if drop_variables is not None:
-        warnings.warn("'drop_variables' is currently ignored")
-
+) -> tuple[fsspec.AbstractFileSystem, str, dict[str, Any], dict[str, list[str]]]:
+    """Return the filesystem, the manifest path, the attributes and the groups of a product."""
     fs, manifest_path = get_fs_path(product_urlpath, fs, storage_options)
     product_path = os.path.dirname(manifest_path)
 
@@ -1207,15 +2678,43 @@ def open_sentinel1_dataset(
         check_files_exist=check_files_exist,
         fs=fs,
     )
+    return fs, manifest_path, common_attrs, groups
 
-    group, burst_index = normalise_group(group)
-    absgroup = f"/{group}"
+
+def check_group(group: str, groups: dict[str, list[str]]) -> None:
     if group != "" and group not in groups:
         raise ValueError(
             f"Invalid group {group!r}, please select one of the following groups:"
             f"\n{list(groups.keys())}"
         )
 
+
+def open_sentinel1_dataset(
+    product_urlpath: esa_safe.PathType,
+    *,
+    drop_variables: tuple[str] | None = None,
+    group: str | None = None,
+    fs: fsspec.AbstractFileSystem | None = None,
+    storage_options: dict[str, Any] | None = None,
+    check_files_exist: bool = False,
+    override_product_files: str | None = None,
+    parse_geospatial_attrs: bool = True,
+    parse_eopf_metadata: bool = False,
+    rasterio_chunks: dict[str, int] | str | None = None,
+    lazy_metadata: bool = False,
+    lazy_coords: bool = False,
+) -> xr.Dataset:
+    if drop_variables is not None:
+        warnings.warn("'drop_variables' is currently ignored")
+
+    fs, manifest_path, common_attrs, groups = open_product_groups(
+        product_urlpath, fs, storage_options, check_files_exist, override_product_files
+    )
+
+    group, burst_index = normalise_group(group)
+    absgroup = f"/{group}"
+    check_group(group, groups)
+
     metadata = ""
 
     ds = xr.Dataset(attrs=common_attrs)
@@ -1239,6 +2738,7 @@ def open_sentinel1_dataset(
                     attrs=common_attrs,
                     gcp=gcp,
                     rasterio_chunks=rasterio_chunks,
+                    lazy_coords=lazy_coords,
                 )
                 if parse_eopf_metadata:
                     ds.attrs["other_metadata"] = eopf_metadata.build_other_metadata(
@@ -1249,8 +2749,13 @@ def open_sentinel1_dataset(
                     )
         elif group.count("/") == 2:
             _, _, metadata = group.split("/", 2)
-            with fs.open(groups[group][0]) as file:
-                ds = METADATA_OPENERS[metadata](file, attrs=common_attrs)
+            if lazy_metadata and metadata in LAZY_METADATA_OPENERS:
+                ds = LAZY_METADATA_OPENERS[metadata](
+                    groups[group][0], attrs=common_attrs, fs=fs, lazy=True
+                )
+            else:
+                with fs.open(groups[group][0]) as file:
+                    ds = METADATA_OPENERS[metadata](file, attrs=common_attrs)
 
     ds.attrs["group"] = absgroup
     if len(subgroups):
@@ -1264,16 +2769,64 @@ def open_sentinel1_dataset(
     return ds
 
 
+def open_sentinel1_bursts(
+    product_urlpath: esa_safe.PathType,
+    *,
+    group: str,
+    fs: fsspec.AbstractFileSystem | None = None,
+    storage_options: dict[str, Any] | None = None,
+    check_files_exist: bool = False,
+    override_product_files: str | None = None,
+    parse_geospatial_attrs: bool = True,
+    rasterio_chunks: dict[str, int] | str | None = None,
+) -> dict[int, xr.Dataset]:
+    """Open a swath once and return all its bursts indexed by burst index.
+
+    The bursts are the same as the ones opened with the `{group}/{burst_index}`
+    groups, but the product, the annotation and the measurement are opened only
+    once and the footprints of all the bursts are computed together.
+
+    :param group: the swath and polarisation group, for example `IW1/VV`
+    """
+    fs, _, common_attrs, groups = open_product_groups(
+        product_urlpath, fs, storage_options, check_files_exist, override_product_files
+    )
+    group, burst_index = normalise_group(group)
+    check_group(group, groups)
+    if group.count("/") != 1 or burst_index is not None:
+        raise ValueError(f"Invalid group {group!r}, please select a swath group")
+
+    gcp = None
+    with fs.open(groups[group][1]) as annotation:
+        if parse_geospatial_attrs:
+            gcp = open_gcp_dataset(annotation, attrs=common_attrs)
+        ds = open_pol_dataset(
+            groups[group][0],
+            annotation,
+            fs=fs,
+            attrs=common_attrs,
+            gcp=gcp,
+            rasterio_chunks=rasterio_chunks,
+        )
+    ds.attrs["group"] = f"/{group}"
+    conventions.update_attributes(ds)
+
+    return {burst.attrs["burst_index"]: burst for burst in iter_bursts(ds, gcp=gcp)}
+
+
 def make_sentinel1_stac_item(
     item_id: str,
     manifest_path: esa_safe.PathOrFileType,
     annotation: esa_safe.PathOrFileType,
     namespaces: dict[str, str] = esa_safe.SENTINEL1_NAMESPACES,
 ) -> dict[str, Any]:
-    manifest = ElementTree.parse(manifest_path).getroot()
+    manifest = esa_safe.parse_xml(manifest_path).getroot()
 
-    product_information = esa_safe.parse_tag(annotation, "//productInformation")
-    image_information = esa_safe.parse_tag(annotation, "//imageInformation")
+    tags = esa_safe.parse_tags(
+        annotation, ["//productInformation", "//imageInformation"]
+    )
+    product_information = tags["//productInformation"]
+    image_information = tags["//imageInformation"]
 
     coordinates = [
         [float(v) for v in token.split(",")]
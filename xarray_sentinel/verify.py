@@ -0,0 +1,106 @@
+import concurrent.futures
+import hashlib
+import posixpath
+import time
+from typing import Any
+
+import fsspec
+
+from . import esa_safe
+
+DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def md5_checksum(
+    path: str,
+    fs: fsspec.AbstractFileSystem,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> tuple[str, int]:
+    """Return the hexadecimal MD5 checksum and the size of a file.
+
+    The file is streamed in blocks of `block_size` bytes into a reusable buffer.
+    """
+    checksum = hashlib.md5(usedforsecurity=False)
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    size = 0
+    with fs.open(path, mode="rb", block_size=block_size) as file:
+        while nbytes := file.readinto(buffer):
+            # hashlib releases the GIL on large blocks, so files hash concurrently
+            checksum.update(view[:nbytes])
+            size += nbytes
+    return checksum.hexdigest(), size
+
+
+def check_file(
+    path: str,
+    expected_size: int,
+    expected_md5: str,
+    fs: fsspec.AbstractFileSystem,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> tuple[str, int]:
+    """Return the status of a file ("ok", "missing", "size" or "md5") and its size."""
+    try:
+        md5, size = md5_checksum(path, fs, block_size)
+    except FileNotFoundError:
+        return "missing", 0
+    if size != expected_size:
+        return "size", size
+    if md5 != expected_md5:
+        return "md5", size
+    return "ok", size
+
+
+def verify_sentinel1_product(
+    product_urlpath: esa_safe.PathType,
+    *,
+    fs: fsspec.AbstractFileSystem | None = None,
+    storage_options: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> dict[str, Any]:
+    """Check the size and the MD5 checksum of the product files against the manifest.
+
+    Files are streamed concurrently in a pool of `max_workers` threads.
+
+    :param product_urlpath: path or URL of the SAFE folder or of its manifest
+    :param fs: the fsspec filesystem of the product
+    :param storage_options: options to build the fsspec filesystem
+    :param max_workers: number of threads, see `concurrent.futures.ThreadPoolExecutor`
+    :param block_size: size in bytes of the blocks read from the files
+    :return: a report with the status of each file, see `check_file`, the status
+        of the files that are not "ok", the total number of bytes read, the elapsed
+        time in seconds and the throughput in bytes per second
+    """
+    fs, manifest_path = esa_safe.get_fs_path(product_urlpath, fs, storage_options)
+    # fsspec paths are always POSIX paths, whatever the platform
+    product_path = posixpath.dirname(manifest_path)
+
+    with fs.open(manifest_path) as file:
+        checksums = esa_safe.parse_manifest_checksums(file)
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            href: executor.submit(
+                check_file,
+                posixpath.join(product_path, posixpath.normpath(href)),
+                expected_size,
+                expected_md5,
+                fs,
+                block_size,
+            )
+            for href, (expected_size, expected_md5) in checksums.items()
+        }
+        results = {href: future.result() for href, future in futures.items()}
+    elapsed = time.perf_counter() - start
+
+    files = {href: status for href, (status, _) in results.items()}
+    nbytes = sum(size for _, size in results.values())
+    return {
+        "files": files,
+        "failed": {href: status for href, status in files.items() if status != "ok"},
+        "nbytes": nbytes,
+        "elapsed": elapsed,
+        "throughput": nbytes / elapsed if elapsed > 0 else 0.0,
+    }
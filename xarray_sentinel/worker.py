@@ -0,0 +1,20 @@
+from typing import Any
+
+import distributed
+
+from . import esa_safe
+
+
+class WarmSchemasPlugin(distributed.WorkerPlugin):
+    """Load the compiled Sentinel-1 schemas as soon as a dask worker starts.
+
+    Register it with `client.register_plugin(WarmSchemasPlugin())`.
+    """
+
+    name = "xarray-sentinel-warm-schemas"
+
+    def __init__(self, schema_types: list[str] | None = None) -> None:
+        self.schema_types = schema_types
+
+    def setup(self, worker: Any) -> None:
+        esa_safe.warm_sentinel1_schemas(self.schema_types)
@@ -1,10 +1,12 @@
+from __future__ import annotations
+
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import fsspec
 import xarray as xr
 
-from . import sentinel1
+if TYPE_CHECKING:
+    import fsspec
 
 
 class Sentinel1Backend(xr.backends.common.BackendEntrypoint):
@@ -18,8 +20,13 @@ class Sentinel1Backend(xr.backends.common.BackendEntrypoint):
         fs: fsspec.AbstractFileSystem | None = None,
         check_files_exist: bool = False,
         parse_geospatial_attrs: bool = True,
-        rasterio_chunks: dict[str, int] | None = None,
+        rasterio_chunks: dict[str, int] | str | None = None,
+        lazy_metadata: bool = True,
+        lazy_coords: bool = False,
     ) -> xr.Dataset:
+        # deferred import, backend discovery must not load GDAL and xmlschema
+        from . import sentinel1
+
         ds = sentinel1.open_sentinel1_dataset(
             filename_or_obj,
             drop_variables=drop_variables,
@@ -30,6 +37,8 @@ class Sentinel1Backend(xr.backends.common.BackendEntrypoint):
             check_files_exist=check_files_exist,
             parse_geospatial_attrs=parse_geospatial_attrs,
             rasterio_chunks=rasterio_chunks,
+            lazy_metadata=lazy_metadata,
+            lazy_coords=lazy_coords,
         )
         return ds
 